@@ -0,0 +1,36 @@
+"""Make exercise_progress unique per client and exercise
+
+Revision ID: add_exercise_progress_unique
+Revises: add_sync_operations
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'add_exercise_progress_unique'
+down_revision = 'add_sync_operations'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Keep the newest row of any duplicates; scripts/rebuild_exercise_progress.py
+    # recomputes every row from the workout history afterwards
+    op.execute(
+        """
+        DELETE FROM exercise_progress
+        WHERE id NOT IN (
+            SELECT max(id) FROM exercise_progress GROUP BY client_id, exercise_id
+        )
+        """
+    )
+    op.create_unique_constraint(
+        'uq_exercise_progress_client_exercise',
+        'exercise_progress',
+        ['client_id', 'exercise_id']
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_exercise_progress_client_exercise', 'exercise_progress', type_='unique')
@@ -0,0 +1,35 @@
+"""Add full-text search vector to exercises
+
+Revision ID: add_exercise_search
+Revises: add_refresh_tokens
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'add_exercise_search'
+down_revision = 'add_refresh_tokens'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Generated column: PostgreSQL keeps it current on every insert/update
+    op.execute(
+        "ALTER TABLE exercises ADD COLUMN IF NOT EXISTS search_vector tsvector "
+        "GENERATED ALWAYS AS ("
+        "setweight(to_tsvector('english', coalesce(name, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(short_name, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(description, '')), 'B')"
+        ") STORED"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_exercises_search_vector "
+        "ON exercises USING gin (search_vector)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_exercises_search_vector")
+    op.execute("ALTER TABLE exercises DROP COLUMN IF EXISTS search_vector")
@@ -0,0 +1,161 @@
+"""Add accent-insensitive normalized search columns
+
+Revision ID: add_normalized_search_columns
+Revises: add_exercise_search
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+import re
+import unicodedata
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'add_normalized_search_columns'
+down_revision = 'add_exercise_search'
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 1000
+
+# table -> (primary key, [(source column, shadow column type)])
+NORMALIZED_COLUMNS = {
+    'exercises': ('id', [
+        ('name', sa.String(255)),
+        ('short_name', sa.String(50)),
+        ('description', sa.String()),
+    ]),
+    'users': ('id', [('name', sa.String(255))]),
+    'classification_types': ('id', [
+        ('name', sa.String(100)),
+        ('description', sa.Text()),
+    ]),
+    'classification_values': ('id', [
+        ('value', sa.String(100)),
+        ('description', sa.Text()),
+    ]),
+}
+
+# (index, table, column)
+TRIGRAM_INDEXES = [
+    ('ix_exercises_name_trgm', 'exercises', 'name_normalized'),
+    ('ix_exercises_short_name_trgm', 'exercises', 'short_name_normalized'),
+    ('ix_users_name_trgm', 'users', 'name_normalized'),
+    ('ix_users_email_trgm', 'users', 'email'),
+    ('ix_classification_types_name_trgm', 'classification_types', 'name_normalized'),
+    ('ix_classification_types_description_trgm', 'classification_types', 'description_normalized'),
+    ('ix_classification_values_value_trgm', 'classification_values', 'value_normalized'),
+    ('ix_classification_values_description_trgm', 'classification_values', 'description_normalized'),
+]
+
+
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+def _normalize_text(value):
+    """
+    Frozen copy of src.utils.text.normalize_text as of this revision, so
+    replaying it later yields the same data whatever the app code becomes
+    """
+    if not value:
+        return ""
+    if not value.isascii():
+        decomposed = unicodedata.normalize("NFKD", value)
+        value = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return _NON_WORD.sub(" ", value.casefold()).strip()
+
+
+def _backfill(table_name: str, pk: str, sources: list[str]) -> None:
+    """Fill the shadow columns with the normalized text of their sources"""
+    bind = op.get_bind()
+    table = sa.table(
+        table_name,
+        sa.column(pk),
+        *(sa.column(name) for name in sources),
+        *(sa.column(f"{name}_normalized") for name in sources)
+    )
+    update = (
+        table.update()
+        .where(table.c[pk] == sa.bindparam('_pk'))
+        .values({f"{name}_normalized": sa.bindparam(f"_{name}") for name in sources})
+    )
+    last = None
+    while True:
+        query = sa.select(table.c[pk], *(table.c[name] for name in sources)).order_by(table.c[pk])
+        if last is not None:
+            query = query.where(table.c[pk] > last)
+        rows = bind.execute(query.limit(BATCH_SIZE)).all()
+        if not rows:
+            break
+        bind.execute(update, [
+            {
+                '_pk': row[0],
+                **{
+                    f"_{name}": _normalize_text(value) if value is not None else None
+                    for name, value in zip(sources, row[1:], strict=True)
+                },
+            }
+            for row in rows
+        ])
+        last = rows[-1][0]
+
+
+def upgrade() -> None:
+    for table_name, (pk, columns) in NORMALIZED_COLUMNS.items():
+        for name, type_ in columns:
+            op.add_column(table_name, sa.Column(f"{name}_normalized", type_, nullable=True))
+        _backfill(table_name, pk, [name for name, _ in columns])
+
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for index, table_name, column in TRIGRAM_INDEXES:
+        op.create_index(
+            index, table_name, [column],
+            postgresql_using='gin',
+            postgresql_ops={column: 'gin_trgm_ops'}
+        )
+
+    # Rebuild the search vector from the normalized columns so full-text
+    # search ignores accents too
+    op.execute("DROP INDEX IF EXISTS ix_exercises_search_vector")
+    op.execute("ALTER TABLE exercises DROP COLUMN IF EXISTS search_vector")
+    op.execute(
+        "ALTER TABLE exercises ADD COLUMN search_vector tsvector "
+        "GENERATED ALWAYS AS ("
+        "setweight(to_tsvector('english', coalesce(name_normalized, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(short_name_normalized, '')), 'A') "
+        "|| setweight(to_tsvector('english', coalesce(description_normalized, '')), "
+        "'B')) STORED"
+    )
+    op.execute(
+        "CREATE INDEX ix_exercises_search_vector "
+        "ON exercises USING gin (search_vector)"
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS ix_exercises_search_vector")
+        op.execute("ALTER TABLE exercises DROP COLUMN IF EXISTS search_vector")
+        op.execute(
+            "ALTER TABLE exercises ADD COLUMN search_vector tsvector "
+            "GENERATED ALWAYS AS ("
+            "setweight(to_tsvector('english', coalesce(name, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(short_name, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(description, '')), 'B')"
+            ") STORED"
+        )
+        op.execute(
+            "CREATE INDEX ix_exercises_search_vector "
+            "ON exercises USING gin (search_vector)"
+        )
+        for index, table_name, _ in TRIGRAM_INDEXES:
+            op.drop_index(index, table_name=table_name)
+
+    for table_name, (_, columns) in NORMALIZED_COLUMNS.items():
+        for name, _ in columns:
+            op.drop_column(table_name, f"{name}_normalized")
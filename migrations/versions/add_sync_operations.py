@@ -0,0 +1,42 @@
+"""Add sync_operations table for idempotent offline sync
+
+Revision ID: add_sync_operations
+Revises: add_normalized_search_columns
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'add_sync_operations'
+down_revision = 'add_normalized_search_columns'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'sync_operations',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.UUID(), nullable=False),
+        sa.Column('idempotency_key', sa.String(length=64), nullable=False),
+        sa.Column('operation', sa.String(length=30), nullable=False),
+        sa.Column('status', sa.Integer(), nullable=True),
+        sa.Column('response', sa.JSON(), nullable=True),
+        sa.Column('created_at', sa.TIMESTAMP(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('user_id', 'idempotency_key', name='uq_sync_operations_user_key')
+    )
+    op.create_index(op.f('ix_sync_operations_id'), 'sync_operations', ['id'], unique=False)
+    op.create_index(op.f('ix_sync_operations_user_id'), 'sync_operations', ['user_id'], unique=False)
+    op.create_index(op.f('ix_sync_operations_created_at'), 'sync_operations', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_sync_operations_created_at'), table_name='sync_operations')
+    op.drop_index(op.f('ix_sync_operations_user_id'), table_name='sync_operations')
+    op.drop_index(op.f('ix_sync_operations_id'), table_name='sync_operations')
+    op.drop_table('sync_operations')
@@ -0,0 +1,35 @@
+"""Add weekly_volumes rollup table
+
+Revision ID: add_weekly_volumes
+Revises: add_workout_exercise_numeric_columns
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'add_weekly_volumes'
+down_revision = 'add_workout_exercise_numeric_columns'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'weekly_volumes',
+        sa.Column('client_id', sa.UUID(), nullable=False),
+        sa.Column('week_start', sa.Date(), nullable=False),
+        sa.Column('muscle_group_id', sa.Integer(), nullable=False),
+        sa.Column('sets', sa.Integer(), nullable=False),
+        sa.Column('reps', sa.Integer(), nullable=False),
+        sa.Column('tonnage_kg', sa.Float(), nullable=False),
+        sa.ForeignKeyConstraint(['client_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('client_id', 'week_start', 'muscle_group_id')
+    )
+    # Filled by: python -m scripts.rebuild_weekly_volumes
+
+
+def downgrade() -> None:
+    op.drop_table('weekly_volumes')
@@ -0,0 +1,161 @@
+"""Add typed numeric copies of workout exercise quantities
+
+Revision ID: add_workout_exercise_numeric_columns
+Revises: add_exercise_progress_unique
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+import re
+from functools import lru_cache
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'add_workout_exercise_numeric_columns'
+down_revision = 'add_exercise_progress_unique'
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 5000
+
+COLUMNS = [
+    ('weight_planned_kg', sa.Float()),
+    ('weight_used_kg', sa.Float()),
+    ('rest_between_sets_seconds', sa.Integer()),
+    ('time_spent_seconds', sa.Integer()),
+    ('reps_done_total', sa.Integer()),
+]
+
+
+# Frozen copies of the parsers in src/utils/units.py as of this revision,
+# so replaying it later yields the same data whatever the app code becomes
+KG_PER_LB = 0.45359237
+_WEIGHT = re.compile(
+    r"^(?P<amount>\d+(?:[.,]\d+)?)\s*(?P<unit>kgs?|kilos?|lbs?|libras?)?$"
+)
+_CLOCK = re.compile(r"^(?:(?P<hours>\d+):)?(?P<minutes>\d{1,2}):(?P<seconds>\d{2})$")
+_DURATION_PART = re.compile(r"(?P<amount>\d+(?:[.,]\d+)?)\s*(?P<unit>[a-z]+)?\s*")
+_SECONDS_PER_UNIT = {
+    **dict.fromkeys(('h', 'hr', 'hrs', 'hora', 'horas'), 3600),
+    **dict.fromkeys(('m', 'min', 'mins', 'minuto', 'minutos'), 60),
+    **dict.fromkeys(('s', 'sec', 'secs', 'seg', 'segs', 'segundo', 'segundos'), 1),
+}
+
+
+def _parse_weight_kg(value):
+    if not value:
+        return None
+    match = _WEIGHT.match(value.strip().casefold())
+    if match is None:
+        return None
+    amount = float(match['amount'].replace(',', '.'))
+    if (match['unit'] or 'kg').startswith(('lb', 'libra')):
+        amount *= KG_PER_LB
+    return amount
+
+
+def _parse_duration_seconds(value):
+    if not value:
+        return None
+    text = value.strip().casefold()
+    clock = _CLOCK.match(text)
+    if clock is not None:
+        hours = int(clock['hours'] or 0)
+        return hours * 3600 + int(clock['minutes']) * 60 + int(clock['seconds'])
+
+    seconds = 0.0
+    position = 0
+    parts = 0
+    while position < len(text):
+        part = _DURATION_PART.match(text, position)
+        if part is None:
+            return None
+        unit = part['unit']
+        if unit is not None and unit not in _SECONDS_PER_UNIT:
+            return None
+        seconds += float(part['amount'].replace(',', '.')) * _SECONDS_PER_UNIT.get(unit, 1)
+        position = part.end()
+        parts += 1
+        if unit is None and (parts > 1 or position < len(text)):
+            return None
+    return round(seconds) if parts else None
+
+
+def _total_reps(reps_done):
+    if not reps_done:
+        return None
+    return sum(reps for reps in reps_done if isinstance(reps, int))
+
+
+# column: (source column, parser)
+PARSED_COLUMNS = {
+    'weight_planned_kg': ('weight_planned', _parse_weight_kg),
+    'weight_used_kg': ('weight_used', _parse_weight_kg),
+    'rest_between_sets_seconds': ('rest_between_sets', _parse_duration_seconds),
+    'time_spent_seconds': ('time_spent', _parse_duration_seconds),
+    'reps_done_total': ('reps_done', _total_reps),
+}
+
+
+def _backfill() -> None:
+    """
+    Parse every row in keyset batches.
+
+    The free text repeats heavily ("60kg", "90s", ...), so each distinct
+    string is parsed once and the rest are cache hits.
+    """
+    bind = op.get_bind()
+    parsers = {
+        column: (source, lru_cache(maxsize=None)(parser))
+        for column, (source, parser) in PARSED_COLUMNS.items()
+        if source != 'reps_done'  # JSON lists are not hashable
+    }
+    sources = [source for source, _ in PARSED_COLUMNS.values()]
+    table = sa.table(
+        'workout_exercises',
+        sa.column('id'),
+        *(sa.column(source) for source in sources if source != 'reps_done'),
+        sa.column('reps_done', sa.JSON()),
+        *(sa.column(column) for column in PARSED_COLUMNS)
+    )
+    update = (
+        table.update()
+        .where(table.c.id == sa.bindparam('_id'))
+        .values({column: sa.bindparam(f"_{column}") for column in PARSED_COLUMNS})
+    )
+    reps_parser = PARSED_COLUMNS['reps_done_total'][1]
+    last = 0
+    while True:
+        rows = bind.execute(
+            sa.select(table.c.id, *(table.c[source] for source in sources))
+            .where(table.c.id > last)
+            .order_by(table.c.id)
+            .limit(BATCH_SIZE)
+        ).mappings().all()
+        if not rows:
+            break
+        bind.execute(update, [
+            {
+                '_id': row['id'],
+                **{
+                    f"_{column}": parser(row[source])
+                    for column, (source, parser) in parsers.items()
+                },
+                '_reps_done_total': reps_parser(row['reps_done']),
+            }
+            for row in rows
+        ])
+        last = rows[-1]['id']
+
+
+def upgrade() -> None:
+    for name, type_ in COLUMNS:
+        op.add_column('workout_exercises', sa.Column(name, type_, nullable=True))
+    _backfill()
+
+
+def downgrade() -> None:
+    for name, _ in reversed(COLUMNS):
+        op.drop_column('workout_exercises', name)
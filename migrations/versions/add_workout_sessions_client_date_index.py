@@ -0,0 +1,29 @@
+"""Add (client_id, date) index on workout_sessions
+
+Revision ID: add_workout_sessions_client_date_index
+Revises: add_weekly_volumes
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'add_workout_sessions_client_date_index'
+down_revision = 'add_weekly_volumes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Serves per-client date ranges: the coach dashboard, calendars and
+    # weekly volume refreshes
+    op.create_index(
+        'ix_workout_sessions_client_id_date',
+        'workout_sessions',
+        ['client_id', 'date'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_workout_sessions_client_id_date', table_name='workout_sessions')
@@ -0,0 +1,33 @@
+# scripts/rebuild_exercise_progress.py
+"""
+Rebuild exercise_progress (best and latest load per client and exercise)
+from the workout history.
+
+Progress is maintained incrementally as sets are logged and sessions
+completed; run this once after deploying it, and whenever logged weights
+were corrected downwards.
+
+    python -m scripts.rebuild_exercise_progress [--chunk-size N]
+"""
+
+import argparse
+
+from src.core.database import SessionLocal
+from src.crud.plan import exercise_progress
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        rows = exercise_progress(db).rebuild(chunk_size=args.chunk_size)
+    finally:
+        db.close()
+    print(f"Rebuilt {rows} exercise progress rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+# scripts/rebuild_weekly_volumes.py
+"""
+Rebuild weekly_volumes from the workout history.
+
+The table holds training volume per client, ISO week and muscle group.
+Weeks are recomputed as their sessions change; run this once after
+deploying, or after changing exercises' muscle groups.
+
+    python -m scripts.rebuild_weekly_volumes
+"""
+
+import argparse
+
+from src.core.database import SessionLocal
+from src.crud.plan import weekly_volume
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        rows = weekly_volume(db).rebuild()
+    finally:
+        db.close()
+    print(f"Rebuilt {rows} weekly volume rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Conditional GET helpers (ETag / If-None-Match, Last-Modified).
+
+Handlers compute a validator for the data they are about to return, ask
+``is_not_modified`` whether the client already holds it, and answer with
+``not_modified`` (an empty 304) if so; otherwise they attach the validator
+to the real response with ``set_validators``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Request, Response, status
+
+
+def weak_etag(*parts: object) -> str:
+    """Weak ETag over the parts that determine a representation"""
+    digest = hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()[:32]
+    return f'W/"{digest}"'
+
+
+def _etag_values(header: str) -> list[str]:
+    return [value.strip() for value in header.split(",") if value.strip()]
+
+
+def _weak_equal(a: str, b: str) -> bool:
+    # RFC 9110 weak comparison: W/ prefixes are ignored for If-None-Match
+    return a.removeprefix("W/") == b.removeprefix("W/")
+
+
+def is_not_modified(
+    request: Request, etag: str, last_modified: datetime | None = None
+) -> bool:
+    """True if the request's validators show the client copy is current"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        values = _etag_values(if_none_match)
+        return "*" in values or any(_weak_equal(value, etag) for value in values)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=UTC)
+        if last_modified.tzinfo is None:
+            last_modified = last_modified.replace(tzinfo=UTC)
+        return last_modified.replace(microsecond=0) <= since
+    return False
+
+
+def set_validators(
+    response: Response,
+    etag: str,
+    last_modified: datetime | None = None,
+    cache_control: str = "no-cache",
+) -> None:
+    """Attach ETag (and Last-Modified) so clients can revalidate"""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = cache_control
+    if last_modified is not None:
+        response.headers["Last-Modified"] = format_http_date(last_modified)
+
+
+def format_http_date(value: datetime) -> str:
+    """Format a UTC datetime (naive values are taken as UTC) as an HTTP date"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    value = value.astimezone(UTC).replace(microsecond=0)
+    return format_datetime(value, usegmt=True)
+
+
+def not_modified(
+    etag: str, last_modified: datetime | None = None, cache_control: str = "no-cache"
+) -> Response:
+    """Empty 304 carrying the current validators"""
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_validators(response, etag, last_modified, cache_control)
+    return response
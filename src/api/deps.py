@@ -6,6 +6,7 @@ from jose import JWTError
 from sqlalchemy.orm import Session
 
 from src.core.database import get_db
+from src.core.revocation import revocation_list
 from src.core.security import verify_token
 from src.crud.user import user
 from src.models.user import User
@@ -34,6 +35,12 @@ def get_current_user(
         if user_id is None:
             raise credentials_exception
 
+        # In-memory check, revocations are synced in the background
+        if payload.get("type", "access") != "access" or revocation_list.is_revoked(
+            payload.get("jti")
+        ):
+            raise credentials_exception
+
         user_obj = user.get(db, id=UUID(user_id))
         if user_obj is None:
             raise credentials_exception
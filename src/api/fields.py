@@ -0,0 +1,107 @@
+"""
+Sparse fieldsets for list endpoints.
+
+``?fields=id,name`` selects columns and ``?include=category`` selects
+relationships. Without either parameter endpoints return their full
+schema; with one, only what was asked for (plus ``id``) is loaded and
+serialized through a projection of the response schema.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+from fastapi import HTTPException, status
+from pydantic import BaseModel, ConfigDict, create_model
+
+
+@dataclass(frozen=True)
+class FieldSelection:
+    columns: tuple[str, ...] | None = None
+    relations: tuple[str, ...] | None = None
+
+    @property
+    def sparse(self) -> bool:
+        return self.columns is not None or self.relations is not None
+
+    def schema_fields(self, all_columns: Iterable[str]) -> tuple[str, ...]:
+        columns = self.columns if self.columns is not None else tuple(all_columns)
+        return (*columns, *(self.relations or ()))
+
+    def schema(
+        self, schema: type[BaseModel], all_columns: Iterable[str]
+    ) -> type[BaseModel]:
+        """Response schema for the selection (``schema`` itself if not sparse)"""
+        if not self.sparse:
+            return schema
+        return projected_schema(schema, self.schema_fields(all_columns))
+
+    def selected_relations(self, all_relations: Iterable[str]) -> tuple[str, ...]:
+        """Relations to return: all of them unless the selection is sparse"""
+        if not self.sparse:
+            return tuple(all_relations)
+        return self.relations or ()
+
+    def load_kwargs(self) -> dict[str, Any]:
+        """``columns``/``relations`` arguments for the CRUD list methods"""
+        if not self.sparse:
+            return {}
+        return {"columns": self.columns, "relations": self.relations or ()}
+
+
+def _parse(value: str | None, allowed: Iterable[str], param: str) -> list[str] | None:
+    if value is None:
+        return None
+    names = list(dict.fromkeys(n.strip() for n in value.split(",") if n.strip()))
+    unknown = sorted(set(names) - set(allowed))
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown {param}: {', '.join(unknown)}",
+        )
+    return names
+
+
+def select_fields(
+    fields: str | None,
+    include: str | None,
+    *,
+    columns: Iterable[str],
+    relations: Iterable[str],
+) -> FieldSelection:
+    """Validate ``fields``/``include`` query values against what a list exposes"""
+    selected_columns = _parse(fields, columns, "fields")
+    selected_relations = _parse(include, relations, "include")
+    if selected_columns is not None and "id" not in selected_columns:
+        selected_columns.insert(0, "id")
+    return FieldSelection(
+        columns=tuple(selected_columns) if selected_columns is not None else None,
+        relations=(
+            tuple(selected_relations) if selected_relations is not None else None
+        ),
+    )
+
+
+@lru_cache(maxsize=256)
+def projected_schema(
+    schema: type[BaseModel], names: tuple[str, ...]
+) -> type[BaseModel]:
+    """``schema`` reduced to ``names``, built once per combination"""
+    definitions = {
+        name: (schema.model_fields[name].annotation, schema.model_fields[name])
+        for name in names
+    }
+    return create_model(
+        f"{schema.__name__}Fields",
+        __config__=ConfigDict(from_attributes=True),
+        **definitions,
+    )
+
+
+def column_names(schema: type[BaseModel], relations: Iterable[str]) -> tuple[str, ...]:
+    """Scalar fields of a response schema, i.e. everything but ``relations``"""
+    excluded = set(relations)
+    return tuple(name for name in schema.model_fields if name not in excluded)
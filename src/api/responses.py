@@ -0,0 +1,80 @@
+"""
+Fast serialization for SuccessResponse payloads.
+
+Endpoints that declare ``response_model=SuccessResponse`` but return the
+result of ``success_response`` skip FastAPI's second validation pass and
+``jsonable_encoder``: each payload is validated once, straight from ORM
+attributes, by a ``TypeAdapter`` cached per schema, and the envelope is
+encoded with orjson. The declared response_model still documents the
+endpoint in OpenAPI.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from datetime import datetime
+from functools import cache
+from typing import Any
+
+from fastapi import Request, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, TypeAdapter
+
+from src.api.conditional import is_not_modified, not_modified, set_validators
+
+
+@cache
+def get_adapter(schema: Any) -> TypeAdapter:
+    """TypeAdapter for ``schema``, built once per schema"""
+    return TypeAdapter(schema)
+
+
+def serialize(schema: type[BaseModel], value: Any) -> Any:
+    """
+    Validate an ORM object (or a list of them) against ``schema`` and
+    return JSON-ready data.
+    """
+    if isinstance(value, list | tuple):
+        adapter = get_adapter(list[schema])
+    else:
+        adapter = get_adapter(schema)
+    validated = adapter.validate_python(value, from_attributes=True)
+    return adapter.dump_python(validated, mode="json")
+
+
+def success_response(
+    message: str,
+    data: Any = None,
+    *,
+    status_code: int = 200,
+    headers: Mapping[str, str] | None = None,
+) -> ORJSONResponse:
+    """SuccessResponse envelope, encoded with orjson"""
+    return ORJSONResponse(
+        {"message": message, "data": data, "status": "success"},
+        status_code=status_code,
+        headers=headers,
+    )
+
+
+def cache_entry(
+    body: Any, etag: str, last_modified: datetime | None = None
+) -> dict[str, Any]:
+    """Serialized body plus validators, as stored in the shared cache"""
+    return {
+        "body": body,
+        "etag": etag,
+        "last_modified": last_modified.isoformat() if last_modified else None,
+    }
+
+
+def cached_json_response(request: Request, entry: dict[str, Any]) -> Response:
+    """Answer from a ``cache_entry``: 304 if the client is current, else the body"""
+    last_modified = entry.get("last_modified")
+    if last_modified:
+        last_modified = datetime.fromisoformat(last_modified)
+    if is_not_modified(request, entry["etag"], last_modified):
+        return not_modified(entry["etag"], last_modified)
+    response = ORJSONResponse(entry["body"])
+    set_validators(response, entry["etag"], last_modified)
+    return response
@@ -1,19 +1,57 @@
-from datetime import datetime, timedelta
+import math
+from datetime import datetime
+from uuid import UUID
 
-from fastapi import APIRouter, Depends, Form, HTTPException, status
+from fastapi import APIRouter, Depends, Form, HTTPException, Request, Response, status
 from sqlalchemy.orm import Session
 
-from src.api.deps import get_current_admin, get_current_user
+from src.api.deps import get_current_admin, get_current_user, oauth2_scheme
 from src.core.config import settings
 from src.core.database import get_db
-from src.core.security import create_access_token
+from src.core.keys import key_ring
+from src.core.rate_limit import login_rate_limiter
+from src.core.security import create_access_token, verify_token
+from src.crud.auth import refresh_tokens
 from src.crud.user import user
-from src.schemas.auth import LoginRequest, LoginResponse, Token
+from src.schemas.auth import (
+    LoginRequest,
+    LoginResponse,
+    LogoutRequest,
+    RefreshRequest,
+    Token,
+)
 from src.schemas.user import User, UserRegister
+from src.services.token_revocation import revoke_access_token
 
 router = APIRouter(tags=["authentication"])
 
 
+def issue_tokens(db: Session, *, user_id: UUID) -> Token:
+    """Create a short-lived access token and a stored refresh token"""
+    raw_refresh_token, _ = refresh_tokens.issue(db, user_id=user_id)
+    return Token(
+        access_token=create_access_token(data={"sub": str(user_id)}),
+        token_type="bearer",
+        refresh_token=raw_refresh_token,
+        expires_in=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+    )
+
+
+def check_login_rate_limit(request: Request, email: str) -> None:
+    """
+    Reject the attempt with 429 when the IP or email bucket is empty.
+    Runs before the user lookup so throttled attempts never reach hashing.
+    """
+    client_ip = request.client.host if request.client else None
+    decision = login_rate_limiter.check(email=email, client_ip=client_ip)
+    if not decision.allowed:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many login attempts. Please try again later.",
+            headers={"Retry-After": str(max(1, math.ceil(decision.retry_after)))},
+        )
+
+
 @router.post("/register", response_model=User, status_code=status.HTTP_201_CREATED)
 async def register(user_in: UserRegister, db: Session = Depends(get_db)):
     """
@@ -55,12 +93,20 @@ async def register_coach(user_in: UserRegister, db: Session = Depends(get_db)):
 
 
 @router.post("/login", response_model=LoginResponse)
-async def login(
-    username: str = Form(...), password: str = Form(...), db: Session = Depends(get_db)
+def login(
+    request: Request,
+    username: str = Form(...),
+    password: str = Form(...),
+    db: Session = Depends(get_db),
 ):
     """
     OAuth2 compatible token login using Form data
+
+    Declared sync so password hashing runs in the threadpool instead of
+    blocking the event loop for every other request.
     """
+    check_login_rate_limit(request, username)
+
     # Convert to our LoginRequest schema
     login_request = LoginRequest(email=username, password=password)
 
@@ -80,22 +126,27 @@ async def login(
             detail="Coach account is pending approval. Please wait for admin approval.",
         )
 
-    # Create access token
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = create_access_token(
-        data={"sub": str(authenticated_user.id), "exp": access_token_expires.total_seconds(), "type": "access"}
-    )
+    # Create access and refresh tokens
+    tokens = issue_tokens(db, user_id=authenticated_user.id)
 
     return LoginResponse(
         user_id=authenticated_user.id,
         email=authenticated_user.email,
         name=authenticated_user.name,
         role_id=authenticated_user.role_id,
-        access_token=access_token,
-        token_type="bearer"
+        **tokens.dict(),
     )
 
 
+@router.get("/jwks.json")
+async def get_jwks(response: Response):
+    """
+    Public keys for verifying access tokens locally (RS256/ES256 only)
+    """
+    response.headers["Cache-Control"] = "public, max-age=300"
+    return key_ring.jwks()
+
+
 @router.get("/me", response_model=User)
 async def read_users_me(current_user: User = Depends(get_current_user)):
     """
@@ -105,16 +156,61 @@ async def read_users_me(current_user: User = Depends(get_current_user)):
 
 
 @router.post("/refresh", response_model=Token)
-async def refresh_token(current_user: User = Depends(get_current_user)):
+def refresh_token(refresh_in: RefreshRequest, db: Session = Depends(get_db)):
     """
-    Refresh access token
+    Exchange a refresh token for a new access token.
+    The refresh token is rotated; presenting a revoked one revokes them all.
     """
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = create_access_token(
-        data={"sub": str(current_user.id)}, expires_delta=access_token_expires
+    invalid_token = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Invalid refresh token",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+    token_obj = refresh_tokens.get_by_token(db, token=refresh_in.refresh_token)
+    if not token_obj:
+        raise invalid_token
+
+    if token_obj.revoked_at is not None:
+        # Reuse of a rotated token: assume it leaked and end every session
+        refresh_tokens.revoke_all_for_user(db, user_id=token_obj.user_id)
+        raise invalid_token
+
+    if token_obj.expires_at <= datetime.utcnow():
+        raise invalid_token
+
+    rotated = refresh_tokens.rotate(db, db_obj=token_obj)
+    if rotated is None:
+        # A concurrent refresh rotated the same token first: also reuse
+        refresh_tokens.revoke_all_for_user(db, user_id=token_obj.user_id)
+        raise invalid_token
+
+    new_refresh_token, _ = rotated
+    return Token(
+        access_token=create_access_token(data={"sub": str(token_obj.user_id)}),
+        token_type="bearer",
+        refresh_token=new_refresh_token,
+        expires_in=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
     )
 
-    return Token(access_token=access_token, token_type="bearer")
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+def logout(
+    logout_in: LogoutRequest | None = None,
+    token: str = Depends(oauth2_scheme),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    Revoke the current access token and, if given, the refresh token
+    """
+    revoke_access_token(db, verify_token(token))
+
+    if logout_in and logout_in.refresh_token:
+        token_obj = refresh_tokens.get_by_token(db, token=logout_in.refresh_token)
+        if token_obj and token_obj.user_id == current_user.id:
+            refresh_tokens.revoke(db, db_obj=token_obj)
+    return None
 
 
 @router.get("/pending-coaches", response_model=list[User])
@@ -129,6 +225,14 @@ async def get_pending_coaches(
     return pending_coaches
 
 
+@router.get("/login-throttle")
+async def get_login_throttle_stats(current_user: User = Depends(get_current_admin)):
+    """
+    Login throttling counters for this worker (Admin only)
+    """
+    return login_rate_limiter.stats()
+
+
 @router.post("/approve-coach/{coach_id}")
 async def approve_coach(
     coach_id: str,
@@ -164,13 +268,16 @@ async def approve_coach(
 
 
 @router.post("/login-json", response_model=LoginResponse)
-async def login_json(
+def login_json(
+    request: Request,
     login_data: LoginRequest,
     db: Session = Depends(get_db)
 ):
     """
     Temporary JSON login endpoint for testing
     """
+    check_login_rate_limit(request, login_data.email)
+
     # Authenticate user
     authenticated_user = user.authenticate(db, login_data=login_data)
 
@@ -187,17 +294,13 @@ async def login_json(
             detail="Coach account is pending approval. Please wait for admin approval.",
         )
 
-    # Create access token
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = create_access_token(
-        data={"sub": str(authenticated_user.id), "exp": access_token_expires.total_seconds(), "type": "access"}
-    )
+    # Create access and refresh tokens
+    tokens = issue_tokens(db, user_id=authenticated_user.id)
 
     return LoginResponse(
         user_id=authenticated_user.id,
         email=authenticated_user.email,
         name=authenticated_user.name,
         role_id=authenticated_user.role_id,
-        access_token=access_token,
-        token_type="bearer"
+        **tokens.dict(),
     )
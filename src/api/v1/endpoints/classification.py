@@ -41,9 +41,9 @@ def get_classification_types(
         applies_to=applies_to
     )
     
-    # Add value count for each type
+    # Counts come with the page; no values are loaded
     result = []
-    for type_obj in types:
+    for type_obj, value_count in types:
         type_dict = {
             "id": type_obj.id,
             "name": type_obj.name,
@@ -52,7 +52,7 @@ def get_classification_types(
             "is_required": type_obj.is_required,
             "created_at": type_obj.created_at,
             "updated_at": type_obj.updated_at,
-            "value_count": len(type_obj.classification_values)
+            "value_count": value_count
         }
         result.append(ClassificationTypeSchema(**type_dict))
     
@@ -88,11 +88,13 @@ def get_classification_type(
     """
     Get classification type by ID with its values.
     """
-    type_obj = classification_type.get(db=db, id=type_id)
+    type_obj = classification_type.get_with_values(db=db, id=type_id)
     if not type_obj:
         raise HTTPException(status_code=404, detail="Classification type not found")
     
-    return type_obj
+    result = ClassificationTypeWithValues.model_validate(type_obj)
+    result.value_count = len(result.classification_values)
+    return result
 
 
 @router.put("/classification-types/{type_id}", response_model=ClassificationTypeSchema)
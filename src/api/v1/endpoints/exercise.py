@@ -1,11 +1,26 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.orm import Session
 
+from src.api.conditional import (
+    is_not_modified,
+    not_modified,
+    set_validators,
+    weak_etag,
+)
 from src.api.deps import get_current_coach
+from src.api.fields import (
+    FieldSelection,
+    column_names,
+    projected_schema,
+    select_fields,
+)
+from src.api.responses import cache_entry, cached_json_response, serialize
+from src.core.cache import cache
 from src.core.database import get_db
 from src.crud.exercise import (
+    EXERCISE_FACETS,
     contraction_type,
     equipment,
     exercise,
@@ -24,11 +39,14 @@ from src.schemas.exercise import (
     EquipmentList,
     EquipmentUpdate,
     Exercise,
+    ExerciseAutocomplete,
     ExerciseCategoriesList,
     ExerciseCategory,
     ExerciseCategoryCreate,
     ExerciseCategoryUpdate,
+    ExerciseCoach,
     ExerciseCreate,
+    ExerciseFacetedList,
     ExerciseList,
     ExerciseUpdate,
     MovementType,
@@ -43,14 +61,155 @@ from src.schemas.exercise import (
     PositionCreate,
     PositionsList,
     PositionUpdate,
+    SimilarExercisesList,
 )
+from src.services.exercise_autocomplete import exercise_autocomplete
+from src.services.exercise_similarity import exercise_similarity
+from src.services.taxonomy_cache import EXERCISE_LOOKUPS, taxonomy_cache
 
 router = APIRouter(tags=["exercises"])
 
+# Safety net only; exercise and taxonomy writes invalidate by tag
+CATALOG_CACHE_TTL = 300
+
+# What ?fields= and ?include= may select on exercise lists
+EXERCISE_RELATIONS = (*EXERCISE_LOOKUPS, "coach")
+EXERCISE_COLUMNS = column_names(Exercise, EXERCISE_RELATIONS)
+
+
+def exercise_load_kwargs(selection: FieldSelection) -> dict:
+    """
+    CRUD arguments for a selection. Lookups are embedded from the taxonomy
+    cache, so only their foreign keys are loaded; the coach is the one
+    relationship read from the database.
+    """
+    relations = selection.selected_relations(EXERCISE_RELATIONS)
+    columns = selection.columns
+    if columns is not None:
+        columns = (*columns, *(f"{name}_id" for name in relations))
+    return {
+        "columns": columns,
+        "relations": ("coach_user",) if "coach" in relations else (),
+    }
+
+
+def serialize_exercises(
+    db: Session, rows: list, selection: FieldSelection = FieldSelection()
+) -> list[dict]:
+    """Exercise payloads with the selected relations embedded"""
+    columns = selection.columns if selection.columns is not None else EXERCISE_COLUMNS
+    data = serialize(projected_schema(Exercise, columns), rows)
+    for name in selection.selected_relations(EXERCISE_RELATIONS):
+        if name == "coach":
+            values = [
+                serialize(ExerciseCoach, row.coach_user) if row.coach_user else None
+                for row in rows
+            ]
+        else:
+            ids = [getattr(row, f"{name}_id") for row in rows]
+            lookup = taxonomy_cache.resolve(db, EXERCISE_LOOKUPS[name], ids)
+            values = [lookup.get(id_) for id_ in ids]
+        for item, value in zip(data, values, strict=True):
+            item[name] = value
+    return data
+
 
 # Exercise endpoints
 @router.get("/", response_model=ExerciseList)
 async def read_exercises(
+    request: Request,
+    db: Session = Depends(get_db),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    coach_id: UUID | None = None,
+    category_id: int | None = None,
+    muscle_group_id: int | None = None,
+    equipment_id: int | None = None,
+    search: str | None = None,
+    fields: str | None = Query(None, description="Comma-separated columns"),
+    include: str | None = Query(None, description="Comma-separated relations"),
+):
+    """
+    Retrieve exercises with optional filters.
+
+    With ``fields`` and/or ``include`` only the selected columns and
+    relations are loaded and returned.
+    """
+    selection = select_fields(
+        fields, include, columns=EXERCISE_COLUMNS, relations=EXERCISE_RELATIONS
+    )
+    if search:
+        filters = {"search": search}
+    else:
+        filters = {
+            "coach_id": coach_id,
+            "category_id": category_id,
+            "muscle_group_id": muscle_group_id,
+            "equipment_id": equipment_id,
+        }
+
+    cache_key = "exercises:list:" + weak_etag(
+        sorted(filters.items()), skip, limit, selection
+    )
+    entry = cache.get(cache_key)
+    if entry is not None:
+        return cached_json_response(request, entry)
+
+    # Decide freshness from an aggregate before loading any rows
+    total, last_updated = exercise.get_list_version(db, **filters)
+    etag = weak_etag(
+        "exercises",
+        sorted(filters.items()),
+        skip,
+        limit,
+        selection,
+        total,
+        last_updated,
+        taxonomy_cache.version(db),
+    )
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+
+    load = exercise_load_kwargs(selection)
+    if search:
+        exercises_list = exercise.search_exercises(
+            db, query=search, skip=skip, limit=limit, **load
+        )
+    else:
+        exercises_list = exercise.get_multi_with_relations(
+            db, skip=skip, limit=limit, **filters, **load
+        )
+
+    body = {
+        "exercises": serialize_exercises(db, exercises_list, selection),
+        "total": total,
+        "page": skip // limit + 1 if limit > 0 else 1,
+        "size": limit,
+    }
+    entry = cache_entry(body, etag)
+    cache.set(cache_key, entry, ttl=CATALOG_CACHE_TTL, tags=("exercises", "taxonomy"))
+    return cached_json_response(request, entry)
+
+
+@router.get("/autocomplete", response_model=ExerciseAutocomplete)
+async def autocomplete_exercises(
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(10, ge=1, le=50),
+    db: Session = Depends(get_db),
+):
+    """
+    Suggest exercises by name or short name as the user types.
+
+    Served from an in-memory index: name prefixes first, then word
+    prefixes, then fuzzy (trigram) matches for typos and infixes.
+    """
+    suggestions = exercise_autocomplete.search(db, q, limit)
+    return ExerciseAutocomplete.model_validate({"suggestions": suggestions})
+
+
+@router.get("/facets", response_model=ExerciseFacetedList)
+async def read_exercise_facets(
+    request: Request,
     db: Session = Depends(get_db),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
@@ -58,48 +217,168 @@ async def read_exercises(
     category_id: int | None = None,
     muscle_group_id: int | None = None,
     equipment_id: int | None = None,
+    position_id: int | None = None,
+    contraction_type_id: int | None = None,
     search: str | None = None,
+    fields: str | None = Query(None, description="Comma-separated columns"),
+    include: str | None = Query(None, description="Comma-separated relations"),
 ):
     """
-    Retrieve exercises with optional filters
+    Filtered exercises plus, for each facet (category, muscle group,
+    equipment, position, contraction type), how many of them have each
+    value. A facet's counts ignore its own filter so the other values stay
+    selectable. Filters combine; results are ranked when searching.
     """
+    selection = select_fields(
+        fields, include, columns=EXERCISE_COLUMNS, relations=EXERCISE_RELATIONS
+    )
+    facets = {
+        "category": category_id,
+        "muscle_group": muscle_group_id,
+        "equipment": equipment_id,
+        "position": position_id,
+        "contraction_type": contraction_type_id,
+    }
+    facet_filters = {f"{name}_id": value for name, value in facets.items()}
+    shared = {"coach_id": coach_id, "search": search}
+    filters = {**shared, **facet_filters}
+
+    cache_key = "exercises:facets:" + weak_etag(
+        sorted(filters.items()), skip, limit, selection
+    )
+    entry = cache.get(cache_key)
+    if entry is not None:
+        return cached_json_response(request, entry)
+
+    total, last_updated = exercise.get_list_version(db, **filters)
+    etag = weak_etag(
+        "exercise-facets",
+        sorted(filters.items()),
+        skip,
+        limit,
+        selection,
+        total,
+        last_updated,
+        taxonomy_cache.version(db),
+    )
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+
+    load = exercise_load_kwargs(selection)
     if search:
         exercises_list = exercise.search_exercises(
-            db, query=search, skip=skip, limit=limit
+            db,
+            query=search,
+            skip=skip,
+            limit=limit,
+            coach_id=coach_id,
+            **facet_filters,
+            **load,
         )
-        total = len(exercises_list)  # Simplified, should count separately
     else:
         exercises_list = exercise.get_multi_with_relations(
             db,
             skip=skip,
             limit=limit,
             coach_id=coach_id,
-            category_id=category_id,
-            muscle_group_id=muscle_group_id,
-            equipment_id=equipment_id,
+            **facet_filters,
+            **load,
         )
-        total = exercise.count(db)
 
-    return ExerciseList(
-        exercises=exercises_list,
-        total=total,
-        page=skip // limit + 1 if limit > 0 else 1,
-        size=limit,
-    )
+    _, counts = exercise.get_facet_counts(db, facets=facets, **shared)
+    facet_values = {}
+    for name in EXERCISE_FACETS:
+        lookup = taxonomy_cache.resolve(db, EXERCISE_LOOKUPS[name], counts[name])
+        values = [
+            {"id": id_, "name": lookup[id_]["name"], "count": count}
+            for id_, count in counts[name].items()
+            if id_ in lookup
+        ]
+        facet_values[name] = sorted(values, key=lambda v: (-v["count"], v["name"]))
+
+    body = {
+        "exercises": serialize_exercises(db, exercises_list, selection),
+        "total": total,
+        "page": skip // limit + 1,
+        "size": limit,
+        "facets": facet_values,
+    }
+    entry = cache_entry(body, etag)
+    cache.set(cache_key, entry, ttl=CATALOG_CACHE_TTL, tags=("exercises", "taxonomy"))
+    return cached_json_response(request, entry)
 
 
 @router.get("/{exercise_id}", response_model=Exercise)
-async def read_exercise(exercise_id: int, db: Session = Depends(get_db)):
+async def read_exercise(
+    exercise_id: int,
+    request: Request,
+    db: Session = Depends(get_db),
+):
     """
     Get exercise by ID with all relations
     """
-    exercise_obj = exercise.get_with_relations(db, id=exercise_id)
+    cache_key = f"exercises:{exercise_id}"
+    entry = cache.get(cache_key)
+    if entry is not None:
+        return cached_json_response(request, entry)
+
+    updated_at = exercise.get_version(db, id=exercise_id)
+    etag = weak_etag("exercise", exercise_id, updated_at, taxonomy_cache.version(db))
+    if updated_at is not None and is_not_modified(request, etag, updated_at):
+        return not_modified(etag, updated_at)
+
+    exercise_obj = exercise.get_with_relations(
+        db, id=exercise_id, relations=("coach_user",)
+    )
     if not exercise_obj:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Exercise not found"
         )
 
-    return exercise_obj
+    entry = cache_entry(serialize_exercises(db, [exercise_obj])[0], etag, updated_at)
+    cache.set(
+        cache_key,
+        entry,
+        ttl=CATALOG_CACHE_TTL,
+        tags=(f"exercise:{exercise_id}", "taxonomy"),
+    )
+    return cached_json_response(request, entry)
+
+
+@router.get("/{exercise_id}/similar", response_model=SimilarExercisesList)
+async def read_similar_exercises(
+    exercise_id: int,
+    db: Session = Depends(get_db),
+    limit: int = Query(10, ge=1, le=50),
+    exclude_equipment_id: list[int] = Query(
+        [], description="Equipment the substitutes must not need"
+    ),
+):
+    """
+    Exercises most similar to this one by category, movement type, muscle
+    group, equipment, position and contraction type, e.g. substitutes
+    when a piece of equipment is missing.
+    """
+    found = exercise_similarity.similar(
+        db, exercise_id, limit, excluded_equipment_ids=set(exclude_equipment_id)
+    )
+    if found is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Exercise not found"
+        )
+
+    rows = exercise.get_many_with_relations(
+        db,
+        ids=[id_ for id_, _ in found],
+        **exercise_load_kwargs(FieldSelection()),
+    )
+    scores = dict(found)
+    return {
+        "similar": [
+            {"exercise": data, "similarity": scores[row.id]}
+            for row, data in zip(rows, serialize_exercises(db, rows), strict=True)
+        ]
+    }
 
 
 @router.post("/", response_model=Exercise, status_code=status.HTTP_201_CREATED)
@@ -114,6 +393,9 @@ async def create_exercise(
     created_exercise = exercise.create_with_relations(
         db, obj_in=exercise_in, coach_id=current_user.id
     )
+    cache.invalidate_tags("exercises")
+    exercise_autocomplete.upsert(created_exercise)
+    exercise_similarity.upsert(created_exercise)
     return created_exercise
 
 
@@ -140,6 +422,9 @@ async def update_exercise(
         )
 
     updated_exercise = exercise.update(db, db_obj=exercise_obj, obj_in=exercise_in)
+    cache.invalidate_tags("exercises", f"exercise:{exercise_id}")
+    exercise_autocomplete.upsert(updated_exercise)
+    exercise_similarity.upsert(updated_exercise)
     return updated_exercise
 
 
@@ -165,12 +450,17 @@ async def delete_exercise(
         )
 
     exercise.remove(db, id=exercise_id)
+    cache.invalidate_tags("exercises", f"exercise:{exercise_id}")
+    exercise_autocomplete.remove(exercise_id)
+    exercise_similarity.remove(exercise_id)
     return None
 
 
 # Classification endpoints (Exercise Categories)
 @router.get("/categories/", response_model=ExerciseCategoriesList)
 async def read_categories(
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
@@ -178,23 +468,33 @@ async def read_categories(
     """
     Get all exercise categories
     """
-    categories = exercise_category.get_multi(db, skip=skip, limit=limit)
-    total = exercise_category.count(db)
-
-    return ExerciseCategoriesList(categories=categories, total=total)
+    snapshot = taxonomy_cache.get(db, "categories")
+    if is_not_modified(request, snapshot.etag):
+        return not_modified(snapshot.etag)
+    set_validators(response, snapshot.etag)
+    return ExerciseCategoriesList(
+        categories=snapshot.page(skip, limit), total=snapshot.total
+    )
 
 
 @router.get("/categories/{category_id}", response_model=ExerciseCategory)
-async def read_category(category_id: int, db: Session = Depends(get_db)):
+async def read_category(
+    category_id: int,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+):
     """
     Get exercise category by ID
     """
-    category = exercise_category.get(db, id=category_id)
+    snapshot, category = taxonomy_cache.get_item(db, "categories", category_id)
     if not category:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Category not found"
         )
-
+    if is_not_modified(request, snapshot.etag):
+        return not_modified(snapshot.etag)
+    set_validators(response, snapshot.etag)
     return category
 
 
@@ -218,6 +518,7 @@ async def create_category(
         )
 
     created_category = exercise_category.create(db, obj_in=category_in)
+    taxonomy_cache.invalidate("categories")
     return created_category
 
 
@@ -246,7 +547,9 @@ async def update_category(
                 detail="Category with this name already exists",
             )
 
-    return exercise_category.update(db, db_obj=category_obj, obj_in=category_in)
+    updated = exercise_category.update(db, db_obj=category_obj, obj_in=category_in)
+    taxonomy_cache.invalidate("categories")
+    return updated
 
 
 @router.delete("/categories/{category_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -265,28 +568,45 @@ async def delete_category(
         )
 
     exercise_category.remove(db, id=category_id)
+    taxonomy_cache.invalidate("categories")
     return None
 
 
 # Movement Types - Complete CRUD
 @router.get("/movement-types/", response_model=MovementTypesList)
 async def read_movement_types(
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
 ):
-    movement_types_list = movement_type.get_multi(db, skip=skip, limit=limit)
-    total = movement_type.count(db)
-    return MovementTypesList(movement_types=movement_types_list, total=total)
+    snapshot = taxonomy_cache.get(db, "movement_types")
+    if is_not_modified(request, snapshot.etag):
+        return not_modified(snapshot.etag)
+    set_validators(response, snapshot.etag)
+    return MovementTypesList(
+        movement_types=snapshot.page(skip, limit), total=snapshot.total
+    )
 
 
 @router.get("/movement-types/{movement_type_id}", response_model=MovementType)
-async def read_movement_type(movement_type_id: int, db: Session = Depends(get_db)):
-    movement_type_obj = movement_type.get(db, id=movement_type_id)
+async def read_movement_type(
+    movement_type_id: int,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+):
+    snapshot, movement_type_obj = taxonomy_cache.get_item(
+        db, "movement_types", movement_type_id
+    )
     if not movement_type_obj:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Movement type not found"
         )
+    if is_not_modified(request, snapshot.etag):
+        return not_modified(snapshot.etag)
+    set_validators(response, snapshot.etag)
     return movement_type_obj
 
 
@@ -304,7 +624,9 @@ async def create_movement_type(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Movement type with this name already exists",
         )
-    return movement_type.create(db, obj_in=movement_type_in)
+    created = movement_type.create(db, obj_in=movement_type_in)
+    taxonomy_cache.invalidate("movement_types")
+    return created
 
 
 @router.put("/movement-types/{movement_type_id}", response_model=MovementType)
@@ -319,7 +641,11 @@ async def update_movement_type(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Movement type not found"
         )
-    return movement_type.update(db, db_obj=movement_type_obj, obj_in=movement_type_in)
+    updated = movement_type.update(
+        db, db_obj=movement_type_obj, obj_in=movement_type_in
+    )
+    taxonomy_cache.invalidate("movement_types")
+    return updated
 
 
 @router.delete(
@@ -336,28 +662,45 @@ async def delete_movement_type(
             status_code=status.HTTP_404_NOT_FOUND, detail="Movement type not found"
         )
     movement_type.remove(db, id=movement_type_id)
+    taxonomy_cache.invalidate("movement_types")
     return None
 
 
 # Muscle Groups - Complete CRUD
 @router.get("/muscle-groups/", response_model=MuscleGroupsList)
 async def read_muscle_groups(
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
 ):
-    muscle_groups_list = muscle_group.get_multi(db, skip=skip, limit=limit)
-    total = muscle_group.count(db)
-    return MuscleGroupsList(muscle_groups=muscle_groups_list, total=total)
+    snapshot = taxonomy_cache.get(db, "muscle_groups")
+    if is_not_modified(request, snapshot.etag):
+        return not_modified(snapshot.etag)
+    set_validators(response, snapshot.etag)
+    return MuscleGroupsList(
+        muscle_groups=snapshot.page(skip, limit), total=snapshot.total
+    )
 
 
 @router.get("/muscle-groups/{muscle_group_id}", response_model=MuscleGroup)
-async def read_muscle_group(muscle_group_id: int, db: Session = Depends(get_db)):
-    muscle_group_obj = muscle_group.get(db, id=muscle_group_id)
+async def read_muscle_group(
+    muscle_group_id: int,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+):
+    snapshot, muscle_group_obj = taxonomy_cache.get_item(
+        db, "muscle_groups", muscle_group_id
+    )
     if not muscle_group_obj:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Muscle group not found"
         )
+    if is_not_modified(request, snapshot.etag):
+        return not_modified(snapshot.etag)
+    set_validators(response, snapshot.etag)
     return muscle_group_obj
 
 
@@ -375,7 +718,9 @@ async def create_muscle_group(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Muscle group with this name already exists",
         )
-    return muscle_group.create(db, obj_in=muscle_group_in)
+    created = muscle_group.create(db, obj_in=muscle_group_in)
+    taxonomy_cache.invalidate("muscle_groups")
+    return created
 
 
 @router.put("/muscle-groups/{muscle_group_id}", response_model=MuscleGroup)
@@ -400,7 +745,9 @@ async def update_muscle_group(
                 detail="Muscle group with this name already exists",
             )
 
-    return muscle_group.update(db, db_obj=muscle_group_obj, obj_in=muscle_group_in)
+    updated = muscle_group.update(db, db_obj=muscle_group_obj, obj_in=muscle_group_in)
+    taxonomy_cache.invalidate("muscle_groups")
+    return updated
 
 
 @router.delete(
@@ -417,28 +764,41 @@ async def delete_muscle_group(
             status_code=status.HTTP_404_NOT_FOUND, detail="Muscle group not found"
         )
     muscle_group.remove(db, id=muscle_group_id)
+    taxonomy_cache.invalidate("muscle_groups")
     return None
 
 
 # Equipment - Complete CRUD
 @router.get("/equipment/", response_model=EquipmentList)
 async def read_equipment(
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
 ):
-    equipment_list = equipment.get_multi(db, skip=skip, limit=limit)
-    total = equipment.count(db)
-    return EquipmentList(equipment=equipment_list, total=total)
+    snapshot = taxonomy_cache.get(db, "equipment")
+    if is_not_modified(request, snapshot.etag):
+        return not_modified(snapshot.etag)
+    set_validators(response, snapshot.etag)
+    return EquipmentList(equipment=snapshot.page(skip, limit), total=snapshot.total)
 
 
 @router.get("/equipment/{equipment_id}", response_model=Equipment)
-async def read_equipment_item(equipment_id: int, db: Session = Depends(get_db)):
-    equipment_obj = equipment.get(db, id=equipment_id)
+async def read_equipment_item(
+    equipment_id: int,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+):
+    snapshot, equipment_obj = taxonomy_cache.get_item(db, "equipment", equipment_id)
     if not equipment_obj:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Equipment not found"
         )
+    if is_not_modified(request, snapshot.etag):
+        return not_modified(snapshot.etag)
+    set_validators(response, snapshot.etag)
     return equipment_obj
 
 
@@ -456,7 +816,9 @@ async def create_equipment(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Equipment with this name already exists",
         )
-    return equipment.create(db, obj_in=equipment_in)
+    created = equipment.create(db, obj_in=equipment_in)
+    taxonomy_cache.invalidate("equipment")
+    return created
 
 
 @router.put("/equipment/{equipment_id}", response_model=Equipment)
@@ -481,7 +843,9 @@ async def update_equipment(
                 detail="Equipment with this name already exists",
             )
 
-    return equipment.update(db, db_obj=equipment_obj, obj_in=equipment_in)
+    updated = equipment.update(db, db_obj=equipment_obj, obj_in=equipment_in)
+    taxonomy_cache.invalidate("equipment")
+    return updated
 
 
 @router.delete("/equipment/{equipment_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -496,28 +860,41 @@ async def delete_equipment(
             status_code=status.HTTP_404_NOT_FOUND, detail="Equipment not found"
         )
     equipment.remove(db, id=equipment_id)
+    taxonomy_cache.invalidate("equipment")
     return None
 
 
 # Positions - Complete CRUD
 @router.get("/positions/", response_model=PositionsList)
 async def read_positions(
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
 ):
-    positions_list = position.get_multi(db, skip=skip, limit=limit)
-    total = position.count(db)
-    return PositionsList(positions=positions_list, total=total)
+    snapshot = taxonomy_cache.get(db, "positions")
+    if is_not_modified(request, snapshot.etag):
+        return not_modified(snapshot.etag)
+    set_validators(response, snapshot.etag)
+    return PositionsList(positions=snapshot.page(skip, limit), total=snapshot.total)
 
 
 @router.get("/positions/{position_id}", response_model=Position)
-async def read_position(position_id: int, db: Session = Depends(get_db)):
-    position_obj = position.get(db, id=position_id)
+async def read_position(
+    position_id: int,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+):
+    snapshot, position_obj = taxonomy_cache.get_item(db, "positions", position_id)
     if not position_obj:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Position not found"
         )
+    if is_not_modified(request, snapshot.etag):
+        return not_modified(snapshot.etag)
+    set_validators(response, snapshot.etag)
     return position_obj
 
 
@@ -535,7 +912,9 @@ async def create_position(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Position with this name already exists",
         )
-    return position.create(db, obj_in=position_in)
+    created = position.create(db, obj_in=position_in)
+    taxonomy_cache.invalidate("positions")
+    return created
 
 
 @router.put("/positions/{position_id}", response_model=Position)
@@ -560,7 +939,9 @@ async def update_position(
                 detail="Position with this name already exists",
             )
 
-    return position.update(db, db_obj=position_obj, obj_in=position_in)
+    updated = position.update(db, db_obj=position_obj, obj_in=position_in)
+    taxonomy_cache.invalidate("positions")
+    return updated
 
 
 @router.delete("/positions/{position_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -575,30 +956,45 @@ async def delete_position(
             status_code=status.HTTP_404_NOT_FOUND, detail="Position not found"
         )
     position.remove(db, id=position_id)
+    taxonomy_cache.invalidate("positions")
     return None
 
 
 # Contraction Types - Complete CRUD
 @router.get("/contraction-types/", response_model=ContractionTypesList)
 async def read_contraction_types(
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
 ):
-    contraction_types_list = contraction_type.get_multi(db, skip=skip, limit=limit)
-    total = contraction_type.count(db)
-    return ContractionTypesList(contraction_types=contraction_types_list, total=total)
+    snapshot = taxonomy_cache.get(db, "contraction_types")
+    if is_not_modified(request, snapshot.etag):
+        return not_modified(snapshot.etag)
+    set_validators(response, snapshot.etag)
+    return ContractionTypesList(
+        contraction_types=snapshot.page(skip, limit), total=snapshot.total
+    )
 
 
 @router.get("/contraction-types/{contraction_type_id}", response_model=ContractionType)
 async def read_contraction_type(
-    contraction_type_id: int, db: Session = Depends(get_db)
+    contraction_type_id: int,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
 ):
-    contraction_type_obj = contraction_type.get(db, id=contraction_type_id)
+    snapshot, contraction_type_obj = taxonomy_cache.get_item(
+        db, "contraction_types", contraction_type_id
+    )
     if not contraction_type_obj:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Contraction type not found"
         )
+    if is_not_modified(request, snapshot.etag):
+        return not_modified(snapshot.etag)
+    set_validators(response, snapshot.etag)
     return contraction_type_obj
 
 
@@ -618,7 +1014,9 @@ async def create_contraction_type(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Contraction type with this name already exists",
         )
-    return contraction_type.create(db, obj_in=contraction_type_in)
+    created = contraction_type.create(db, obj_in=contraction_type_in)
+    taxonomy_cache.invalidate("contraction_types")
+    return created
 
 
 @router.put("/contraction-types/{contraction_type_id}", response_model=ContractionType)
@@ -646,9 +1044,11 @@ async def update_contraction_type(
                 detail="Contraction type with this name already exists",
             )
 
-    return contraction_type.update(
+    updated = contraction_type.update(
         db, db_obj=contraction_type_obj, obj_in=contraction_type_in
     )
+    taxonomy_cache.invalidate("contraction_types")
+    return updated
 
 
 @router.delete(
@@ -665,6 +1065,7 @@ async def delete_contraction_type(
             status_code=status.HTTP_404_NOT_FOUND, detail="Contraction type not found"
         )
     contraction_type.remove(db, id=contraction_type_id)
+    taxonomy_cache.invalidate("contraction_types")
     return None
 
 
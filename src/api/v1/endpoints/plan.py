@@ -3,10 +3,20 @@ from __future__ import annotations
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.orm import Session
 
+from src.api.conditional import (
+    is_not_modified,
+    not_modified,
+    set_validators,
+    weak_etag,
+)
 from src.api.deps import get_current_active_user, get_current_coach_or_admin
+from src.api.fields import column_names, projected_schema, select_fields
+from src.api.responses import serialize, success_response
+from src.core.cache import cache
+from src.core.config import settings
 from src.core.database import get_db
 from src.crud.plan import plan, workout_exercise, workout_session
 from src.models.user import User
@@ -26,10 +36,32 @@ from src.schemas.plan import (
     WorkoutSessionsList,
     WorkoutSessionUpdate,
 )
-from src.services.plan_generator import PlanGenerator
+from src.schemas.workout import WorkoutSetLogBatch, WorkoutSyncBatch
+from src.services.plan_generator import ExerciseSubstitutions, PlanGenerator
+from src.services.strength import strength_curves
+from src.services.workout_sync import sync_workouts
 
 router = APIRouter()
 
+# What ?fields= and ?include= may select on plan and session lists
+PLAN_RELATIONS = ("workout_sessions",)
+PLAN_COLUMNS = column_names(PlanResponse, PLAN_RELATIONS)
+SESSION_RELATIONS = ("workout_exercises",)
+SESSION_COLUMNS = column_names(WorkoutSessionResponse, SESSION_RELATIONS)
+
+
+def serialize_plan_detail(plan_obj, depth: int) -> dict:
+    """Plan payload down to ``depth``: 0 plan, 1 sessions, 2 session exercises"""
+    if depth >= 2:
+        return serialize(PlanResponse, plan_obj)
+    data = serialize(projected_schema(PlanResponse, PLAN_COLUMNS), plan_obj)
+    if depth == 1:
+        data["workout_sessions"] = serialize(
+            projected_schema(WorkoutSessionResponse, SESSION_COLUMNS),
+            plan_obj.workout_sessions
+        )
+    return data
+
 
 # Plan endpoints
 @router.get(
@@ -64,10 +96,13 @@ router = APIRouter()
     }
 )
 async def get_plans(
+    request: Request,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
     coach_id: Optional[str] = Query(None),
     is_public: Optional[bool] = Query(None),
+    fields: Optional[str] = Query(None, description="Comma-separated columns"),
+    include: Optional[str] = Query(None, description="Comma-separated relations"),
     db: Session = Depends(get_db)
 ):
     """
@@ -78,46 +113,82 @@ async def get_plans(
     - **limit**: Maximum number of records to return
     - **coach_id**: Filter by coach ID
     - **is_public**: Filter by public status
+    - **fields**: Only return these columns (id is always included)
+    - **include**: Only return these relations (e.g. workout_sessions)
 
     Returns:
     - List of workout plans
     """
+    selection = select_fields(
+        fields, include, columns=PLAN_COLUMNS, relations=PLAN_RELATIONS
+    )
+    total, last_updated = plan(db).get_list_version(
+        coach_id=coach_id,
+        is_public=is_public
+    )
+    etag = weak_etag(
+        "plans", coach_id, is_public, skip, limit, selection, total, last_updated
+    )
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+
     plans = plan(db).get_multi(
         skip=skip,
         limit=limit,
         coach_id=coach_id,
-        is_public=is_public
+        is_public=is_public,
+        **selection.load_kwargs()
     )
 
-    return SuccessResponse(
+    response = success_response(
         message="Plans retrieved successfully",
-        data={"plans": [PlanResponse.from_orm(p) for p in plans]}
+        data={"plans": serialize(selection.schema(PlanResponse, PLAN_COLUMNS), plans)}
     )
+    set_validators(response, etag)
+    return response
 
 
 @router.get("/my-plans", response_model=SuccessResponse)
 async def get_my_plans(
+    request: Request,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    fields: Optional[str] = Query(None, description="Comma-separated columns"),
+    include: Optional[str] = Query(None, description="Comma-separated relations"),
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """
     Get current user's workout plans.
 
+    Supports the same **fields** and **include** parameters as the plan list.
+
     Returns:
     - List of user's workout plans
     """
+    selection = select_fields(
+        fields, include, columns=PLAN_COLUMNS, relations=PLAN_RELATIONS
+    )
+    total, last_updated = plan(db).get_list_version(coach_id=str(current_user.id))
+    etag = weak_etag(
+        "my-plans", current_user.id, skip, limit, selection, total, last_updated
+    )
+    if is_not_modified(request, etag):
+        return not_modified(etag, cache_control="private, no-cache")
+
     user_plans = plan(db).get_by_user(
         user_id=str(current_user.id),
         skip=skip,
-        limit=limit
+        limit=limit,
+        **selection.load_kwargs()
     )
 
-    return SuccessResponse(
+    response = success_response(
         message="User plans retrieved successfully",
-        data={"plans": [PlanResponse.from_orm(p) for p in user_plans]}
+        data={"plans": serialize(selection.schema(PlanResponse, PLAN_COLUMNS), user_plans)}
     )
+    set_validators(response, etag, cache_control="private, no-cache")
+    return response
 
 
 @router.get("/public", response_model=SuccessResponse)
@@ -134,15 +205,22 @@ async def get_public_plans(
     """
     public_plans = plan(db).get_public_plans(skip=skip, limit=limit)
 
-    return SuccessResponse(
+    return success_response(
         message="Public plans retrieved successfully",
-        data={"plans": [PlanResponse.from_orm(p) for p in public_plans]}
+        data={"plans": serialize(PlanResponse, public_plans)}
     )
 
 
 @router.get("/{plan_id}", response_model=SuccessResponse)
 async def get_plan(
     plan_id: int,
+    request: Request,
+    depth: int = Query(
+        2,
+        ge=0,
+        le=2,
+        description="0: plan only, 1: with sessions, 2: sessions with their exercises"
+    ),
     db: Session = Depends(get_db)
 ):
     """
@@ -150,21 +228,32 @@ async def get_plan(
 
     Parameters:
     - **plan_id**: ID of the plan to retrieve
+    - **depth**: How many nested levels to return (default: all)
 
     Returns:
     - Workout plan details
     """
-    plan_obj = plan(db).get(plan_id)
+    # updated_at also moves when the plan's sessions or exercises change
+    updated_at = plan(db).get_version(plan_id)
+    etag = weak_etag("plan", plan_id, depth, updated_at)
+    if updated_at is not None and is_not_modified(request, etag, updated_at):
+        return not_modified(etag, updated_at)
+
+    plan_obj = plan(db).get_detail(
+        plan_id, sessions=depth >= 1, exercises=depth >= 2
+    )
     if not plan_obj:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Plan not found"
         )
 
-    return SuccessResponse(
+    response = success_response(
         message="Plan retrieved successfully",
-        data={"plan": PlanResponse.from_orm(plan_obj)}
+        data={"plan": serialize_plan_detail(plan_obj, depth)}
     )
+    set_validators(response, etag, updated_at)
+    return response
 
 
 @router.post("/", response_model=SuccessResponse)
@@ -184,9 +273,9 @@ async def create_plan(
     """
     new_plan = plan(db).create(plan_data, coach_id=str(current_user.id))
 
-    return SuccessResponse(
+    return success_response(
         message="Plan created successfully",
-        data={"plan": PlanResponse.from_orm(new_plan)}
+        data={"plan": serialize(PlanResponse, new_plan)}
     )
 
 
@@ -223,9 +312,9 @@ async def update_plan(
 
     updated_plan = plan(db).update(plan_id, plan_data)
 
-    return SuccessResponse(
+    return success_response(
         message="Plan updated successfully",
-        data={"plan": PlanResponse.from_orm(updated_plan)}
+        data={"plan": serialize(PlanResponse, updated_plan)}
     )
 
 
@@ -265,7 +354,7 @@ async def delete_plan(
             detail="Failed to delete plan"
         )
 
-    return SuccessResponse(
+    return success_response(
         message="Plan deleted successfully",
         data={"deleted": True}
     )
@@ -280,10 +369,14 @@ async def get_available_templates(db: Session = Depends(get_db)):
     Returns:
     - List of plan templates with metadata
     """
-    generator = PlanGenerator(db)
-    templates = generator.get_available_templates()
+    # Templates only change with a deploy, so the version is part of the key
+    templates = cache.get_or_set(
+        f"plans:templates:{settings.VERSION}",
+        lambda: PlanGenerator(db).get_available_templates(),
+        ttl=3600
+    )
 
-    return SuccessResponse(
+    return success_response(
         message="Templates retrieved successfully",
         data={"templates": templates}
     )
@@ -301,23 +394,33 @@ async def generate_plan_from_template(
     Parameters:
     - **template_name**: Name of template to use
     - **custom_name**: Optional custom name for the plan
+    - **substitute_exercises**: Replace template exercises missing from the catalog with the closest match
+    - **excluded_equipment_ids**: Equipment the client lacks; exercises needing it are swapped for similar ones
 
     Returns:
     - Generated plan details
     """
     generator = PlanGenerator(db)
+    substitutions = None
+    if request.substitute_exercises or request.excluded_equipment_ids:
+        substitutions = ExerciseSubstitutions(
+            db,
+            excluded_equipment_ids=request.excluded_equipment_ids,
+            replace_missing=request.substitute_exercises
+        )
 
     try:
         generated_plan = generator.generate_plan_from_template(
             template_name=request.template_name,
             user_id=str(current_user.id),
-            custom_name=request.custom_name
+            custom_name=request.custom_name,
+            substitutions=substitutions
         )
 
         # Count generated workout sessions
         session_count = len(generated_plan.workout_sessions)
 
-        return SuccessResponse(
+        return success_response(
             message="Plan generated successfully",
             data={
                 "plan_id": generated_plan.id,
@@ -345,6 +448,8 @@ async def get_plan_sessions(
     plan_id: int,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    fields: Optional[str] = Query(None, description="Comma-separated columns"),
+    include: Optional[str] = Query(None, description="Comma-separated relations"),
     db: Session = Depends(get_db)
 ):
     """
@@ -354,15 +459,23 @@ async def get_plan_sessions(
     - **plan_id**: ID of the plan
     - **skip**: Number of records to skip
     - **limit**: Maximum number of records to return
+    - **fields**: Only return these columns (id is always included)
+    - **include**: Only return these relations (e.g. workout_exercises)
 
     Returns:
     - List of workout sessions
     """
-    sessions = workout_session(db).get_by_plan(plan_id, skip=skip, limit=limit)
+    selection = select_fields(
+        fields, include, columns=SESSION_COLUMNS, relations=SESSION_RELATIONS
+    )
+    sessions = workout_session(db).get_by_plan(
+        plan_id, skip=skip, limit=limit, **selection.load_kwargs()
+    )
+    schema = selection.schema(WorkoutSessionResponse, SESSION_COLUMNS)
 
-    return SuccessResponse(
+    return success_response(
         message="Workout sessions retrieved successfully",
-        data={"sessions": [WorkoutSessionResponse.from_orm(s) for s in sessions]}
+        data={"sessions": serialize(schema, sessions)}
     )
 
 
@@ -387,9 +500,9 @@ async def get_workout_session(
             detail="Workout session not found"
         )
 
-    return SuccessResponse(
+    return success_response(
         message="Workout session retrieved successfully",
-        data={"session": WorkoutSessionResponse.from_orm(session)}
+        data={"session": serialize(WorkoutSessionResponse, session)}
     )
 
 
@@ -418,9 +531,41 @@ async def create_workout_session(
 
     new_session = workout_session(db).create(session_data)
 
-    return SuccessResponse(
+    return success_response(
         message="Workout session created successfully",
-        data={"session": WorkoutSessionResponse.from_orm(new_session)}
+        data={"session": serialize(WorkoutSessionResponse, new_session)}
+    )
+
+
+@router.post("/sync", response_model=SuccessResponse)
+async def sync_offline_workouts(
+    batch: WorkoutSyncBatch,
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Apply session completions and logged sets recorded offline.
+
+    Each operation carries a client-generated idempotency key. Operations
+    whose key was already synced are not applied again: their stored
+    result is returned with ``replayed`` set, so a batch can be retried
+    safely after a dropped connection.
+
+    Parameters:
+    - **operations**: Up to 1000 operations, each either
+      ``{"type": "complete_session", "idempotency_key", "session_id", "notes"}`` or
+      ``{"type": "log_set", "idempotency_key", "workout_exercise_id", "set_number",
+      "reps_completed", "weight_used"}``
+
+    Returns:
+    - One result per operation, in order: idempotency_key, status (200, 404
+      or 409), replayed, data and detail
+    """
+    results = sync_workouts(db, current_user, batch.operations)
+
+    return success_response(
+        message="Workouts synced successfully",
+        data={"results": results}
     )
 
 
@@ -445,8 +590,57 @@ async def complete_workout_session(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Workout session not found"
         )
+    strength_curves.invalidate([completed_session.client_id])
 
-    return SuccessResponse(
+    return success_response(
         message="Workout session completed successfully",
-        data={"session": WorkoutSessionResponse.from_orm(completed_session)}
+        data={"session": serialize(WorkoutSessionResponse, completed_session)}
+    )
+
+
+@router.post("/sessions/{session_id}/log", response_model=SuccessResponse)
+async def log_workout_sets(
+    session_id: int,
+    batch: WorkoutSetLogBatch,
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Log a batch of completed sets for a workout session.
+
+    All sets are applied in one transaction: either every entry is
+    recorded or, if any names an exercise outside the session, none is.
+
+    Parameters:
+    - **session_id**: ID of the workout session
+    - **sets**: Logged sets (workout_exercise_id, set_number, reps_completed, weight_used)
+
+    Returns:
+    - Updated progress of each affected exercise
+    """
+    session = workout_session(db).get(session_id)
+    if not session:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Workout session not found"
+        )
+    if session.client_id != current_user.id and current_user.role_id != 1:
+        plan_obj = plan(db).get(session.plan_id)
+        if plan_obj is None or plan_obj.coach_id != current_user.id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Not enough permissions"
+            )
+
+    progress = workout_exercise(db).log_sets(session, batch.sets)
+    if progress is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Workout exercise not found in this session"
+        )
+    strength_curves.invalidate([session.client_id])
+
+    return success_response(
+        message="Sets logged successfully",
+        data={"exercises": progress}
     )
@@ -1,11 +1,21 @@
+from datetime import date, timedelta
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
 from src.api.deps import get_current_active_user, get_current_admin, get_current_coach
+from src.core.cache import cache
 from src.core.database import get_db
+from src.crud.plan import exercise_progress, weekly_volume, workout_session
 from src.crud.user import client_profile, user
+from src.schemas.plan import (
+    CalendarDay,
+    ClientAdherenceResponse,
+    ExerciseProgressResponse,
+    StrengthCurveResponse,
+    WeeklyVolumeResponse,
+)
 from src.schemas.user import (
     ClientProfile,
     ClientProfileUpdate,
@@ -14,9 +24,27 @@ from src.schemas.user import (
     UserUpdate,
     UserWithProfile,
 )
+from src.services.strength import FORMULAS, strength_curves
 
 router = APIRouter(tags=["users"])
 
+# Longest span /{user_id}/volume serves at once
+MAX_VOLUME_RANGE = timedelta(weeks=5 * 53)
+# Longest span /{user_id}/calendar serves at once
+MAX_CALENDAR_RANGE = timedelta(days=92)
+DASHBOARD_CACHE_TTL = 60
+
+
+def check_client_access(db: Session, current_user: User, client_id: UUID) -> None:
+    """403 unless the user is the client, the client's coach or an admin"""
+    if current_user.id == client_id or current_user.role_id == 1:
+        return
+    client = user.get(db, id=client_id)
+    if not client or client.coach_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions"
+        )
+
 
 # Admin only endpoints
 @router.get("/", response_model=UsersList, dependencies=[Depends(get_current_admin)])
@@ -178,6 +206,100 @@ async def update_client_profile(
     return updated_profile
 
 
+@router.get("/{user_id}/progress", response_model=list[ExerciseProgressResponse])
+async def get_client_progress(
+    user_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+):
+    """
+    Best and latest load of a client on each exercise
+    Users can see their own progress, coaches their clients', admins all
+    """
+    check_client_access(db, current_user, user_id)
+    return exercise_progress(db).get_by_client(user_id)
+
+
+@router.get("/{user_id}/volume", response_model=list[WeeklyVolumeResponse])
+async def get_client_volume(
+    user_id: UUID,
+    date_from: date | None = Query(None, alias="from"),
+    date_to: date | None = Query(None, alias="to"),
+    muscle_group_id: int | None = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+):
+    """
+    Weekly training volume (sets, reps, tonnage) of a client per muscle group
+    Covers the weeks overlapping [from, to]; defaults to the last 12 weeks
+    """
+    check_client_access(db, current_user, user_id)
+    date_to = date_to or date.today()
+    date_from = date_from or date_to - timedelta(weeks=12)
+    if date_from > date_to:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="'from' must not be after 'to'",
+        )
+    if date_to - date_from > MAX_VOLUME_RANGE:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Date range too large",
+        )
+
+    return weekly_volume(db).get_by_client(
+        user_id, date_from, date_to, muscle_group_id=muscle_group_id
+    )
+
+
+@router.get("/{user_id}/calendar", response_model=list[CalendarDay])
+async def get_client_calendar(
+    user_id: UUID,
+    date_from: date | None = Query(None, alias="from"),
+    date_to: date | None = Query(None, alias="to"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+):
+    """
+    Workout sessions of a client per day in [from, to], with exercise names
+    Defaults to the week (Monday to Sunday) of 'to', or the current one
+    """
+    check_client_access(db, current_user, user_id)
+    if date_from is None:
+        anchor = date_to or date.today()
+        date_from = anchor - timedelta(days=anchor.weekday())
+    date_to = date_to or date_from + timedelta(days=6)
+    if date_from > date_to:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="'from' must not be after 'to'",
+        )
+    if date_to - date_from > MAX_CALENDAR_RANGE:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Date range too large",
+        )
+
+    return workout_session(db).calendar(user_id, date_from, date_to)
+
+
+@router.get("/{user_id}/strength/{exercise_id}", response_model=StrengthCurveResponse)
+async def get_client_strength(
+    user_id: UUID,
+    exercise_id: int,
+    formula: str = Query("epley", pattern=f"^({'|'.join(FORMULAS)})$"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+):
+    """
+    Estimated one-rep max of a client on an exercise, per session and smoothed
+    formula: epley (default) or brzycki
+    """
+    check_client_access(db, current_user, user_id)
+    curve = strength_curves.get(db, user_id, exercise_id, formula)
+    return {"exercise_id": exercise_id, **curve}
+
+
 # Coach specific endpoints
 @router.get(
     "/coach/clients",
@@ -199,6 +321,31 @@ async def get_coach_clients(
     return clients
 
 
+@router.get(
+    "/coach/dashboard",
+    response_model=list[ClientAdherenceResponse],
+    dependencies=[Depends(get_current_coach)],
+)
+async def get_coach_dashboard(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_coach),
+):
+    """
+    Adherence of each client of the current coach: sessions planned and
+    completed in the last 7 and 30 days, last workout and current streak
+    Cached for a minute
+    """
+    today = date.today()
+    return cache.get_or_set(
+        f"coach-dashboard:{current_user.id}:{today}",
+        lambda: [
+            row._asdict()
+            for row in workout_session(db).adherence(current_user.id, today)
+        ],
+        ttl=DASHBOARD_CACHE_TTL,
+    )
+
+
 @router.post("/search", response_model=list[User])
 async def search_users(
     query: str = Query(..., min_length=2),
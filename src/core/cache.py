@@ -0,0 +1,355 @@
+"""
+Shared cache backends.
+
+``cache`` is selected by CACHE_URL: ``memory://`` keeps entries in this
+process (tests, single worker); ``redis://[:password@]host[:port][/db]``
+shares them between workers through any server speaking the Redis
+protocol.
+
+Values are stored JSON-encoded. Entries may carry tags: ``invalidate_tags``
+bumps a per-tag version counter, and entries stored under an older version
+read as misses, so related entries are dropped without finding them.
+Connection problems never fail a request: reads become misses and writes
+are skipped, with a warning.
+"""
+
+from __future__ import annotations
+
+import socket
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from queue import Empty, LifoQueue
+from typing import Any
+from urllib.parse import unquote, urlparse
+
+import orjson
+from loguru import logger
+
+from .config import settings
+
+_MISSING = object()
+
+
+class CacheError(Exception):
+    """The cache server could not be reached or rejected a command"""
+
+
+class CacheBackend(ABC):
+    """
+    Cache interface; subclasses implement the raw byte-level operations.
+    """
+
+    def __init__(self, *, prefix: str = "", default_ttl: float | None = None):
+        self.prefix = prefix
+        self.default_ttl = default_ttl
+
+    # Raw operations on prefixed keys
+    @abstractmethod
+    def _get_many(self, keys: list[str]) -> list[bytes | None]:
+        """Stored values of ``keys``, None where missing or expired"""
+
+    @abstractmethod
+    def _set(self, key: str, value: bytes, ttl: float | None) -> None:
+        """Store ``value`` under ``key``, expiring after ``ttl`` seconds if given"""
+
+    @abstractmethod
+    def _delete(self, keys: list[str]) -> None:
+        """Remove ``keys``"""
+
+    @abstractmethod
+    def _incr(self, key: str, amount: int) -> int:
+        """Add ``amount`` to the counter at ``key`` (0 if unset) and return it"""
+
+    def _key(self, key: str) -> str:
+        return self.prefix + key
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self.prefix}tag:{tag}"
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Cached value, or ``default`` on a miss or a stale tag"""
+        try:
+            raw = self._get_many([self._key(key)])[0]
+            if raw is None:
+                return default
+            entry = orjson.loads(raw)
+            tags = entry.get("t")
+            if tags and self.tag_versions(tags) != tags:
+                return default
+            return entry["v"]
+        except CacheError as exc:
+            logger.warning(f"Cache get failed for {key}: {exc}")
+            return default
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: float | None = None,
+        tags: Iterable[str] = (),
+    ) -> None:
+        """Store a JSON-serializable value under the current tag versions"""
+        try:
+            entry: dict[str, Any] = {"v": value}
+            tags = list(tags)
+            if tags:
+                entry["t"] = self.tag_versions(tags)
+            ttl = self.default_ttl if ttl is None else ttl
+            self._set(self._key(key), orjson.dumps(entry), ttl)
+        except CacheError as exc:
+            logger.warning(f"Cache set failed for {key}: {exc}")
+
+    def get_or_set(
+        self,
+        key: str,
+        factory: Callable[[], Any],
+        ttl: float | None = None,
+        tags: Iterable[str] = (),
+    ) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = factory()
+            self.set(key, value, ttl=ttl, tags=tags)
+        return value
+
+    def delete(self, *keys: str) -> None:
+        try:
+            self._delete([self._key(key) for key in keys])
+        except CacheError as exc:
+            logger.warning(f"Cache delete failed for {keys}: {exc}")
+
+    def incr(self, key: str, amount: int = 1) -> int:
+        """Atomically add to an integer counter; raises CacheError"""
+        return self._incr(self._key(key), amount)
+
+    def tag_versions(self, tags: Iterable[str]) -> dict[str, int]:
+        """Current version of each tag; raises CacheError"""
+        tags = list(tags)
+        raw = self._get_many([self._tag_key(tag) for tag in tags])
+        return {tag: int(value or 0) for tag, value in zip(tags, raw, strict=True)}
+
+    def bump_tag(self, tag: str) -> int:
+        """Invalidate one tag and return its new version; raises CacheError"""
+        return self._incr(self._tag_key(tag), 1)
+
+    def invalidate_tags(self, *tags: str) -> None:
+        """Make every entry stored under these tags a miss"""
+        for tag in tags:
+            try:
+                self.bump_tag(tag)
+            except CacheError as exc:
+                logger.warning(f"Cache invalidation failed for tag {tag}: {exc}")
+
+
+class InMemoryCache(CacheBackend):
+    """Process-local backend with TTLs and an LRU size cap"""
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+        **kwargs: Any,
+    ):
+        super().__init__(**kwargs)
+        self.max_entries = max_entries
+        self.clock = clock
+        self._entries: OrderedDict[str, tuple[bytes, float | None]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _live(self, key: str) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= self.clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def _get_many(self, keys: list[str]) -> list[bytes | None]:
+        with self._lock:
+            return [self._live(key) for key in keys]
+
+    def _set(self, key: str, value: bytes, ttl: float | None) -> None:
+        expires_at = self.clock() + ttl if ttl else None
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _delete(self, keys: list[str]) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def _incr(self, key: str, amount: int) -> int:
+        with self._lock:
+            current = self._live(key)
+            value = int(current or 0) + amount
+            expires_at = self._entries[key][1] if current is not None else None
+            self._entries[key] = (str(value).encode(), expires_at)
+            return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class RedisConnection:
+    """One socket speaking RESP2"""
+
+    def __init__(self, host: str, port: int, timeout: float):
+        self.sock = socket.create_connection((host, port), timeout=timeout)
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.reader = self.sock.makefile("rb")
+
+    def send(self, *args: Any) -> None:
+        parts = [b"*%d\r\n" % len(args)]
+        for arg in args:
+            if not isinstance(arg, bytes):
+                arg = str(arg).encode("utf-8")
+            parts.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+        self.sock.sendall(b"".join(parts))
+
+    def read_reply(self) -> Any:
+        line = self.reader.readline()
+        if not line.endswith(b"\r\n"):
+            raise ConnectionError("Connection closed by cache server")
+        kind, body = line[:1], line[1:-2]
+        if kind == b"+":
+            return body.decode("utf-8")
+        if kind == b"-":
+            raise CacheError(body.decode("utf-8"))
+        if kind == b":":
+            return int(body)
+        if kind == b"$":
+            length = int(body)
+            if length == -1:
+                return None
+            data = self.reader.read(length + 2)
+            return data[:-2]
+        if kind == b"*":
+            length = int(body)
+            if length == -1:
+                return None
+            return [self.read_reply() for _ in range(length)]
+        raise ConnectionError(f"Unexpected reply from cache server: {line!r}")
+
+    def close(self) -> None:
+        try:
+            self.reader.close()
+            self.sock.close()
+        except OSError:
+            pass
+
+
+class RedisCache(CacheBackend):
+    """Backend for servers speaking the Redis protocol, with a socket pool"""
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        password: str | None = None,
+        *,
+        timeout: float = 1.0,
+        max_connections: int = 16,
+        **kwargs: Any,
+    ):
+        super().__init__(**kwargs)
+        self.host = host
+        self.port = port
+        self.db = db
+        self.password = password
+        self.timeout = timeout
+        self._pool: LifoQueue[RedisConnection] = LifoQueue(maxsize=max_connections)
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs: Any) -> RedisCache:
+        parsed = urlparse(url)
+        db = parsed.path.lstrip("/")
+        return cls(
+            host=parsed.hostname or "localhost",
+            port=parsed.port or 6379,
+            db=int(db) if db else 0,
+            password=unquote(parsed.password) if parsed.password else None,
+            **kwargs,
+        )
+
+    def _connect(self) -> RedisConnection:
+        connection = RedisConnection(self.host, self.port, self.timeout)
+        try:
+            if self.password:
+                connection.send("AUTH", self.password)
+                connection.read_reply()
+            if self.db:
+                connection.send("SELECT", self.db)
+                connection.read_reply()
+        except BaseException:
+            connection.close()
+            raise
+        return connection
+
+    def execute(self, *args: Any) -> Any:
+        """Run one command; raises CacheError"""
+        try:
+            connection = self._pool.get_nowait()
+        except Empty:
+            try:
+                connection = self._connect()
+            except OSError as exc:
+                raise CacheError(str(exc)) from exc
+
+        try:
+            connection.send(*args)
+            reply = connection.read_reply()
+        except CacheError:
+            self._release(connection)  # Error reply, the connection is fine
+            raise
+        except OSError as exc:
+            connection.close()
+            raise CacheError(str(exc)) from exc
+        self._release(connection)
+        return reply
+
+    def _release(self, connection: RedisConnection) -> None:
+        try:
+            self._pool.put_nowait(connection)
+        except Exception:
+            connection.close()
+
+    def _get_many(self, keys: list[str]) -> list[bytes | None]:
+        return self.execute("MGET", *keys)
+
+    def _set(self, key: str, value: bytes, ttl: float | None) -> None:
+        if ttl:
+            self.execute("SET", key, value, "PX", max(1, int(ttl * 1000)))
+        else:
+            self.execute("SET", key, value)
+
+    def _delete(self, keys: list[str]) -> None:
+        if keys:
+            self.execute("DEL", *keys)
+
+    def _incr(self, key: str, amount: int) -> int:
+        return self.execute("INCRBY", key, amount)
+
+
+def cache_from_url(url: str, **kwargs: Any) -> CacheBackend:
+    """Backend for a CACHE_URL"""
+    scheme = urlparse(url).scheme
+    if scheme == "memory":
+        return InMemoryCache(**kwargs)
+    if scheme in ("redis", "tcp"):
+        return RedisCache.from_url(url, **kwargs)
+    raise ValueError(f"Unsupported CACHE_URL scheme: {scheme}")
+
+
+cache = cache_from_url(settings.CACHE_URL, prefix=settings.CACHE_KEY_PREFIX)
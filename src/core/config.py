@@ -9,8 +9,27 @@ class Settings(BaseSettings):
     SECRET_KEY: str = (
         "your-secret-key-change-in-production"  # TODO change in production
     )
-    ALGORITHM: str = "HS256"
-    ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24  # 24 horas #TODO adjust as needed
+    ALGORITHM: str = "HS256"  # RS256/ES256 sign with JWT_PRIVATE_KEY_FILE
+    JWT_PRIVATE_KEY_FILE: str | None = None
+    JWT_PUBLIC_KEYS_DIR: str | None = None  # *.pem of retired keys still accepted
+    ACCESS_TOKEN_EXPIRE_MINUTES: int = 15  # Short-lived, renewed with refresh tokens
+    REFRESH_TOKEN_EXPIRE_DAYS: int = 30
+    TOKEN_REVOCATION_SYNC_SECONDS: int = 30
+    TAXONOMY_CACHE_TTL_SECONDS: int = 300  # Exercise lookup tables kept in memory
+    AUTOCOMPLETE_INDEX_TTL_SECONDS: int = 300  # Exercise name index kept in memory
+    SIMILARITY_INDEX_TTL_SECONDS: int = 300  # Exercise attribute index kept in memory
+    TOKEN_CACHE_SIZE: int = 10_000  # Verified tokens memoized per worker, 0 disables
+
+    # Login throttling (token buckets, capacity = burst, per minute = refill)
+    LOGIN_RATE_LIMIT_ENABLED: bool = True
+    LOGIN_RATE_LIMIT_IP_CAPACITY: int = 20
+    LOGIN_RATE_LIMIT_IP_PER_MINUTE: float = 20
+    LOGIN_RATE_LIMIT_EMAIL_CAPACITY: int = 5
+    LOGIN_RATE_LIMIT_EMAIL_PER_MINUTE: float = 5
+
+    # Cache shared between workers ("memory://" or "redis://host:port/db")
+    CACHE_URL: str = "memory://"
+    CACHE_KEY_PREFIX: str = "fitness:"
 
     # CORS
     BACKEND_CORS_ORIGINS: list = ["http://localhost:3000", "http://localhost:8000"]
@@ -0,0 +1,197 @@
+"""
+JWT signing keys and JWKS publication.
+
+With an asymmetric ALGORITHM (RS256/ES256) tokens are signed with a
+private key and carry a ``kid`` header; the matching public keys are
+published as a JWKS so other services can verify tokens locally. Public
+keys of retired signing keys stay in the JWKS until their tokens expire,
+which is how keys are rotated without logging everyone out.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import threading
+import time
+import urllib.request
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any
+
+from jose import JWTError, jwk, jwt
+from jose.backends.base import Key
+
+from .config import settings
+
+ASYMMETRIC_ALGORITHMS = {"RS256", "RS384", "RS512", "ES256", "ES384", "ES512"}
+
+# RFC 7638 members used for the thumbprint of each key type
+_THUMBPRINT_MEMBERS = {"RSA": ("e", "kty", "n"), "EC": ("crv", "kty", "x", "y")}
+
+
+def jwk_thumbprint(public_jwk: dict[str, Any]) -> str:
+    """RFC 7638 thumbprint, used as the key id"""
+    members = _THUMBPRINT_MEMBERS[public_jwk["kty"]]
+    canonical = json.dumps(
+        {name: public_jwk[name] for name in members}, separators=(",", ":")
+    )
+    digest = hashlib.sha256(canonical.encode("utf-8")).digest()
+    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode("ascii")
+
+
+def _public_jwk(key: Key) -> dict[str, Any]:
+    return dict(key.public_key().to_dict())
+
+
+class KeyRing:
+    """Signing key plus every public key that is still accepted"""
+
+    def __init__(
+        self,
+        algorithm: str,
+        *,
+        secret_key: str | None = None,
+        private_key_pem: str | None = None,
+        public_key_pems: Iterable[str] = (),
+    ):
+        self.algorithm = algorithm
+        self.asymmetric = algorithm in ASYMMETRIC_ALGORITHMS
+        self._verification_keys: dict[str, Key] = {}
+        self._public_jwks: dict[str, dict[str, Any]] = {}
+
+        if not self.asymmetric:
+            if not secret_key:
+                raise ValueError(f"{algorithm} requires SECRET_KEY")
+            self._signing_key: str = secret_key
+            self.kid: str | None = None
+            return
+
+        if not private_key_pem:
+            raise ValueError(f"{algorithm} requires JWT_PRIVATE_KEY_FILE")
+
+        self._signing_key = private_key_pem
+        signing_jwk = _public_jwk(jwk.construct(private_key_pem, algorithm))
+        self.kid = self._add_public(signing_jwk)
+        for pem in public_key_pems:
+            self._add_public(_public_jwk(jwk.construct(pem, algorithm)))
+
+    @classmethod
+    def from_settings(cls) -> KeyRing:
+        if settings.ALGORITHM not in ASYMMETRIC_ALGORITHMS:
+            return cls(settings.ALGORITHM, secret_key=settings.SECRET_KEY)
+
+        if not settings.JWT_PRIVATE_KEY_FILE:
+            raise ValueError(
+                f"ALGORITHM={settings.ALGORITHM} requires JWT_PRIVATE_KEY_FILE to be set"
+            )
+        private_key_pem = Path(settings.JWT_PRIVATE_KEY_FILE).read_text()
+        public_key_pems = []
+        if settings.JWT_PUBLIC_KEYS_DIR:
+            public_key_pems = [
+                path.read_text()
+                for path in sorted(Path(settings.JWT_PUBLIC_KEYS_DIR).glob("*.pem"))
+            ]
+        return cls(
+            settings.ALGORITHM,
+            private_key_pem=private_key_pem,
+            public_key_pems=public_key_pems,
+        )
+
+    def _add_public(self, public_jwk: dict[str, Any]) -> str:
+        kid = jwk_thumbprint(public_jwk)
+        public_jwk.update({"kid": kid, "alg": self.algorithm, "use": "sig"})
+        self._public_jwks[kid] = public_jwk
+        # Parse once; jose would otherwise rebuild the key on every decode
+        self._verification_keys[kid] = jwk.construct(public_jwk, self.algorithm)
+        return kid
+
+    def sign(self, claims: dict[str, Any]) -> str:
+        headers = {"kid": self.kid} if self.kid else None
+        return jwt.encode(
+            claims, self._signing_key, algorithm=self.algorithm, headers=headers
+        )
+
+    def decode(self, token: str) -> dict[str, Any]:
+        """Verify signature and claims; raises JWTError"""
+        if not self.asymmetric:
+            return jwt.decode(token, self._signing_key, algorithms=[self.algorithm])
+
+        kid = jwt.get_unverified_header(token).get("kid")
+        key = self._verification_keys.get(kid)
+        if key is None:
+            raise JWTError("Unknown signing key")
+        return jwt.decode(token, key, algorithms=[self.algorithm])
+
+    def jwks(self) -> dict[str, list[dict[str, Any]]]:
+        """Public keys in JWKS format (empty for symmetric algorithms)"""
+        return {"keys": list(self._public_jwks.values())}
+
+
+class JWKSVerifier:
+    """
+    Token verifier for services that only have our JWKS.
+
+    Parsed keys are cached for ``cache_ttl`` seconds. A token with an
+    unknown ``kid`` (a freshly rotated key) triggers a refetch, at most
+    once every ``min_refresh_interval`` seconds.
+    """
+
+    def __init__(
+        self,
+        fetch_jwks: Callable[[], dict[str, Any]],
+        *,
+        algorithms: Iterable[str] = ("RS256",),
+        cache_ttl: float = 300.0,
+        min_refresh_interval: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.fetch_jwks = fetch_jwks
+        self.algorithms = list(algorithms)
+        self.cache_ttl = cache_ttl
+        self.min_refresh_interval = min_refresh_interval
+        self.clock = clock
+        self._keys: dict[str, Key] = {}
+        self._fetched_at: float | None = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs: Any) -> JWKSVerifier:
+        def fetch() -> dict[str, Any]:
+            with urllib.request.urlopen(url, timeout=5) as response:
+                return json.load(response)
+
+        return cls(fetch, **kwargs)
+
+    def _refresh(self) -> None:
+        keys = {}
+        for public_jwk in self.fetch_jwks().get("keys", []):
+            alg = public_jwk.get("alg")
+            if public_jwk.get("kid") and alg in self.algorithms:
+                keys[public_jwk["kid"]] = jwk.construct(public_jwk, alg)
+        self._keys = keys
+        self._fetched_at = self.clock()
+
+    def _key_for(self, kid: str | None) -> Key:
+        with self._lock:
+            now = self.clock()
+            stale = self._fetched_at is None or now - self._fetched_at > self.cache_ttl
+            unknown = kid not in self._keys and (
+                self._fetched_at is None
+                or now - self._fetched_at > self.min_refresh_interval
+            )
+            if stale or unknown:
+                self._refresh()
+            key = self._keys.get(kid)
+        if key is None:
+            raise JWTError("Unknown signing key")
+        return key
+
+    def decode(self, token: str) -> dict[str, Any]:
+        """Verify a token against the cached JWKS; raises JWTError"""
+        kid = jwt.get_unverified_header(token).get("kid")
+        return jwt.decode(token, self._key_for(kid), algorithms=self.algorithms)
+
+
+key_ring = KeyRing.from_settings()
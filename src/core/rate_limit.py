@@ -0,0 +1,168 @@
+"""
+Token-bucket throttling for credential endpoints.
+
+Password verification is deliberately expensive, so excess login attempts
+are rejected here before the user lookup and hash verification run.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from .config import settings
+
+
+@dataclass(frozen=True)
+class RateLimitDecision:
+    """Result of taking a token from a bucket."""
+
+    allowed: bool
+    retry_after: float = 0.0
+    scope: str | None = None  # "ip" or "email" when rejected
+
+
+class BucketStore(ABC):
+    """
+    Storage backend for token buckets.
+
+    InMemoryBucketStore, the default, keeps buckets in process memory. Other
+    implementations can keep them in a shared store so every worker sees
+    the same budget.
+    """
+
+    @abstractmethod
+    def take(
+        self, key: str, *, capacity: float, refill_rate: float, now: float
+    ) -> RateLimitDecision:
+        """Consume one token from ``key`` and report whether it was available"""
+
+    @abstractmethod
+    def reset(self) -> None:
+        """Forget every bucket"""
+
+
+def refill_bucket(
+    tokens: float, updated_at: float, *, capacity: float, refill_rate: float, now: float
+) -> tuple[float, RateLimitDecision]:
+    """Apply the token-bucket rule and return the new level and the decision"""
+    elapsed = max(0.0, now - updated_at)
+    tokens = min(capacity, tokens + elapsed * refill_rate)
+    if tokens >= 1.0:
+        return tokens - 1.0, RateLimitDecision(allowed=True)
+    retry_after = (1.0 - tokens) / refill_rate if refill_rate > 0 else float("inf")
+    return tokens, RateLimitDecision(allowed=False, retry_after=retry_after)
+
+
+class InMemoryBucketStore(BucketStore):
+    """Per-process bucket store bounded to ``max_keys`` entries (LRU)"""
+
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(
+        self, key: str, *, capacity: float, refill_rate: float, now: float
+    ) -> RateLimitDecision:
+        with self._lock:
+            tokens, updated_at = self._buckets.pop(key, (capacity, now))
+            tokens, decision = refill_bucket(
+                tokens,
+                updated_at,
+                capacity=capacity,
+                refill_rate=refill_rate,
+                now=now,
+            )
+            self._buckets[key] = (tokens, now)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+            return decision
+
+    def reset(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+
+class LoginRateLimiter:
+    """Throttle login attempts per client IP and per target email"""
+
+    def __init__(
+        self,
+        store: BucketStore | None = None,
+        *,
+        ip_capacity: float,
+        ip_refill_per_minute: float,
+        email_capacity: float,
+        email_refill_per_minute: float,
+        enabled: bool = True,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.store = store or InMemoryBucketStore()
+        self.ip_capacity = ip_capacity
+        self.ip_refill_rate = ip_refill_per_minute / 60.0
+        self.email_capacity = email_capacity
+        self.email_refill_rate = email_refill_per_minute / 60.0
+        self.enabled = enabled
+        self.clock = clock
+        self._counters = {"allowed": 0, "rejected_ip": 0, "rejected_email": 0}
+        self._counters_lock = threading.Lock()
+
+    def check(self, *, email: str, client_ip: str | None) -> RateLimitDecision:
+        """Consume one attempt for this IP and email, IP first"""
+        if not self.enabled:
+            return RateLimitDecision(allowed=True)
+
+        now = self.clock()
+        if client_ip:
+            decision = self.store.take(
+                f"login:ip:{client_ip}",
+                capacity=self.ip_capacity,
+                refill_rate=self.ip_refill_rate,
+                now=now,
+            )
+            if not decision.allowed:
+                self._count("rejected_ip")
+                return RateLimitDecision(False, decision.retry_after, "ip")
+
+        decision = self.store.take(
+            f"login:email:{email.strip().lower()}",
+            capacity=self.email_capacity,
+            refill_rate=self.email_refill_rate,
+            now=now,
+        )
+        if not decision.allowed:
+            self._count("rejected_email")
+            return RateLimitDecision(False, decision.retry_after, "email")
+
+        self._count("allowed")
+        return decision
+
+    def stats(self) -> dict[str, int]:
+        """Snapshot of the attempt counters for this process"""
+        with self._counters_lock:
+            return dict(self._counters)
+
+    def reset(self) -> None:
+        """Clear buckets and counters"""
+        self.store.reset()
+        with self._counters_lock:
+            for key in self._counters:
+                self._counters[key] = 0
+
+    def _count(self, name: str) -> None:
+        with self._counters_lock:
+            self._counters[name] += 1
+
+
+login_rate_limiter = LoginRateLimiter(
+    ip_capacity=settings.LOGIN_RATE_LIMIT_IP_CAPACITY,
+    ip_refill_per_minute=settings.LOGIN_RATE_LIMIT_IP_PER_MINUTE,
+    email_capacity=settings.LOGIN_RATE_LIMIT_EMAIL_CAPACITY,
+    email_refill_per_minute=settings.LOGIN_RATE_LIMIT_EMAIL_PER_MINUTE,
+    enabled=settings.LOGIN_RATE_LIMIT_ENABLED,
+)
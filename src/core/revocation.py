@@ -0,0 +1,105 @@
+"""
+In-memory set of revoked access-token ids.
+
+A Bloom filter answers "definitely not revoked" for almost every token
+without touching the exact set; positives are confirmed against the exact
+jti -> expiry map, so false positives never reject a valid token.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import threading
+from collections.abc import Iterable
+from datetime import datetime
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings using double hashing"""
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        capacity = max(1, capacity)
+        self.size = max(
+            8, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        )
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str) -> Iterable[int]:
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, item: str) -> None:
+        for pos in self._positions(item):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+
+class RevocationList:
+    """Revoked jti set loaded from the database and synced periodically"""
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 0.001):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._bloom = BloomFilter(capacity, error_rate)
+        self._exact: dict[str, datetime] = {}
+        self._lock = threading.Lock()
+        self.last_synced_at: datetime | None = None
+
+    def __len__(self) -> int:
+        return len(self._exact)
+
+    def is_revoked(self, jti: str | None) -> bool:
+        """O(1) membership check, never hits the database"""
+        if not jti or jti not in self._bloom:
+            return False
+        return jti in self._exact
+
+    def add(self, jti: str, expires_at: datetime) -> None:
+        """Record a revocation made by this process"""
+        with self._lock:
+            self._insert(jti, expires_at)
+
+    def load(
+        self, entries: Iterable[tuple[str, datetime]], synced_at: datetime
+    ) -> None:
+        """Replace the whole set (startup load), dropping expired ids"""
+        now = datetime.utcnow()
+        exact = {jti: exp for jti, exp in entries if exp > now}
+        bloom = BloomFilter(max(self.capacity, len(exact) * 2), self.error_rate)
+        for jti in exact:
+            bloom.add(jti)
+        with self._lock:
+            self._exact = exact
+            self._bloom = bloom
+            self.last_synced_at = synced_at
+
+    def merge(
+        self, entries: Iterable[tuple[str, datetime]], synced_at: datetime
+    ) -> None:
+        """Add revocations made elsewhere since the last sync"""
+        with self._lock:
+            for jti, expires_at in entries:
+                self._insert(jti, expires_at)
+            self.last_synced_at = synced_at
+            self._prune()
+
+    def _insert(self, jti: str, expires_at: datetime) -> None:
+        self._exact[jti] = expires_at
+        self._bloom.add(jti)
+
+    def _prune(self) -> None:
+        # Expired ids can never be presented again; the filter is rebuilt
+        # on the next full load, the exact map shrinks right away.
+        now = datetime.utcnow()
+        expired = [jti for jti, exp in self._exact.items() if exp <= now]
+        for jti in expired:
+            del self._exact[jti]
+
+
+revocation_list = RevocationList()
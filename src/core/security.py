@@ -1,10 +1,19 @@
+import hashlib
+import hmac
+import secrets
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Callable
 from datetime import datetime, timedelta
 from typing import Any
 
-from jose import JWTError, jwt
+from jose import JWTError
 from passlib.context import CryptContext
 
 from .config import settings
+from .keys import key_ring
 
 pwd_context = CryptContext(schemes=["sha256_crypt"], deprecated="auto")
 
@@ -22,25 +31,95 @@ def create_access_token(
             minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
         )
 
-    to_encode.update({"exp": expire, "type": "access"})
-    encoded_jwt = jwt.encode(
-        to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM
+    to_encode.update(
+        {
+            "exp": expire,
+            "iat": datetime.utcnow(),
+            "jti": uuid.uuid4().hex,
+            "type": "access",
+        }
     )
+    encoded_jwt = key_ring.sign(to_encode)
     return encoded_jwt
 
 
-def verify_token(token: str) -> dict[str, Any]:
-    """Verify and decode JWT token"""
-    try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
+class DecodedTokenCache:
+    """
+    Bounded LRU memo of verified token payloads.
+
+    Entries are keyed by a prefix of the token's sha256 and confirmed with a
+    constant-time comparison of the full digest; each one is served only
+    until the token's own ``exp``.
+    """
+
+    def __init__(self, max_size: int = 10_000, clock: Callable[[], float] = time.time):
+        self.max_size = max_size
+        self.clock = clock
+        self._entries: OrderedDict[bytes, tuple[bytes, dict[str, Any], float]] = (
+            OrderedDict()
         )
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, token: str) -> dict[str, Any] | None:
+        digest = hashlib.sha256(token.encode("utf-8")).digest()
+        with self._lock:
+            entry = self._entries.get(digest[:16])
+            if entry is None:
+                return None
+            stored_digest, payload, expires_at = entry
+            if not hmac.compare_digest(stored_digest, digest):
+                return None
+            if expires_at <= self.clock():
+                del self._entries[digest[:16]]
+                return None
+            self._entries.move_to_end(digest[:16])
+        return dict(payload)
+
+    def put(self, token: str, payload: dict[str, Any]) -> None:
+        expires_at = payload.get("exp")
+        if not isinstance(expires_at, int | float) or self.max_size <= 0:
+            return
+        digest = hashlib.sha256(token.encode("utf-8")).digest()
+        with self._lock:
+            self._entries[digest[:16]] = (digest, dict(payload), float(expires_at))
+            self._entries.move_to_end(digest[:16])
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+token_cache = DecodedTokenCache(max_size=settings.TOKEN_CACHE_SIZE)
+
+
+def verify_token(token: str) -> dict[str, Any]:
+    """Verify and decode JWT token, reusing earlier verifications of it"""
+    payload = token_cache.get(token)
+    if payload is not None:
         return payload
+
+    try:
+        payload = key_ring.decode(token)
     except JWTError:
         return {}
 
+    token_cache.put(token, payload)
+    return payload
+
+
+def generate_refresh_token() -> str:
+    """Generate an opaque refresh token (only its hash is stored)"""
+    return secrets.token_urlsafe(48)
+
 
-# Optional: Add token type verification, expiration checks, etc. as needed
+def hash_refresh_token(token: str) -> str:
+    """Hash a refresh token for storage and lookup"""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
 
 
 def sanitize_password(password: str, max_length: int = 72) -> str:
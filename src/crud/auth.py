@@ -0,0 +1,123 @@
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from src.core.config import settings
+from src.core.security import generate_refresh_token, hash_refresh_token
+from src.models.auth import RefreshToken, RevokedToken
+
+
+# CRUD for RefreshToken
+class CRUDRefreshToken:
+    def get_by_token(self, db: Session, *, token: str) -> RefreshToken | None:
+        """Get refresh token row by the raw token value"""
+        return (
+            db.query(RefreshToken)
+            .filter(RefreshToken.token_hash == hash_refresh_token(token))
+            .first()
+        )
+
+    def _build(self, *, user_id: UUID) -> tuple[str, RefreshToken]:
+        raw_token = generate_refresh_token()
+        db_obj = RefreshToken(
+            user_id=user_id,
+            token_hash=hash_refresh_token(raw_token),
+            expires_at=datetime.utcnow()
+            + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+        )
+        return raw_token, db_obj
+
+    def issue(self, db: Session, *, user_id: UUID) -> tuple[str, RefreshToken]:
+        """Create a refresh token, returning the raw value and the stored row"""
+        raw_token, db_obj = self._build(user_id=user_id)
+        db.add(db_obj)
+        db.commit()
+        db.refresh(db_obj)
+        return raw_token, db_obj
+
+    def rotate(
+        self, db: Session, *, db_obj: RefreshToken
+    ) -> tuple[str, RefreshToken] | None:
+        """
+        Revoke a refresh token and issue its replacement in one commit.
+        Returns None if the token was revoked meanwhile (e.g. by a concurrent
+        rotation), which callers must treat as reuse.
+        """
+        revoked_at = datetime.utcnow()
+        # Conditional UPDATE: of concurrent rotations only one matches the row
+        revoked = (
+            db.query(RefreshToken)
+            .filter(RefreshToken.id == db_obj.id, RefreshToken.revoked_at.is_(None))
+            .update({RefreshToken.revoked_at: revoked_at}, synchronize_session=False)
+        )
+        if not revoked:
+            db.rollback()
+            return None
+
+        raw_token, new_obj = self._build(user_id=db_obj.user_id)
+        db.add(new_obj)
+        db.flush()
+
+        db_obj.revoked_at = revoked_at
+        db_obj.replaced_by_id = new_obj.id
+
+        db.commit()
+        db.refresh(new_obj)
+        return raw_token, new_obj
+
+    def revoke(self, db: Session, *, db_obj: RefreshToken) -> RefreshToken:
+        """Revoke a single refresh token"""
+        if db_obj.revoked_at is None:
+            db_obj.revoked_at = datetime.utcnow()
+            db.commit()
+        return db_obj
+
+    def revoke_all_for_user(self, db: Session, *, user_id: UUID) -> int:
+        """Revoke every active refresh token of a user (e.g. on token reuse)"""
+        count = (
+            db.query(RefreshToken)
+            .filter(RefreshToken.user_id == user_id, RefreshToken.revoked_at.is_(None))
+            .update({RefreshToken.revoked_at: datetime.utcnow()}, synchronize_session=False)
+        )
+        db.commit()
+        return count
+
+
+refresh_tokens = CRUDRefreshToken()
+
+
+# CRUD for RevokedToken
+class CRUDRevokedToken:
+    def revoke(self, db: Session, *, jti: str, expires_at: datetime) -> RevokedToken:
+        """Record an access token id as revoked"""
+        db_obj = db.get(RevokedToken, jti)
+        if db_obj is None:
+            db_obj = RevokedToken(jti=jti, expires_at=expires_at)
+            db.add(db_obj)
+            db.commit()
+        return db_obj
+
+    def get_active(
+        self, db: Session, *, since: datetime | None = None
+    ) -> list[tuple[str, datetime]]:
+        """Unexpired (jti, expires_at) pairs, optionally revoked after `since`"""
+        query = db.query(RevokedToken.jti, RevokedToken.expires_at).filter(
+            RevokedToken.expires_at > datetime.utcnow()
+        )
+        if since is not None:
+            query = query.filter(RevokedToken.revoked_at >= since)
+        return list(query.all())
+
+    def purge_expired(self, db: Session) -> int:
+        """Delete revocations of tokens that have expired anyway"""
+        count = (
+            db.query(RevokedToken)
+            .filter(RevokedToken.expires_at <= datetime.utcnow())
+            .delete(synchronize_session=False)
+        )
+        db.commit()
+        return count
+
+
+revoked_tokens = CRUDRevokedToken()
@@ -2,8 +2,11 @@ from typing import Any, Generic, TypeVar
 
 from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
-from sqlalchemy import asc, desc
+from sqlalchemy import Date, asc, desc
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import Session
+from sqlalchemy.sql.functions import FunctionElement
 
 from src.models.base import Base
 
@@ -12,6 +15,59 @@ CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 
 
+def insert_for(db: Session, model: type[Base]):
+    """
+    INSERT for ``model`` in the dialect of ``db``, for statements that need
+    ON CONFLICT (``on_conflict_do_nothing``/``on_conflict_do_update``)
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        return postgresql.insert(model)
+    if dialect == "sqlite":
+        return sqlite.insert(model)
+    raise NotImplementedError(f"ON CONFLICT is not supported on {dialect}")
+
+
+class greatest(FunctionElement):
+    """GREATEST(a, b), ignoring a NULL argument as PostgreSQL does"""
+
+    name = "greatest"
+    inherit_cache = True
+
+
+@compiles(greatest)
+def _compile_greatest(element, compiler, **kw):
+    return f"GREATEST({compiler.process(element.clauses, **kw)})"
+
+
+@compiles(greatest, "sqlite")
+def _compile_greatest_sqlite(element, compiler, **kw):
+    # SQLite's max() returns NULL if any argument is NULL
+    a, b = (compiler.process(clause, **kw) for clause in element.clauses)
+    return f"max(coalesce({a}, {b}), coalesce({b}, {a}))"
+
+
+class week_start(FunctionElement):
+    """The Monday of the ISO week of a date"""
+
+    name = "week_start"
+    type = Date()
+    inherit_cache = True
+
+
+@compiles(week_start)
+def _compile_week_start(element, compiler, **kw):
+    return (
+        f"CAST(date_trunc('week', {compiler.process(element.clauses, **kw)}) AS DATE)"
+    )
+
+
+@compiles(week_start, "sqlite")
+def _compile_week_start_sqlite(element, compiler, **kw):
+    # Back six days, then forward to the next Monday (or stay on it)
+    return f"date({compiler.process(element.clauses, **kw)}, '-6 days', 'weekday 1')"
+
+
 class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     def __init__(self, model: type[ModelType]):
         """
@@ -1,7 +1,8 @@
 from typing import List, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import and_, or_, desc, func
 
+from src.models.base import normalized_contains
 from src.models.classification import ClassificationType, ClassificationValue
 from src.schemas.classification import (
     ClassificationTypeCreate, 
@@ -16,6 +17,15 @@ class ClassificationTypeCRUD:
     def get(self, db: Session, id: int) -> Optional[ClassificationType]:
         return db.query(ClassificationType).filter(ClassificationType.id == id).first()
 
+    def get_with_values(self, db: Session, id: int) -> Optional[ClassificationType]:
+        """Get a type with its values, loaded in one extra query in display order"""
+        return (
+            db.query(ClassificationType)
+            .options(selectinload(ClassificationType.classification_values))
+            .filter(ClassificationType.id == id)
+            .first()
+        )
+
     def get_multi(
         self, 
         db: Session, 
@@ -23,15 +33,21 @@ class ClassificationTypeCRUD:
         limit: int = 100,
         search: Optional[str] = None,
         applies_to: Optional[str] = None
-    ) -> tuple[List[ClassificationType], int]:
+    ) -> tuple[List[tuple[ClassificationType, int]], int]:
+        """
+        Get a page of types, each paired with its number of values.
+
+        The counts come from a grouped subquery joined in the same statement,
+        so no values are loaded.
+        """
         query = db.query(ClassificationType)
         
         # Apply filters
         if search:
             query = query.filter(
                 or_(
-                    ClassificationType.name.ilike(f"%{search}%"),
-                    ClassificationType.description.ilike(f"%{search}%")
+                    normalized_contains(ClassificationType.name_normalized, search),
+                    normalized_contains(ClassificationType.description_normalized, search)
                 )
             )
         
@@ -40,11 +56,24 @@ class ClassificationTypeCRUD:
         
         # Get total count
         total = query.count()
-        
+
+        value_counts = (
+            db.query(
+                ClassificationValue.classification_type_id.label("type_id"),
+                func.count(ClassificationValue.id).label("value_count")
+            )
+            .group_by(ClassificationValue.classification_type_id)
+            .subquery()
+        )
+        query = (
+            query.outerjoin(value_counts, value_counts.c.type_id == ClassificationType.id)
+            .add_columns(func.coalesce(value_counts.c.value_count, 0))
+        )
+
         # Apply pagination and ordering
         results = query.order_by(desc(ClassificationType.created_at)).offset(skip).limit(limit).all()
-        
-        return results, total
+
+        return list(results), total
 
     def create(self, db: Session, obj_in: ClassificationTypeCreate) -> ClassificationType:
         db_obj = ClassificationType(**obj_in.dict())
@@ -97,8 +126,8 @@ class ClassificationValueCRUD:
         if search:
             query = query.filter(
                 or_(
-                    ClassificationValue.value.ilike(f"%{search}%"),
-                    ClassificationValue.description.ilike(f"%{search}%")
+                    normalized_contains(ClassificationValue.value_normalized, search),
+                    normalized_contains(ClassificationValue.description_normalized, search)
                 )
             )
         
@@ -1,7 +1,20 @@
+from collections.abc import Mapping, Sequence
+from datetime import datetime
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import or_
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import (
+    String,
+    and_,
+    case,
+    func,
+    literal,
+    null,
+    select,
+    tuple_,
+    union_all,
+)
+from sqlalchemy.orm import Query, Session, load_only, selectinload
 
 from src.models.exercise import (
     ContractionType,
@@ -12,6 +25,7 @@ from src.models.exercise import (
     MuscleGroup,
     Position,
 )
+from src.models.user import User
 
 # En src/crud/exercise.py, cambia esta línea:
 from src.schemas.exercise import (
@@ -30,6 +44,7 @@ from src.schemas.exercise import (
     PositionCreate,
     PositionUpdate,
 )
+from src.services import exercise_search
 
 from .base import CRUDBase
 
@@ -103,20 +118,36 @@ contraction_type = CRUDContractionType(ContractionType)
 
 
 # CRUD for Exercise
+# Many-to-one relations to the lookup tables
+EXERCISE_LOOKUPS = (
+    "category",
+    "movement_type",
+    "muscle_group",
+    "equipment",
+    "position",
+    "contraction_type",
+)
+
+# Lookups the exercise browser can facet on
+EXERCISE_FACETS = (
+    "category",
+    "muscle_group",
+    "equipment",
+    "position",
+    "contraction_type",
+)
+
+
 class CRUDExercise(CRUDBase[Exercise, ExerciseCreate, ExerciseUpdate]):
-    def get_with_relations(self, db: Session, *, id: int) -> Exercise | None:
-        """Get exercise with all relations"""
+    def get_with_relations(
+        self, db: Session, *, id: int, relations: Sequence[str] | None = None
+    ) -> Exercise | None:
+        """Get exercise with all relations, or only ``relations``"""
+        if relations is None:
+            relations = (*EXERCISE_LOOKUPS, "coach_user")
         return (
             db.query(Exercise)
-            .options(
-                joinedload(Exercise.category),
-                joinedload(Exercise.movement_type),
-                joinedload(Exercise.muscle_group),
-                joinedload(Exercise.equipment),
-                joinedload(Exercise.position),
-                joinedload(Exercise.contraction_type),
-                joinedload(Exercise.coach_user),
-            )
+            .options(*self._load_options(relations=relations))
             .filter(Exercise.id == id)
             .first()
         )
@@ -131,16 +162,92 @@ class CRUDExercise(CRUDBase[Exercise, ExerciseCreate, ExerciseUpdate]):
         category_id: int | None = None,
         muscle_group_id: int | None = None,
         equipment_id: int | None = None,
+        position_id: int | None = None,
+        contraction_type_id: int | None = None,
+        columns: Sequence[str] | None = None,
+        relations: Sequence[str] | None = None,
     ) -> list[Exercise]:
-        """Get exercises with relations and optional filters"""
+        """
+        Get exercises with relations and optional filters.
+
+        ``columns`` restricts the loaded columns and ``relations`` replaces
+        the default set of eagerly loaded relationships.
+        """
+        if relations is None:
+            relations = ("category", "muscle_group", "equipment", "coach_user")
         query = db.query(Exercise).options(
-            joinedload(Exercise.category),
-            joinedload(Exercise.muscle_group),
-            joinedload(Exercise.equipment),
-            joinedload(Exercise.coach_user),
+            *self._load_options(columns=columns, relations=relations)
+        )
+        query = self._apply_filters(
+            query,
+            coach_id=coach_id,
+            category_id=category_id,
+            muscle_group_id=muscle_group_id,
+            equipment_id=equipment_id,
+            position_id=position_id,
+            contraction_type_id=contraction_type_id,
         )
 
-        # Apply filters
+        return query.offset(skip).limit(limit).all()
+
+    def get_many_with_relations(
+        self,
+        db: Session,
+        *,
+        ids: Sequence[int],
+        columns: Sequence[str] | None = None,
+        relations: Sequence[str] = (),
+    ) -> list[Exercise]:
+        """Exercises with the given ids, in the order of ``ids``"""
+        rows = (
+            db.query(Exercise)
+            .options(*self._load_options(columns=columns, relations=relations))
+            .filter(Exercise.id.in_(ids))
+            .all()
+        )
+        by_id = {row.id: row for row in rows}
+        return [by_id[id] for id in ids if id in by_id]
+
+    def _load_options(
+        self,
+        *,
+        columns: Sequence[str] | None = None,
+        relations: Sequence[str] = (),
+    ) -> list:
+        """
+        Loader options for ``columns`` and ``relations``.
+
+        Relations are loaded with one extra ``IN`` query each rather than
+        joined, so the page query stays a plain ``LIMIT``/``OFFSET`` over
+        exercises. The coach is reduced to its id and name.
+        """
+        options = []
+        for name in relations:
+            option = selectinload(getattr(Exercise, name))
+            if name == "coach_user":
+                option = option.load_only(User.id, User.name)
+            options.append(option)
+        if columns is not None:
+            # The foreign keys are needed to match the related rows
+            keys = dict.fromkeys(columns)
+            for name in relations:
+                for column in getattr(Exercise, name).property.local_columns:
+                    keys.setdefault(column.key)
+            options.append(load_only(*(getattr(Exercise, name) for name in keys)))
+        return options
+
+    def _apply_filters(
+        self,
+        query: Query,
+        *,
+        coach_id: UUID | None = None,
+        category_id: int | None = None,
+        muscle_group_id: int | None = None,
+        equipment_id: int | None = None,
+        position_id: int | None = None,
+        contraction_type_id: int | None = None,
+        search: str | None = None,
+    ) -> Query:
         if coach_id:
             query = query.filter(Exercise.coach_id == coach_id)
         if category_id:
@@ -149,27 +256,132 @@ class CRUDExercise(CRUDBase[Exercise, ExerciseCreate, ExerciseUpdate]):
             query = query.filter(Exercise.muscle_group_id == muscle_group_id)
         if equipment_id:
             query = query.filter(Exercise.equipment_id == equipment_id)
-
-        return query.offset(skip).limit(limit).all()
+        if position_id:
+            query = query.filter(Exercise.position_id == position_id)
+        if contraction_type_id:
+            query = query.filter(Exercise.contraction_type_id == contraction_type_id)
+        if search:
+            hits = exercise_search.matches(query.session, search)
+            query = query.filter(Exercise.id.in_(select(hits.c.id)))
+        return query
 
     def search_exercises(
-        self, db: Session, *, query: str, skip: int = 0, limit: int = 100
+        self,
+        db: Session,
+        *,
+        query: str,
+        skip: int = 0,
+        limit: int = 100,
+        columns: Sequence[str] | None = None,
+        relations: Sequence[str] = (),
+        **filters: Any,
     ) -> list[Exercise]:
-        """Search exercises by name or description"""
-        return (
+        """
+        Full-text search on name, short name and description, best match
+        first, optionally narrowed by the ``_apply_filters`` filters.
+        """
+        hits = exercise_search.matches(db, query)
+        results = (
             db.query(Exercise)
-            .filter(
-                or_(
-                    Exercise.name.ilike(f"%{query}%"),
-                    Exercise.short_name.ilike(f"%{query}%"),
-                    Exercise.description.ilike(f"%{query}%"),
-                )
-            )
+            .options(*self._load_options(columns=columns, relations=relations))
+            .join(hits, hits.c.id == Exercise.id)
+        )
+        return (
+            self._apply_filters(results, **filters)
+            .order_by(hits.c.rank.desc(), Exercise.id)
             .offset(skip)
             .limit(limit)
             .all()
         )
 
+    def get_facet_counts(
+        self, db: Session, *, facets: Mapping[str, int | None], **filters: Any
+    ) -> tuple[int, dict[str, dict[int, int]]]:
+        """
+        Total of the filtered set and, per facet in ``EXERCISE_FACETS``, the
+        number of matches for each of its values, in one statement.
+
+        ``facets`` holds the selected value of each facet. A facet is
+        counted with every filter but its own, so the alternatives to a
+        selected value keep their counts. ``filters`` (coach, search) apply
+        to everything. PostgreSQL groups with GROUPING SETS; other
+        databases run the same groupings as a UNION ALL.
+        """
+        selected = {
+            name: getattr(Exercise, f"{name}_id") == value
+            for name, value in facets.items()
+            if value
+        }
+
+        def matching(excluded: str | None = None):
+            conditions = [c for name, c in selected.items() if name != excluded]
+            if not conditions:
+                return func.count(Exercise.id)
+            return func.count(case((and_(*conditions), Exercise.id)))
+
+        columns = [getattr(Exercise, f"{name}_id") for name in EXERCISE_FACETS]
+        if db.get_bind().dialect.name == "postgresql":
+            # grouping() sets one bit per column left out of the row's set,
+            # first column highest; the grand total leaves out all of them
+            grouping = func.grouping(*columns)
+            masks = {
+                name: (1 << len(columns)) - 1 - (1 << (len(columns) - 1 - i))
+                for i, name in enumerate(EXERCISE_FACETS)
+            }
+            query = db.query(
+                case(
+                    {mask: name for name, mask in masks.items()}, value=grouping
+                ).label("facet"),
+                func.coalesce(*columns).label("value"),
+                case(
+                    {mask: matching(name) for name, mask in masks.items()},
+                    value=grouping,
+                    else_=matching(),
+                ).label("count"),
+            ).group_by(
+                func.grouping_sets(*(tuple_(column) for column in columns), tuple_())
+            )
+            rows = self._apply_filters(query, **filters).all()
+        else:
+            branches = [
+                self._apply_filters(
+                    db.query(
+                        literal(name, String).label("facet"),
+                        column.label("value"),
+                        matching(name).label("count"),
+                    ),
+                    **filters,
+                )
+                .group_by(column)
+                .statement
+                for name, column in zip(EXERCISE_FACETS, columns, strict=True)
+            ]
+            total = self._apply_filters(
+                db.query(null(), null(), matching()), **filters
+            ).statement
+            rows = db.execute(union_all(*branches, total)).all()
+
+        total = 0
+        counts: dict[str, dict[int, int]] = {name: {} for name in EXERCISE_FACETS}
+        for facet, value, count in rows:
+            if facet is None:
+                total = count
+            elif value is not None and count:
+                counts[facet][value] = count
+        return total, counts
+
+    def get_version(self, db: Session, *, id: int) -> datetime | None:
+        """updated_at of one exercise, without loading the row"""
+        return db.query(Exercise.updated_at).filter(Exercise.id == id).scalar()
+
+    def get_list_version(
+        self, db: Session, **filters: Any
+    ) -> tuple[int, datetime | None]:
+        """Row count and latest updated_at of the filtered set"""
+        query = db.query(func.count(Exercise.id), func.max(Exercise.updated_at))
+        count, last_updated = self._apply_filters(query, **filters).one()
+        return count, last_updated
+
     def get_by_coach(
         self, db: Session, *, coach_id: UUID, skip: int = 0, limit: int = 100
     ) -> list[Exercise]:
@@ -1,17 +1,31 @@
 from __future__ import annotations
 
+from collections.abc import Collection, Iterable, Sequence
+from datetime import date, datetime, timedelta
 from typing import List, Optional
 
-from sqlalchemy import and_, or_
-from sqlalchemy.orm import Session
-
-from src.models.plan import Plan, WorkoutExercise, WorkoutSession
+from sqlalchemy import and_, bindparam, case, delete, func, or_, select, update
+from sqlalchemy.orm import Query, Session, load_only, selectinload
+
+from src.crud.base import greatest, insert_for, week_start
+from src.models.exercise import Exercise
+from src.models.plan import (
+    ExerciseProgress,
+    Plan,
+    SyncOperation,
+    WeeklyVolume,
+    WorkoutExercise,
+    WorkoutSession,
+    parsed_values,
+)
+from src.models.user import User
 from src.schemas.plan import (
     PlanCreate,
     PlanUpdate,
     WorkoutSessionCreate,
     WorkoutSessionUpdate,
 )
+from src.schemas.workout import WorkoutSessionComplete, WorkoutSetLog
 
 
 class PlanCRUD:
@@ -29,23 +43,119 @@ class PlanCRUD:
         skip: int = 0,
         limit: int = 100,
         coach_id: Optional[str] = None,
-        is_public: Optional[bool] = None
+        is_public: Optional[bool] = None,
+        columns: Optional[Sequence[str]] = None,
+        relations: Optional[Sequence[str]] = None
     ) -> list[Plan]:
-        """Get multiple plans with optional filters."""
-        query = self.db.query(Plan)
+        """
+        Get multiple plans with optional filters and column projection.
+
+        Sessions and their exercises are loaded unless ``relations`` says
+        otherwise.
+        """
+        query = self._apply_filters(
+            self.db.query(Plan), coach_id=coach_id, is_public=is_public
+        )
+        query = query.options(*self._load_options(columns, relations))
+        return query.offset(skip).limit(limit).all()
 
+    def get_detail(
+        self,
+        plan_id: int,
+        sessions: bool = True,
+        exercises: bool = True
+    ) -> Optional[Plan]:
+        """
+        Get a plan with its sessions and their exercises.
+
+        Each level is one ``SELECT ... IN`` query, so a plan costs at most
+        three queries however many sessions it has. ``sessions=False`` or
+        ``exercises=False`` leave the nested levels unloaded.
+        """
+        query = self.db.query(Plan).filter(Plan.id == plan_id)
+        if sessions:
+            loader = selectinload(Plan.workout_sessions)
+            if exercises:
+                loader = loader.selectinload(WorkoutSession.workout_exercises)
+            query = query.options(loader)
+        return query.first()
+
+    def _load_options(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        relations: Optional[Sequence[str]] = None
+    ) -> list:
+        if relations is None:
+            relations = ("workout_sessions",)
+        options = []
+        if columns is not None:
+            options.append(load_only(*(getattr(Plan, name) for name in columns)))
+        if "workout_sessions" in relations:
+            # Session responses embed their exercises
+            options.append(
+                selectinload(Plan.workout_sessions)
+                .selectinload(WorkoutSession.workout_exercises)
+            )
+        return options
+
+    def _apply_filters(
+        self,
+        query: Query,
+        coach_id: Optional[str] = None,
+        is_public: Optional[bool] = None
+    ) -> Query:
         if coach_id:
             query = query.filter(Plan.coach_id == coach_id)
 
         if is_public is not None:
             query = query.filter(Plan.is_public == is_public)
 
-        return query.offset(skip).limit(limit).all()
+        return query
+
+    def touch(self, plan_ids: Iterable[int]) -> None:
+        """
+        Bump updated_at of plans whose sessions or exercises were changed
+        with bulk statements, which skip touch_parent_plans.
+        """
+        plan_ids = set(plan_ids)
+        plan_ids.discard(None)
+        if plan_ids:
+            self.db.execute(
+                update(Plan)
+                .where(Plan.id.in_(plan_ids))
+                .values(updated_at=datetime.utcnow())
+            )
+
+    def get_version(self, plan_id: int) -> Optional[datetime]:
+        """Get a plan's updated_at without loading it."""
+        return (
+            self.db.query(Plan.updated_at).filter(Plan.id == plan_id).scalar()
+        )
 
-    def get_by_user(self, user_id: str, skip: int = 0, limit: int = 100) -> list[Plan]:
+    def get_list_version(
+        self,
+        coach_id: Optional[str] = None,
+        is_public: Optional[bool] = None
+    ) -> tuple[int, Optional[datetime]]:
+        """Get row count and latest updated_at of the filtered plans."""
+        query = self.db.query(func.count(Plan.id), func.max(Plan.updated_at))
+        count, last_updated = self._apply_filters(
+            query, coach_id=coach_id, is_public=is_public
+        ).one()
+        return count, last_updated
+
+    def get_by_user(
+        self,
+        user_id: str,
+        skip: int = 0,
+        limit: int = 100,
+        columns: Optional[Sequence[str]] = None,
+        relations: Optional[Sequence[str]] = None
+    ) -> list[Plan]:
         """Get plans created by a specific user."""
         return (
             self.db.query(Plan)
+            .options(*self._load_options(columns, relations))
             .filter(Plan.coach_id == user_id)
             .offset(skip)
             .limit(limit)
@@ -56,6 +166,7 @@ class PlanCRUD:
         """Get public plans."""
         return (
             self.db.query(Plan)
+            .options(*self._load_options())
             .filter(Plan.is_public == True)
             .offset(skip)
             .limit(limit)
@@ -146,10 +257,27 @@ class WorkoutSessionCRUD:
 
         return query.offset(skip).limit(limit).all()
 
-    def get_by_plan(self, plan_id: int, skip: int = 0, limit: int = 100) -> list[WorkoutSession]:
-        """Get workout sessions for a specific plan."""
+    def get_by_plan(
+        self,
+        plan_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        columns: Optional[Sequence[str]] = None,
+        relations: Optional[Sequence[str]] = None
+    ) -> list[WorkoutSession]:
+        """Get workout sessions for a specific plan, with their exercises by default."""
+        if relations is None:
+            relations = ("workout_exercises",)
+        options = []
+        if columns is not None:
+            options.append(
+                load_only(*(getattr(WorkoutSession, name) for name in columns))
+            )
+        if "workout_exercises" in relations:
+            options.append(selectinload(WorkoutSession.workout_exercises))
         return (
             self.db.query(WorkoutSession)
+            .options(*options)
             .filter(WorkoutSession.plan_id == plan_id)
             .order_by(WorkoutSession.date)
             .offset(skip)
@@ -168,6 +296,105 @@ class WorkoutSessionCRUD:
             .all()
         )
 
+    def calendar(self, client_id, date_from: date, date_to: date) -> list[dict]:
+        """
+        Sessions of a client dated in [date_from, date_to] with their
+        exercises and exercise names, grouped per day, from one range query.
+        """
+        exercise_columns = (
+            WorkoutExercise.id,
+            WorkoutExercise.exercise_id,
+            Exercise.name,
+            WorkoutExercise.sets_planned,
+            WorkoutExercise.reps_planned,
+            WorkoutExercise.weight_planned,
+            WorkoutExercise.sets_done
+        )
+        rows = (
+            self.db.query(
+                WorkoutSession.date,
+                WorkoutSession.id,
+                WorkoutSession.plan_id,
+                WorkoutSession.completed,
+                *exercise_columns
+            )
+            .outerjoin(WorkoutExercise, WorkoutExercise.session_id == WorkoutSession.id)
+            .outerjoin(Exercise, Exercise.id == WorkoutExercise.exercise_id)
+            .filter(
+                WorkoutSession.client_id == client_id,
+                WorkoutSession.date >= date_from,
+                WorkoutSession.date <= date_to
+            )
+            .order_by(WorkoutSession.date, WorkoutSession.id, WorkoutExercise.id)
+            .all()
+        )
+
+        days: list[dict] = []
+        for day, session_id, plan_id, completed, *exercise in rows:
+            if not days or days[-1]["date"] != day:
+                days.append({"date": day, "sessions": []})
+            sessions = days[-1]["sessions"]
+            if not sessions or sessions[-1]["id"] != session_id:
+                sessions.append({
+                    "id": session_id,
+                    "plan_id": plan_id,
+                    "completed": bool(completed),
+                    "exercises": []
+                })
+            if exercise[0] is not None:  # Sessions without exercises
+                sessions[-1]["exercises"].append({
+                    column.key: value
+                    for column, value in zip(exercise_columns, exercise, strict=True)
+                })
+        return days
+
+    def adherence(self, coach_id, today: date) -> list:
+        """
+        Per client of a coach: sessions planned and completed in the last 7
+        and 30 days, date of the last completed one and current streak
+        (sessions completed since the last missed one), in one grouped query.
+        """
+        clients = (User.coach_id == coach_id, User.role_id.in_([3, 4, 5]))  # Client roles
+        completed = WorkoutSession.completed.is_(True)
+        last_missed = (
+            select(WorkoutSession.client_id, func.max(WorkoutSession.date).label("date"))
+            .join(User, User.id == WorkoutSession.client_id)
+            .where(*clients, WorkoutSession.completed.isnot(True), WorkoutSession.date < today)
+            .group_by(WorkoutSession.client_id)
+            .subquery()
+        )
+        week = WorkoutSession.date > today - timedelta(days=7)
+        month = WorkoutSession.date > today - timedelta(days=30)
+
+        def count(*criteria):
+            return func.count(case((and_(*criteria), 1)))
+
+        return (
+            self.db.query(
+                User.id.label("client_id"),
+                User.name,
+                count(week).label("planned_7d"),
+                count(week, completed).label("completed_7d"),
+                count(month).label("planned_30d"),
+                count(month, completed).label("completed_30d"),
+                func.max(case((completed, WorkoutSession.date))).label("last_workout"),
+                count(
+                    completed,
+                    or_(last_missed.c.date.is_(None), WorkoutSession.date > last_missed.c.date)
+                ).label("streak")
+            )
+            .select_from(User)
+            .outerjoin(
+                WorkoutSession,
+                and_(WorkoutSession.client_id == User.id, WorkoutSession.date <= today)
+            )
+            .outerjoin(last_missed, last_missed.c.client_id == User.id)
+            .filter(*clients)
+            .group_by(User.id, User.name)
+            .order_by(User.name, User.id)
+            .all()
+        )
+
     def create(self, session_data: WorkoutSessionCreate) -> WorkoutSession:
         """Create a new workout session."""
         session = WorkoutSession(
@@ -188,10 +415,14 @@ class WorkoutSessionCRUD:
         if not session:
             return None
 
+        weeks = [(session.client_id, session.date)]
         update_data = session_data.dict(exclude_unset=True)
         for field, value in update_data.items():
             setattr(session, field, value)
 
+        weeks.append((session.client_id, session.date))
+        self.db.flush()
+        WeeklyVolumeCRUD(self.db).refresh(weeks)
         self.db.commit()
         self.db.refresh(session)
         return session
@@ -203,17 +434,70 @@ class WorkoutSessionCRUD:
             return None
 
         session.completed = True
+        ExerciseProgressCRUD(self.db).record(
+            (
+                session.client_id,
+                exercise.exercise_id,
+                exercise.weight_used_kg,
+                exercise.reps_done_total,
+                session.date
+            )
+            for exercise in session.workout_exercises
+        )
+        self.db.flush()
+        WeeklyVolumeCRUD(self.db).refresh([(session.client_id, session.date)])
         self.db.commit()
         self.db.refresh(session)
         return session
 
+    def complete_many(
+        self,
+        completions: Sequence[WorkoutSessionComplete],
+        *criteria
+    ) -> dict[int, Optional[int]]:
+        """
+        Mark the sessions of ``completions`` that match ``criteria`` as
+        completed with one locking SELECT and one executemany UPDATE, keeping
+        the stored notes where a completion has none. Does not commit.
+
+        Returns the plan id of each completed session, by session id.
+        """
+        ids = {completion.session_id for completion in completions}
+        rows = (
+            self.db.query(WorkoutSession.id, WorkoutSession.plan_id)
+            .filter(WorkoutSession.id.in_(ids), *criteria)
+            .with_for_update()
+            .all()
+        )
+        found = {row.id: row.plan_id for row in rows}
+        params = [
+            {"b_id": completion.session_id, "b_notes": completion.notes}
+            for completion in completions
+            if completion.session_id in found
+        ]
+        if params:
+            table = WorkoutSession.__table__
+            self.db.execute(
+                table.update()
+                .where(table.c.id == bindparam("b_id"))
+                .values(
+                    completed=True,
+                    notes=func.coalesce(bindparam("b_notes"), table.c.notes)
+                ),
+                params
+            )
+        return found
+
     def delete(self, session_id: int) -> bool:
         """Delete a workout session."""
         session = self.get(session_id)
         if not session:
             return False
 
+        week = (session.client_id, session.date)
         self.db.delete(session)
+        self.db.flush()
+        WeeklyVolumeCRUD(self.db).refresh([week])
         self.db.commit()
         return True
 
@@ -308,22 +592,457 @@ class WorkoutExerciseCRUD:
         if time_spent is not None:
             exercise.time_spent = time_spent
 
+        workout_session = exercise.session
+        if workout_session is not None and workout_session.completed:
+            self.db.flush()
+            WeeklyVolumeCRUD(self.db).refresh(
+                [(workout_session.client_id, workout_session.date)]
+            )
         self.db.commit()
         self.db.refresh(exercise)
         return exercise
 
+    def log_sets(
+        self,
+        workout_session: WorkoutSession,
+        entries: Sequence[WorkoutSetLog]
+    ) -> Optional[list[dict]]:
+        """
+        Apply a batch of logged sets to a session's exercises in one transaction.
+
+        The affected rows are read with one locking SELECT and written back
+        with one executemany UPDATE. Exercise progress is then folded in
+        (see ExerciseProgressCRUD.record_performed), the week's volume
+        recomputed if the session is completed (see WeeklyVolumeCRUD) and
+        the plan's updated_at bumped (see PlanCRUD.touch).
+
+        Returns the new progress of each affected exercise, or None (and
+        writes nothing) if an entry names an exercise outside the session.
+        """
+        ids = {entry.workout_exercise_id for entry in entries}
+        progress, plan_ids = self.load_progress(
+            ids, WorkoutExercise.session_id == workout_session.id
+        )
+        if len(progress) != len(ids):
+            self.db.rollback()
+            return None
+
+        self.merge_sets(progress, entries)
+        self.write_progress(progress)
+        ExerciseProgressCRUD(self.db).record_performed(WorkoutExercise.id.in_(ids))
+        if workout_session.completed:
+            WeeklyVolumeCRUD(self.db).refresh(
+                [(workout_session.client_id, workout_session.date)]
+            )
+        PlanCRUD(self.db).touch(plan_ids)
+        self.db.commit()
+        return list(progress.values())
+
+    def load_progress(
+        self,
+        ids: Collection[int],
+        *criteria
+    ) -> tuple[dict[int, dict], set[int]]:
+        """
+        Progress columns of the exercises in ``ids`` matching ``criteria``,
+        by id and locked for update, and the plans they belong to.
+        Criteria may refer to WorkoutSession.
+        """
+        rows = (
+            self.db.query(
+                WorkoutExercise.id,
+                WorkoutExercise.sets_done,
+                WorkoutExercise.reps_done,
+                WorkoutExercise.weight_used,
+                WorkoutSession.plan_id
+            )
+            .join(WorkoutSession, WorkoutSession.id == WorkoutExercise.session_id)
+            .filter(WorkoutExercise.id.in_(ids), *criteria)
+            .with_for_update(of=WorkoutExercise)
+            .all()
+        )
+        progress = {
+            row.id: {
+                "id": row.id,
+                "sets_done": row.sets_done or 0,
+                "reps_done": list(row.reps_done or []),
+                "weight_used": row.weight_used
+            }
+            for row in rows
+        }
+        return progress, {row.plan_id for row in rows}
+
+    @staticmethod
+    def merge_sets(progress: dict[int, dict], entries: Iterable[WorkoutSetLog]) -> None:
+        """
+        Record each entry's ``reps_completed`` as its set's reps in reps_done,
+        raise sets_done to its set_number and, if given, replace weight_used.
+        Later entries for the same set win. There is no column for per-set
+        notes, so they are not stored.
+        """
+        for entry in entries:
+            values = progress[entry.workout_exercise_id]
+            reps = values["reps_done"]
+            if len(reps) < entry.set_number:
+                reps.extend([0] * (entry.set_number - len(reps)))
+            reps[entry.set_number - 1] = entry.reps_completed
+            values["sets_done"] = max(values["sets_done"], entry.set_number)
+            if entry.weight_used is not None:
+                values["weight_used"] = entry.weight_used
+
+    def write_progress(self, progress: dict[int, dict]) -> None:
+        """Write merged progress back with one executemany UPDATE."""
+        if progress:
+            self.db.execute(
+                update(WorkoutExercise),
+                [{**values, **parsed_values(values)} for values in progress.values()]
+            )
+
     def delete(self, exercise_id: int) -> bool:
         """Delete a workout exercise."""
         exercise = self.get(exercise_id)
         if not exercise:
             return False
 
+        workout_session = exercise.session
         self.db.delete(exercise)
+        self.db.flush()
+        if workout_session is not None and workout_session.completed:
+            WeeklyVolumeCRUD(self.db).refresh(
+                [(workout_session.client_id, workout_session.date)]
+            )
         self.db.commit()
         return True
 
 
+class ExerciseProgressCRUD:
+    """CRUD operations for ExerciseProgress model (best and latest loads)."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_by_client(self, client_id) -> list[ExerciseProgress]:
+        """Progress of a client on every exercise they have loaded."""
+        return (
+            self.db.query(ExerciseProgress)
+            .filter(ExerciseProgress.client_id == client_id)
+            .order_by(ExerciseProgress.exercise_id)
+            .all()
+        )
+
+    def history(self, client_id, exercise_id: int) -> list:
+        """
+        (date, weight_used_kg, reps_done) of every time the client loaded
+        the exercise, oldest first.
+        """
+        return (
+            self.db.query(
+                WorkoutSession.date,
+                WorkoutExercise.weight_used_kg,
+                WorkoutExercise.reps_done
+            )
+            .join(WorkoutSession, WorkoutSession.id == WorkoutExercise.session_id)
+            .filter(
+                WorkoutSession.client_id == client_id,
+                WorkoutExercise.exercise_id == exercise_id,
+                WorkoutExercise.weight_used_kg.isnot(None),
+                WorkoutExercise.reps_done_total > 0
+            )
+            .order_by(WorkoutSession.date, WorkoutExercise.id)
+            .all()
+        )
+
+    def _performed(self):
+        return (
+            self.db.query(
+                WorkoutSession.client_id,
+                WorkoutExercise.exercise_id,
+                WorkoutExercise.weight_used_kg,
+                WorkoutExercise.reps_done_total,
+                WorkoutSession.date
+            )
+            .join(WorkoutSession, WorkoutSession.id == WorkoutExercise.session_id)
+            .filter(
+                WorkoutSession.client_id.isnot(None),
+                WorkoutExercise.weight_used_kg.isnot(None),
+                WorkoutExercise.reps_done_total > 0
+            )
+        )
+
+    def record_performed(self, *criteria) -> None:
+        """
+        Fold the workout exercises matching ``criteria`` into the progress
+        rows: one SELECT and one upsert (see ``record``). Criteria may refer
+        to WorkoutSession. Does not commit.
+        """
+        self.record(self._performed().filter(*criteria).all())
+
+    def record(self, rows: Iterable) -> None:
+        """
+        Fold performed exercises, as (client_id, exercise_id, weight_used_kg,
+        reps_done_total, date, ...) rows, into the progress rows with one
+        INSERT ... ON CONFLICT DO UPDATE. Only exercises with a load in kg
+        and at least one rep done count; loads are stored rounded to whole
+        kilograms. The best load only ever rises: lowering a logged weight
+        takes a ``rebuild``. Does not commit.
+        """
+        merged = {}
+        for client_id, exercise_id, weight_kg, reps_total, session_date, *_ in rows:
+            if client_id is None or weight_kg is None or not reps_total:
+                continue
+            weight_kg = round(weight_kg)
+            current = merged.get((client_id, exercise_id))
+            if current is None:
+                merged[client_id, exercise_id] = {
+                    "client_id": client_id,
+                    "exercise_id": exercise_id,
+                    "max_weight_lifted": weight_kg,
+                    "last_weight_used": weight_kg,
+                    "last_session_date": session_date
+                }
+                continue
+            current["max_weight_lifted"] = max(current["max_weight_lifted"], weight_kg)
+            if session_date >= current["last_session_date"]:
+                current["last_weight_used"] = weight_kg
+                current["last_session_date"] = session_date
+        if not merged:
+            return
+
+        table = ExerciseProgress.__table__
+        statement = insert_for(self.db, ExerciseProgress).values(list(merged.values()))
+        newer = or_(
+            table.c.last_session_date.is_(None),
+            statement.excluded.last_session_date >= table.c.last_session_date
+        )
+        self.db.execute(
+            statement.on_conflict_do_update(
+                index_elements=["client_id", "exercise_id"],
+                set_={
+                    "max_weight_lifted": greatest(
+                        table.c.max_weight_lifted, statement.excluded.max_weight_lifted
+                    ),
+                    "last_weight_used": case(
+                        (newer, statement.excluded.last_weight_used),
+                        else_=table.c.last_weight_used
+                    ),
+                    "last_session_date": greatest(
+                        table.c.last_session_date, statement.excluded.last_session_date
+                    )
+                }
+            )
+        )
+
+    def rebuild(self, chunk_size: int = 5000) -> int:
+        """
+        Recompute every progress row from the workout history, reading it in
+        ``chunk_size`` keyset pages, in one transaction.
+
+        Returns the number of progress rows.
+        """
+        self.db.query(ExerciseProgress).delete(synchronize_session=False)
+        last_id = 0
+        while True:
+            rows = (
+                self._performed()
+                .add_columns(WorkoutExercise.id)
+                .filter(WorkoutExercise.id > last_id)
+                .order_by(WorkoutExercise.id)
+                .limit(chunk_size)
+                .all()
+            )
+            if not rows:
+                break
+            self.record(rows)
+            last_id = rows[-1].id
+        self.db.commit()
+        return self.db.query(ExerciseProgress).count()
+
+
+class WeeklyVolumeCRUD:
+    """CRUD operations for WeeklyVolume model (per-week training volume rollups)."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_by_client(
+        self,
+        client_id,
+        date_from: date,
+        date_to: date,
+        muscle_group_id: Optional[int] = None
+    ) -> list[WeeklyVolume]:
+        """Volume of a client in the weeks overlapping [date_from, date_to]."""
+        query = self.db.query(WeeklyVolume).filter(
+            WeeklyVolume.client_id == client_id,
+            WeeklyVolume.week_start >= date_from - timedelta(days=date_from.weekday()),
+            WeeklyVolume.week_start <= date_to
+        )
+        if muscle_group_id is not None:
+            query = query.filter(WeeklyVolume.muscle_group_id == muscle_group_id)
+        return query.order_by(WeeklyVolume.week_start, WeeklyVolume.muscle_group_id).all()
+
+    def _rollup(self, *criteria):
+        """INSERT ... SELECT of the volume of completed sessions matching criteria."""
+        muscle_group_id = func.coalesce(Exercise.muscle_group_id, 0)
+        week = week_start(WorkoutSession.date)
+        reps = func.coalesce(WorkoutExercise.reps_done_total, 0)
+        rollup = (
+            select(
+                WorkoutSession.client_id,
+                week,
+                muscle_group_id,
+                func.sum(func.coalesce(WorkoutExercise.sets_done, 0)),
+                func.sum(reps),
+                func.sum(reps * func.coalesce(WorkoutExercise.weight_used_kg, 0.0))
+            )
+            .join(WorkoutSession, WorkoutSession.id == WorkoutExercise.session_id)
+            .outerjoin(Exercise, Exercise.id == WorkoutExercise.exercise_id)
+            .where(
+                WorkoutSession.completed.is_(True),
+                WorkoutSession.client_id.isnot(None),
+                *criteria
+            )
+            .group_by(WorkoutSession.client_id, week, muscle_group_id)
+        )
+        statement = insert_for(self.db, WeeklyVolume).from_select(
+            ["client_id", "week_start", "muscle_group_id", "sets", "reps", "tonnage_kg"],
+            rollup
+        )
+        # A concurrent refresh of the same week may have inserted first
+        return statement.on_conflict_do_update(
+            index_elements=["client_id", "week_start", "muscle_group_id"],
+            set_={
+                "sets": statement.excluded.sets,
+                "reps": statement.excluded.reps,
+                "tonnage_kg": statement.excluded.tonnage_kg
+            }
+        )
+
+    def refresh(self, sessions: Iterable[tuple]) -> None:
+        """
+        Recompute the weeks of ``sessions``, as (client_id, date) pairs, from
+        their completed sessions: one DELETE and one INSERT ... SELECT,
+        however many sessions changed. Does not commit.
+        """
+        weeks = {
+            (client_id, day - timedelta(days=day.weekday()))
+            for client_id, day in sessions
+            if client_id is not None and day is not None
+        }
+        if not weeks:
+            return
+        self.db.execute(
+            delete(WeeklyVolume).where(
+                or_(*(
+                    and_(WeeklyVolume.client_id == client_id, WeeklyVolume.week_start == monday)
+                    for client_id, monday in weeks
+                ))
+            )
+        )
+        self.db.execute(
+            self._rollup(
+                or_(*(
+                    and_(
+                        WorkoutSession.client_id == client_id,
+                        WorkoutSession.date >= monday,
+                        WorkoutSession.date < monday + timedelta(days=7)
+                    )
+                    for client_id, monday in weeks
+                ))
+            )
+        )
+
+    def rebuild(self) -> int:
+        """
+        Recompute every rollup row from the workout history with one
+        INSERT ... SELECT, in one transaction.
+
+        Returns the number of rollup rows.
+        """
+        self.db.execute(delete(WeeklyVolume))
+        self.db.execute(self._rollup())
+        self.db.commit()
+        return self.db.query(WeeklyVolume).count()
+
+
+class SyncOperationCRUD:
+    """CRUD operations for SyncOperation model (offline sync idempotency keys)."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def claim(self, user_id, operations: dict[str, str]) -> set[str]:
+        """
+        Record ``operations`` (operation name by idempotency key) for the
+        user with one INSERT ... ON CONFLICT DO NOTHING.
+
+        Returns the keys claimed now; the others were already recorded, by
+        an earlier request or a concurrent one that has since committed.
+        """
+        if not operations:
+            return set()
+        now = datetime.utcnow()
+        statement = (
+            insert_for(self.db, SyncOperation)
+            .values([
+                {
+                    "user_id": user_id,
+                    "idempotency_key": key,
+                    "operation": operation,
+                    "created_at": now
+                }
+                for key, operation in operations.items()
+            ])
+            .on_conflict_do_nothing(index_elements=["user_id", "idempotency_key"])
+            .returning(SyncOperation.idempotency_key)
+        )
+        return set(self.db.execute(statement).scalars())
+
+    def get_many(self, user_id, keys: Collection[str]) -> dict[str, SyncOperation]:
+        """Recorded operations of the user, by idempotency key."""
+        if not keys:
+            return {}
+        rows = (
+            self.db.query(SyncOperation)
+            .filter(
+                SyncOperation.user_id == user_id,
+                SyncOperation.idempotency_key.in_(keys)
+            )
+            .all()
+        )
+        return {row.idempotency_key: row for row in rows}
+
+    def store_results(self, user_id, results: dict[str, tuple[int, dict]]) -> None:
+        """
+        Save the status and response of claimed operations, by idempotency
+        key, with one executemany UPDATE. Does not commit.
+        """
+        if not results:
+            return
+        table = SyncOperation.__table__
+        self.db.execute(
+            table.update()
+            .where(
+                table.c.user_id == bindparam("b_user_id"),
+                table.c.idempotency_key == bindparam("b_key")
+            )
+            .values(status=bindparam("b_status"), response=bindparam("b_response")),
+            [
+                {
+                    "b_user_id": user_id,
+                    "b_key": key,
+                    "b_status": status_code,
+                    "b_response": response
+                }
+                for key, (status_code, response) in results.items()
+            ]
+        )
+
+
 # Create instances
 plan = PlanCRUD
 workout_session = WorkoutSessionCRUD
 workout_exercise = WorkoutExerciseCRUD
+exercise_progress = ExerciseProgressCRUD
+weekly_volume = WeeklyVolumeCRUD
+sync_operation = SyncOperationCRUD
@@ -6,6 +6,7 @@ from sqlalchemy import or_
 from sqlalchemy.orm import Session
 
 from src.core.security import get_password_hash, verify_password
+from src.models.base import normalized_contains
 from src.models.user import ClientProfile, CoachProfile, Role, User
 from src.schemas.auth import LoginRequest
 from src.schemas.user import (
@@ -124,10 +125,15 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
     def search_users(
         self, db: Session, *, query: str, skip: int = 0, limit: int = 100
     ) -> list[User]:
-        """Search users by name or email"""
+        """Search users by name (ignoring case and accents) or email"""
         return (
             db.query(User)
-            .filter(or_(User.name.ilike(f"%{query}%"), User.email.ilike(f"%{query}%")))
+            .filter(
+                or_(
+                    normalized_contains(User.name_normalized, query),
+                    User.email.icontains(query, autoescape=True),
+                )
+            )
             .offset(skip)
             .limit(limit)
             .all()
@@ -1,9 +1,43 @@
+import asyncio
+import contextlib
+from contextlib import asynccontextmanager
+
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from loguru import logger
 
 from src.api.v1.router import api_router
 from src.core.config import settings
+from src.services.exercise_autocomplete import warm_exercise_autocomplete
+from src.services.taxonomy_cache import warm_taxonomy_cache
+from src.services.token_revocation import load_revocations, run_revocation_sync
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm in-memory state at startup and keep it in sync while running"""
+    try:
+        load_revocations()
+    except Exception as exc:
+        logger.warning(f"Could not load token revocations at startup: {exc}")
+    try:
+        warm_taxonomy_cache()
+    except Exception as exc:  # Tables are loaded lazily on first request instead
+        logger.warning(f"Could not warm the taxonomy cache at startup: {exc}")
+    try:
+        warm_exercise_autocomplete()
+    except Exception as exc:  # Built on the first autocomplete request instead
+        logger.warning(f"Could not build the autocomplete index at startup: {exc}")
+
+    sync_task = asyncio.create_task(
+        run_revocation_sync(settings.TOKEN_REVOCATION_SYNC_SECONDS)
+    )
+    yield
+    sync_task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await sync_task
+
 
 # Create FastAPI app
 app = FastAPI(
@@ -12,6 +46,7 @@ app = FastAPI(
     openapi_url="/api/v1/openapi.json",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 # Set up CORS
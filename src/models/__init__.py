@@ -1,4 +1,5 @@
 # Import all models here so they're registered with SQLAlchemy Base
+from .auth import RefreshToken, RevokedToken
 from .base import Base, TimestampMixin
 from .classification import ClassificationType, ClassificationValue
 from .exercise import (
@@ -18,6 +19,8 @@ from .plan import (
     SharedExercise,
     SharedPlan,
     Subscription,
+    SyncOperation,
+    WeeklyVolume,
     WorkoutExercise,
     WorkoutSession,
 )
@@ -31,6 +34,8 @@ __all__ = [
     "User",
     "ClientProfile",
     "CoachProfile",
+    "RefreshToken",
+    "RevokedToken",
     "ClassificationType",
     "ClassificationValue",
     "Exercise",
@@ -48,5 +53,7 @@ __all__ = [
     "SharedExercise",
     "SharedPlan",
     "Subscription",
+    "SyncOperation",
+    "WeeklyVolume",
     "ClientAssessment",
 ]
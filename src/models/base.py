@@ -1,9 +1,10 @@
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime
+from sqlalchemy import DDL, Column, DateTime, Index, event, false
 from sqlalchemy.ext.declarative import declared_attr
 
 from ..core.database import Base as BaseModel
+from ..utils.text import normalize_text
 
 
 class Base(BaseModel):
@@ -24,3 +25,57 @@ class TimestampMixin:
     updated_at = Column(
         DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
     )
+
+
+class NormalizedColumnsMixin:
+    """
+    Mixin keeping ``<column>_normalized`` shadow columns for the columns
+    named in ``__normalized__``: casefolded, accent-free and with
+    punctuation collapsed (see normalize_text), recomputed on every insert
+    and update. Searches match these with LIKE so they stay accent
+    insensitive and can use trigram indexes.
+    """
+
+    __normalized__: tuple[str, ...] = ()
+
+
+def _update_normalized_columns(mapper, connection, target) -> None:
+    for source in target.__normalized__:
+        value = getattr(target, source)
+        normalized = normalize_text(value) if value is not None else None
+        setattr(target, f"{source}_normalized", normalized)
+
+
+event.listen(
+    NormalizedColumnsMixin, "before_insert", _update_normalized_columns, propagate=True
+)
+event.listen(
+    NormalizedColumnsMixin, "before_update", _update_normalized_columns, propagate=True
+)
+
+
+def normalized_contains(column, text: str):
+    """
+    Filter for a shadow ``column`` containing normalized ``text``; false if
+    ``text`` has nothing to match. Normalization strips LIKE wildcards.
+    """
+    needle = normalize_text(text)
+    return column.like(f"%{needle}%") if needle else false()
+
+
+def trigram_index(name: str, column: str) -> Index:
+    """GIN trigram index on PostgreSQL (serves LIKE/ILIKE '%...%'), plain elsewhere"""
+    return Index(
+        name,
+        column,
+        postgresql_using="gin",
+        postgresql_ops={column: "gin_trgm_ops"},
+    )
+
+
+# trigram_index needs pg_trgm before any table is created
+event.listen(
+    BaseModel.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
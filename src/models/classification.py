@@ -1,12 +1,17 @@
 from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 from sqlalchemy.sql import func
 
-from src.models.base import Base
+from src.models.base import Base, NormalizedColumnsMixin, trigram_index
 
 
-class ClassificationType(Base):
+class ClassificationType(NormalizedColumnsMixin, Base):
     __tablename__ = "classification_types"
+    __normalized__ = ("name", "description")
+    __table_args__ = (
+        trigram_index("ix_classification_types_name_trgm", "name_normalized"),
+        trigram_index("ix_classification_types_description_trgm", "description_normalized")
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(100), nullable=False, index=True)
@@ -16,15 +21,29 @@ class ClassificationType(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
+    # Search-only copies, see NormalizedColumnsMixin
+    name_normalized = deferred(Column(String(100)))
+    description_normalized = deferred(Column(Text))
+
     # Relationships
-    classification_values = relationship("ClassificationValue", back_populates="classification_type", cascade="all, delete-orphan")
+    classification_values = relationship(
+        "ClassificationValue",
+        back_populates="classification_type",
+        cascade="all, delete-orphan",
+        order_by="(ClassificationValue.order, ClassificationValue.id)"
+    )
 
     def __repr__(self):
         return f"<ClassificationType(id={self.id}, name='{self.name}', applies_to='{self.applies_to}')>"
 
 
-class ClassificationValue(Base):
+class ClassificationValue(NormalizedColumnsMixin, Base):
     __tablename__ = "classification_values"
+    __normalized__ = ("value", "description")
+    __table_args__ = (
+        trigram_index("ix_classification_values_value_trgm", "value_normalized"),
+        trigram_index("ix_classification_values_description_trgm", "description_normalized")
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     classification_type_id = Column(Integer, ForeignKey("classification_types.id"), nullable=False)
@@ -34,6 +53,10 @@ class ClassificationValue(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
+    # Search-only copies, see NormalizedColumnsMixin
+    value_normalized = deferred(Column(String(100)))
+    description_normalized = deferred(Column(Text))
+
     # Relationships
     classification_type = relationship("ClassificationType", back_populates="classification_values")
 
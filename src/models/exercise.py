@@ -1,10 +1,20 @@
 from datetime import datetime
 
-from sqlalchemy import JSON, TIMESTAMP, Boolean, Column, ForeignKey, Integer, String
+from sqlalchemy import (
+    DDL,
+    JSON,
+    TIMESTAMP,
+    Boolean,
+    Column,
+    ForeignKey,
+    Integer,
+    String,
+    event,
+)
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 
-from .base import Base
+from .base import Base, NormalizedColumnsMixin, trigram_index
 
 
 # Tablas de clasificación (lookup tables)
@@ -70,8 +80,13 @@ class ContractionType(Base):
     exercises = relationship("Exercise", back_populates="contraction_type")
 
 
-class Exercise(Base):
+class Exercise(NormalizedColumnsMixin, Base):
     __tablename__ = "exercises"
+    __normalized__ = ("name", "short_name", "description")
+    __table_args__ = (
+        trigram_index("ix_exercises_name_trgm", "name_normalized"),
+        trigram_index("ix_exercises_short_name_trgm", "short_name_normalized"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(255), nullable=False)
@@ -89,6 +104,11 @@ class Exercise(Base):
     created_at = Column(TIMESTAMP, default=datetime.utcnow)
     updated_at = Column(TIMESTAMP, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    # Search-only copies, see NormalizedColumnsMixin
+    name_normalized = deferred(Column(String(255)))
+    short_name_normalized = deferred(Column(String(50)))
+    description_normalized = deferred(Column(String))
+
     # Relationships
     coach_user = relationship("User", back_populates="created_exercises")
     category = relationship("ExerciseCategory", back_populates="exercises")
@@ -103,3 +123,59 @@ class Exercise(Base):
 
     def __repr__(self):
         return f"<Exercise(id={self.id}, name={self.name})>"
+
+
+# Full-text search index, see src/services/exercise_search.py.
+# PostgreSQL: a generated tsvector column (not mapped, so never loaded) with
+# a GIN index. SQLite: an external-content FTS5 table kept in sync by
+# triggers. Both weight name and short_name above description, and both
+# ignore accents: PostgreSQL indexes the normalized columns, FTS5 removes
+# diacritics in its tokenizer.
+# The PostgreSQL DDL is also in migrations/versions/add_exercise_search.py
+# and add_normalized_search_columns.py.
+EXERCISE_SEARCH_VECTOR_DDL = (
+    "ALTER TABLE exercises ADD COLUMN IF NOT EXISTS search_vector tsvector "
+    "GENERATED ALWAYS AS ("
+    "setweight(to_tsvector('english', coalesce(name_normalized, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(short_name_normalized, '')), 'A') "
+    "|| setweight(to_tsvector('english', coalesce(description_normalized, '')), "
+    "'B')) STORED"
+)
+EXERCISE_SEARCH_INDEX_DDL = (
+    "CREATE INDEX IF NOT EXISTS ix_exercises_search_vector "
+    "ON exercises USING gin (search_vector)"
+)
+EXERCISE_FTS5_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS exercises_fts USING fts5("
+    "name, short_name, description, content='exercises', content_rowid='id', "
+    "tokenize='porter unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER IF NOT EXISTS exercises_fts_insert AFTER INSERT ON exercises "
+    "BEGIN INSERT INTO exercises_fts(rowid, name, short_name, description) "
+    "VALUES (new.id, new.name, new.short_name, new.description); END",
+    "CREATE TRIGGER IF NOT EXISTS exercises_fts_delete AFTER DELETE ON exercises "
+    "BEGIN INSERT INTO exercises_fts(exercises_fts, rowid, name, short_name, "
+    "description) VALUES ('delete', old.id, old.name, old.short_name, "
+    "old.description); END",
+    "CREATE TRIGGER IF NOT EXISTS exercises_fts_update AFTER UPDATE ON exercises "
+    "BEGIN INSERT INTO exercises_fts(exercises_fts, rowid, name, short_name, "
+    "description) VALUES ('delete', old.id, old.name, old.short_name, "
+    "old.description); INSERT INTO exercises_fts(rowid, name, short_name, "
+    "description) VALUES (new.id, new.name, new.short_name, new.description); END",
+    "INSERT INTO exercises_fts(exercises_fts) VALUES ('rebuild')",
+)
+
+for statement in (EXERCISE_SEARCH_VECTOR_DDL, EXERCISE_SEARCH_INDEX_DDL):
+    event.listen(
+        Exercise.__table__,
+        "after_create",
+        DDL(statement).execute_if(dialect="postgresql"),
+    )
+for statement in EXERCISE_FTS5_DDL:
+    event.listen(
+        Exercise.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite")
+    )
+event.listen(
+    Exercise.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS exercises_fts").execute_if(dialect="sqlite"),
+)
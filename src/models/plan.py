@@ -6,14 +6,19 @@ from sqlalchemy import (
     Boolean,
     Column,
     Date,
+    Float,
     ForeignKey,
+    Index,
     Integer,
     Interval,
     String,
+    UniqueConstraint,
+    event,
 )
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Session, relationship
 
+from ..utils.units import parse_duration_seconds, parse_weight_kg, total_reps
 from .base import Base
 
 
@@ -53,6 +58,9 @@ class PlanVersion(Base):
 
 class WorkoutSession(Base):
     __tablename__ = "workout_sessions"
+    __table_args__ = (
+        Index("ix_workout_sessions_client_id_date", "client_id", "date"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     plan_id = Column(Integer, ForeignKey("plans.id"), index=True)
@@ -83,6 +91,14 @@ class WorkoutExercise(Base):
     time_spent = Column(String(50))
     reps_in_time = Column(Integer)
 
+    # Typed copies of the free-text quantities above, for SQL aggregates;
+    # kept in step by _update_parsed_columns (see PARSED_COLUMNS)
+    weight_planned_kg = Column(Float)
+    weight_used_kg = Column(Float)
+    rest_between_sets_seconds = Column(Integer)
+    time_spent_seconds = Column(Integer)
+    reps_done_total = Column(Integer)
+
     # Relationships
     session = relationship("WorkoutSession", back_populates="workout_exercises")
     exercise = relationship("Exercise", back_populates="workout_exercises")
@@ -90,8 +106,44 @@ class WorkoutExercise(Base):
     # Continuación del mismo archivo
 
 
+# Parsed column -> (free-text source column, parser)
+PARSED_COLUMNS = {
+    "weight_planned_kg": ("weight_planned", parse_weight_kg),
+    "weight_used_kg": ("weight_used", parse_weight_kg),
+    "rest_between_sets_seconds": ("rest_between_sets", parse_duration_seconds),
+    "time_spent_seconds": ("time_spent", parse_duration_seconds),
+    "reps_done_total": ("reps_done", total_reps)
+}
+
+
+def parsed_values(values: dict) -> dict:
+    """
+    The parsed columns for the free-text ``values`` given, by column name.
+    Statements that bypass the ORM events (bulk UPDATEs) add these.
+    """
+    return {
+        column: parser(values[source])
+        for column, (source, parser) in PARSED_COLUMNS.items()
+        if source in values
+    }
+
+
+@event.listens_for(WorkoutExercise, "before_insert")
+@event.listens_for(WorkoutExercise, "before_update")
+def _update_parsed_columns(mapper, connection, target) -> None:
+    for column, (source, parser) in PARSED_COLUMNS.items():
+        setattr(target, column, parser(getattr(target, source)))
+
+
 class ExerciseProgress(Base):
+    """
+    Best and latest load per client and exercise, maintained incrementally
+    as sets are logged and sessions completed (see ExerciseProgressCRUD).
+    """
     __tablename__ = "exercise_progress"
+    __table_args__ = (
+        UniqueConstraint("client_id", "exercise_id", name="uq_exercise_progress_client_exercise"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     client_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), index=True)
@@ -105,6 +157,42 @@ class ExerciseProgress(Base):
     exercise = relationship("Exercise", back_populates="exercise_progress")
 
 
+class SyncOperation(Base):
+    """
+    An offline write replayed through /plans/sync, keyed by the client's
+    idempotency key so that retries return the stored result instead of
+    applying it twice.
+    """
+    __tablename__ = "sync_operations"
+    __table_args__ = (
+        UniqueConstraint("user_id", "idempotency_key", name="uq_sync_operations_user_key"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
+    idempotency_key = Column(String(64), nullable=False)
+    operation = Column(String(30), nullable=False)  # complete_session, log_set
+    status = Column(Integer)  # HTTP status of the result; NULL while applying
+    response = Column(JSON)
+    created_at = Column(TIMESTAMP, default=datetime.utcnow, index=True)
+
+
+class WeeklyVolume(Base):
+    """
+    Training volume of a client per ISO week and muscle group, over
+    completed sessions. Rebuilt per (client, week) whenever one of its
+    sessions changes (see WeeklyVolumeCRUD).
+    """
+    __tablename__ = "weekly_volumes"
+
+    client_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), primary_key=True)
+    week_start = Column(Date, primary_key=True)  # Monday of the ISO week
+    muscle_group_id = Column(Integer, primary_key=True)  # 0: exercises without one
+    sets = Column(Integer, nullable=False, default=0)
+    reps = Column(Integer, nullable=False, default=0)
+    tonnage_kg = Column(Float, nullable=False, default=0)  # reps x load
+
+
 class SharedExercise(Base):
     __tablename__ = "shared_exercises"
 
@@ -169,3 +257,30 @@ class ClientAssessment(Base):
 
     # Relationships
     client = relationship("User", back_populates="assessments")
+
+
+@event.listens_for(Session, "before_flush")
+def touch_parent_plans(session, flush_context, instances):
+    """
+    Bump Plan.updated_at when its sessions or their exercises change.
+
+    Plan responses embed both, so updated_at has to move for the plan's
+    ETag/Last-Modified to change with them.
+    """
+    plan_ids = set()
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, WorkoutSession):
+            plan_ids.add(obj.plan_id)
+        elif isinstance(obj, WorkoutExercise):
+            workout_session = obj.session
+            if workout_session is None and obj.session_id is not None:
+                workout_session = session.get(WorkoutSession, obj.session_id)
+            if workout_session is not None:
+                plan_ids.add(workout_session.plan_id)
+    plan_ids.discard(None)
+
+    now = datetime.utcnow()
+    for plan_id in plan_ids:
+        plan = session.get(Plan, plan_id)
+        if plan is not None and plan not in session.deleted:
+            plan.updated_at = now
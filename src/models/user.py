@@ -3,9 +3,9 @@ from datetime import datetime
 
 from sqlalchemy import TIMESTAMP, Boolean, Column, ForeignKey, Integer, String
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 
-from .base import Base
+from .base import Base, NormalizedColumnsMixin, trigram_index
 
 
 class Role(Base):
@@ -21,8 +21,13 @@ class Role(Base):
     users = relationship("User", back_populates="role")
 
 
-class User(Base):
+class User(NormalizedColumnsMixin, Base):
     __tablename__ = "users"
+    __normalized__ = ("name",)
+    __table_args__ = (
+        trigram_index("ix_users_name_trgm", "name_normalized"),
+        trigram_index("ix_users_email_trgm", "email"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     name = Column(String(255), nullable=False)
@@ -36,6 +41,9 @@ class User(Base):
     approved_at = Column(TIMESTAMP, nullable=True)
     created_at = Column(TIMESTAMP, default=datetime.utcnow)
 
+    # Search-only copy, see NormalizedColumnsMixin
+    name_normalized = deferred(Column(String(255)))
+
     # Relationships
     role = relationship("Role", back_populates="users")
     coach = relationship(
@@ -51,6 +59,7 @@ class User(Base):
     exercise_progress = relationship("ExerciseProgress", back_populates="client")
     shared_exercises = relationship("SharedExercise", back_populates="coach_user")
     shared_plans = relationship("SharedPlan", back_populates="coach_user")
+    refresh_tokens = relationship("RefreshToken", back_populates="user")
 
     def __repr__(self):
         return f"<User(id={self.id}, email={self.email})>"
@@ -2,7 +2,9 @@ from .auth import (
     ForgotPasswordRequest,
     LoginRequest,
     LoginResponse,
+    LogoutRequest,
     PasswordChange,
+    RefreshRequest,
     ResetPasswordRequest,
     Token,
     TokenPayload,
@@ -65,6 +67,8 @@ __all__ = [
     "TokenPayload",
     "LoginRequest",
     "LoginResponse",
+    "RefreshRequest",
+    "LogoutRequest",
     "PasswordChange",
     "ForgotPasswordRequest",
     "ResetPasswordRequest",
@@ -6,11 +6,22 @@ from pydantic import BaseModel, EmailStr, Field
 class Token(BaseModel):
     access_token: str
     token_type: str = "bearer"
+    refresh_token: str | None = None
+    expires_in: int | None = None  # Access token lifetime in seconds
 
 
 class TokenPayload(BaseModel):
     sub: UUID | None = None
     exp: int | None = None
+    jti: str | None = None
+
+
+class RefreshRequest(BaseModel):
+    refresh_token: str = Field(..., min_length=1)
+
+
+class LogoutRequest(BaseModel):
+    refresh_token: str | None = None
 
 
 class LoginRequest(BaseModel):
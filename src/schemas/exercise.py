@@ -209,8 +209,16 @@ class ContractionType(ContractionTypeInDB):
     pass
 
 
+class ExerciseCoach(BaseModel):
+    id: UUID
+    name: str
+
+    class Config:
+        from_attributes = True
+
+
 class Exercise(ExerciseInDB):
-    coach: Any | None = None  # Will be populated
+    coach: ExerciseCoach | None = None
     category: ExerciseCategory | None = None
     movement_type: MovementType | None = None
     muscle_group: MuscleGroup | None = None
@@ -227,6 +235,46 @@ class ExerciseList(BaseModel):
     size: int
 
 
+class FacetValue(BaseModel):
+    id: int
+    name: str
+    count: int
+
+
+class ExerciseFacets(BaseModel):
+    category: list[FacetValue]
+    muscle_group: list[FacetValue]
+    equipment: list[FacetValue]
+    position: list[FacetValue]
+    contraction_type: list[FacetValue]
+
+
+class ExerciseFacetedList(ExerciseList):
+    facets: ExerciseFacets
+
+
+class SimilarExercise(BaseModel):
+    exercise: Exercise
+    similarity: float
+
+
+class SimilarExercisesList(BaseModel):
+    similar: list[SimilarExercise]
+
+
+class ExerciseSuggestion(BaseModel):
+    id: int
+    name: str
+    short_name: str | None = None
+
+    class Config:
+        from_attributes = True
+
+
+class ExerciseAutocomplete(BaseModel):
+    suggestions: list[ExerciseSuggestion]
+
+
 class ExerciseCategoriesList(BaseModel):
     categories: list[ExerciseCategory]
     total: int
@@ -107,6 +107,73 @@ class WorkoutExerciseResponse(WorkoutExerciseBase):
         from_attributes = True
 
 
+class ExerciseProgressResponse(BaseModel):
+    exercise_id: int
+    max_weight_lifted: Optional[int] = None  # kg
+    last_weight_used: Optional[int] = None  # kg
+    last_session_date: Optional[date] = None
+
+    class Config:
+        from_attributes = True
+
+
+class WeeklyVolumeResponse(BaseModel):
+    week_start: date  # Monday of the ISO week
+    muscle_group_id: int  # 0: exercises without a muscle group
+    sets: int
+    reps: int
+    tonnage_kg: float
+
+    class Config:
+        from_attributes = True
+
+
+class CalendarExercise(BaseModel):
+    id: int  # Workout exercise
+    exercise_id: Optional[int] = None
+    name: Optional[str] = None
+    sets_planned: Optional[int] = None
+    reps_planned: Optional[str] = None
+    weight_planned: Optional[str] = None
+    sets_done: Optional[int] = None
+
+
+class CalendarSession(BaseModel):
+    id: int
+    plan_id: Optional[int] = None
+    completed: bool = False
+    exercises: list[CalendarExercise] = []
+
+
+class CalendarDay(BaseModel):
+    date: date
+    sessions: list[CalendarSession]
+
+
+class ClientAdherenceResponse(BaseModel):
+    client_id: UUID
+    name: str
+    planned_7d: int  # Sessions dated in the last 7 days, today included
+    completed_7d: int
+    planned_30d: int
+    completed_30d: int
+    last_workout: Optional[date] = None
+    streak: int  # Sessions completed since the last missed one
+
+    class Config:
+        from_attributes = True
+
+
+class StrengthCurveResponse(BaseModel):
+    exercise_id: int
+    formula: str
+    dates: list[date] = []  # Sessions with a set of at most 12 reps
+    best: list[float] = []  # Best estimated 1RM of each session, kg
+    trend: list[float] = []  # Smoothed best, kg
+    max: Optional[float] = None
+    current: Optional[float] = None  # Latest trend value
+
+
 class WorkoutSessionResponse(WorkoutSessionBase):
     id: int
     plan_id: int
@@ -151,6 +218,10 @@ class PlanTemplate(BaseModel):
 class PlanFromTemplateRequest(BaseModel):
     template_name: str
     custom_name: Optional[str] = None
+    # Opt-in substitutions: replace template exercises missing from the
+    # catalog or needing this equipment with similar ones
+    substitute_exercises: bool = False
+    excluded_equipment_ids: List[int] = []
 
 
 class PlanFromTemplateResponse(BaseModel):
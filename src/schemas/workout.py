@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Annotated, List, Literal, Optional, Union
 
 from pydantic import BaseModel, Field
 
@@ -33,6 +33,21 @@ class WorkoutExerciseUpdate(BaseModel):
     notes: Optional[str] = None
 
 
+# Límite de series por ejercicio al registrar en lote
+MAX_SETS_PER_EXERCISE = 100
+
+
+class WorkoutSetLog(WorkoutExerciseUpdate):
+    """Schema para una serie dentro de un registro en lote."""
+    workout_exercise_id: int
+    set_number: int = Field(..., ge=1, le=MAX_SETS_PER_EXERCISE)
+
+
+class WorkoutSetLogBatch(BaseModel):
+    """Schema para registrar varias series de una sesión en una sola petición."""
+    sets: list[WorkoutSetLog] = Field(..., min_length=1, max_length=500)
+
+
 # Workout Session schemas
 class WorkoutSessionStart(BaseModel):
     """Schema para iniciar una sesión de workout."""
@@ -46,6 +61,39 @@ class WorkoutSessionComplete(BaseModel):
     total_time: Optional[str] = None  # "45:30" formato MM:SS
 
 
+# Offline sync schemas
+class SyncSessionCompletion(WorkoutSessionComplete):
+    """Schema para completar una sesión registrada sin conexión."""
+    type: Literal["complete_session"]
+    idempotency_key: str = Field(..., min_length=1, max_length=64)
+
+
+class SyncSetLog(WorkoutSetLog):
+    """Schema para una serie registrada sin conexión."""
+    type: Literal["log_set"]
+    idempotency_key: str = Field(..., min_length=1, max_length=64)
+
+
+SyncOperationItem = Annotated[
+    Union[SyncSessionCompletion, SyncSetLog],
+    Field(discriminator="type")
+]
+
+
+class WorkoutSyncBatch(BaseModel):
+    """Schema para sincronizar en lote las operaciones hechas sin conexión."""
+    operations: list[SyncOperationItem] = Field(..., min_length=1, max_length=1000)
+
+
+class SyncOperationResult(BaseModel):
+    """Schema para el resultado de una operación sincronizada."""
+    idempotency_key: str
+    status: int  # Código HTTP equivalente: 200, 404, 409
+    replayed: bool = False  # True si ya se había aplicado antes
+    data: Optional[dict] = None
+    detail: Optional[str] = None
+
+
 class WorkoutSessionProgress(BaseModel):
     """Schema para mostrar progreso actual de una sesión."""
     session_id: int
@@ -0,0 +1,200 @@
+"""
+In-process autocomplete index for exercise names.
+
+Names and short names are normalized (lowercase, no accents or
+punctuation) and kept in two sorted arrays: whole names, and every
+word-start suffix of them ("bench press" -> "press"), so prefix lookups
+are a bisect. A trigram posting-list map answers infix and misspelled
+queries, ranked by the share of the query's trigrams a name contains
+(the idea behind pg_trgm's word_similarity).
+
+Exercise writes update the index incrementally and other workers reload
+theirs (see SharedIndex). Indexes also expire after
+AUTOCOMPLETE_INDEX_TTL_SECONDS.
+"""
+
+from __future__ import annotations
+
+import math
+from bisect import bisect_left, insort
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+from sqlalchemy.orm import Session
+
+from src.core.config import settings
+from src.core.database import SessionLocal
+from src.models.exercise import Exercise
+from src.services.shared_index import SharedIndex
+from src.utils.text import normalize_text, trigrams
+
+GENERATION_TAG = "autocomplete:exercises"
+
+# Fuzzy matches need this share of the query's trigrams...
+SIMILARITY_THRESHOLD = 0.5
+# ...and a query at least this long
+FUZZY_MIN_LENGTH = 3
+
+
+@dataclass(frozen=True)
+class IndexEntry:
+    id: int
+    name: str
+    short_name: str | None
+    names: tuple[str, ...]  # Normalized name and short name
+    grams: frozenset[str]
+
+
+def make_entry(id: int, name: str, short_name: str | None = None) -> IndexEntry:
+    names = tuple(
+        dict.fromkeys(n for n in map(normalize_text, (name, short_name)) if n)
+    )
+    grams = frozenset().union(*(trigrams(n) for n in names))
+    return IndexEntry(id, name, short_name, names, grams)
+
+
+def word_starts(value: str) -> Iterator[str]:
+    """Suffixes of ``value`` starting at its second and later words"""
+    start = value.find(" ")
+    while start != -1:
+        yield value[start + 1 :]
+        start = value.find(" ", start + 1)
+
+
+class AutocompleteIndex:
+    """Prefix and trigram index over exercise names; not thread-safe"""
+
+    def __init__(self) -> None:
+        self._entries: dict[int, IndexEntry] = {}
+        self._names: list[tuple[str, int]] = []
+        self._words: list[tuple[str, int]] = []
+        self._postings: defaultdict[str, set[int]] = defaultdict(set)
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[IndexEntry]) -> AutocompleteIndex:
+        """Bulk build: one sort per array instead of an insort per key"""
+        index = cls()
+        for entry in entries:
+            index._entries[entry.id] = entry
+            for name in entry.names:
+                index._names.append((name, entry.id))
+                index._words.extend((s, entry.id) for s in word_starts(name))
+            for gram in entry.grams:
+                index._postings[gram].add(entry.id)
+        index._names.sort()
+        index._words.sort()
+        return index
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, entry: IndexEntry) -> None:
+        self.remove(entry.id)
+        self._entries[entry.id] = entry
+        for name in entry.names:
+            insort(self._names, (name, entry.id))
+            for suffix in word_starts(name):
+                insort(self._words, (suffix, entry.id))
+        for gram in entry.grams:
+            self._postings[gram].add(entry.id)
+
+    def remove(self, id: int) -> None:
+        entry = self._entries.pop(id, None)
+        if entry is None:
+            return
+        for name in entry.names:
+            _discard(self._names, (name, id))
+            for suffix in word_starts(name):
+                _discard(self._words, (suffix, id))
+        for gram in entry.grams:
+            postings = self._postings[gram]
+            postings.discard(id)
+            if not postings:
+                del self._postings[gram]
+
+    def search(self, text: str, limit: int = 10) -> list[IndexEntry]:
+        """
+        Entries whose name starts with ``text``, then entries with a word
+        starting with it, then the closest trigram matches.
+        """
+        query = normalize_text(text)
+        if not query or limit <= 0:
+            return []
+
+        found: dict[int, None] = {}
+        for keys in (self._names, self._words):
+            position = bisect_left(keys, (query,))
+            while len(found) < limit and position < len(keys):
+                key, id = keys[position]
+                if not key.startswith(query):
+                    break
+                found.setdefault(id)
+                position += 1
+        if len(found) < limit and len(query) >= FUZZY_MIN_LENGTH:
+            for id in self._similar(query, limit - len(found), exclude=found):
+                found.setdefault(id)
+        return [self._entries[id] for id in found]
+
+    def _similar(self, query: str, limit: int, exclude: dict[int, None]) -> list[int]:
+        query_grams = sorted(
+            trigrams(query), key=lambda gram: len(self._postings.get(gram, ()))
+        )
+        needed = math.ceil(SIMILARITY_THRESHOLD * len(query_grams))
+        # A name sharing ``needed`` grams shares at least one of the
+        # len - needed + 1 rarest, so common grams never need scanning
+        candidates: set[int] = set()
+        for gram in query_grams[: len(query_grams) - needed + 1]:
+            candidates.update(self._postings.get(gram, ()))
+
+        scored = []
+        for id in candidates.difference(exclude):
+            entry = self._entries[id]
+            similarity = len(entry.grams.intersection(query_grams)) / len(query_grams)
+            if similarity >= SIMILARITY_THRESHOLD:
+                scored.append((-similarity, entry.names[0], id))
+        scored.sort()
+        return [id for _, _, id in scored[:limit]]
+
+
+def _discard(keys: list[tuple[str, int]], key: tuple[str, int]) -> None:
+    position = bisect_left(keys, key)
+    if position < len(keys) and keys[position] == key:
+        del keys[position]
+
+
+class ExerciseAutocomplete(SharedIndex[AutocompleteIndex]):
+    """The exercise index of this worker, kept in step with the others"""
+
+    generation_tag = GENERATION_TAG
+
+    def build(self, db: Session) -> AutocompleteIndex:
+        rows = db.query(Exercise.id, Exercise.name, Exercise.short_name).all()
+        return AutocompleteIndex.from_entries(
+            make_entry(row.id, row.name, row.short_name) for row in rows
+        )
+
+    def search(self, db: Session, text: str, limit: int = 10) -> list[IndexEntry]:
+        """Suggestions for ``text``; ``db`` is only used to (re)load the index"""
+        return self.read(db, lambda index: index.search(text, limit))
+
+    def upsert(self, exercise_obj: Exercise) -> None:
+        entry = make_entry(exercise_obj.id, exercise_obj.name, exercise_obj.short_name)
+        self._apply(lambda index: index.add(entry))
+
+    def remove(self, exercise_id: int) -> None:
+        self._apply(lambda index: index.remove(exercise_id))
+
+
+exercise_autocomplete = ExerciseAutocomplete(
+    ttl_seconds=settings.AUTOCOMPLETE_INDEX_TTL_SECONDS
+)
+
+
+def warm_exercise_autocomplete() -> None:
+    """Build the index; called once at startup"""
+    db = SessionLocal()
+    try:
+        exercise_autocomplete.load(db)
+    finally:
+        db.close()
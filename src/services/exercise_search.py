@@ -0,0 +1,113 @@
+"""
+Ranked full-text search over exercises.
+
+On PostgreSQL queries are parsed with ``websearch_to_tsquery`` and matched
+against the generated ``exercises.search_vector`` column through its GIN
+index, ranked with ``ts_rank``. On SQLite the same query syntax (words,
+"quoted phrases", ``or``, ``-excluded``) is translated to an FTS5 MATCH
+expression against ``exercises_fts``, ranked with ``bm25``. Other databases
+fall back to unranked substring matching on the normalized shadow columns.
+Accents and case never matter: the tsvector is built from the normalized
+columns and the query is folded the same way, and FTS5 removes diacritics.
+
+``matches`` returns a subquery of ``(id, rank)`` rows, higher rank first,
+that callers join or filter on so counting, filtering and pagination stay
+in the database.
+"""
+
+from __future__ import annotations
+
+import re
+
+from sqlalchemy import (
+    Float,
+    Integer,
+    Subquery,
+    column,
+    false,
+    func,
+    literal,
+    or_,
+    select,
+)
+from sqlalchemy import table as table_clause
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import literal_column
+
+from src.models.base import normalized_contains
+from src.models.exercise import Exercise
+from src.utils.text import fold_accents
+
+TEXT_SEARCH_CONFIG = "english"
+
+# Relative weight of name, short_name and description, as in ts_rank
+FTS5_WEIGHTS = (1.0, 1.0, 0.4)
+
+_TOKEN = re.compile(r'"([^"]*)"?|(\S+)')
+_WORD = re.compile(r"\w+")
+
+exercises_fts = table_clause("exercises_fts", column("rowid", Integer))
+
+
+def websearch_to_fts5(text: str) -> str | None:
+    """
+    FTS5 MATCH expression for a websearch-style query, or None if it has no
+    terms to match. Every word is quoted, so user input cannot inject FTS5
+    syntax.
+    """
+    groups: list[list[str]] = [[]]
+    excluded: list[str] = []
+    for match in _TOKEN.finditer(text):
+        phrase, bare = match.groups()
+        if bare is not None and bare.lower() == "or":
+            if groups[-1]:
+                groups.append([])
+            continue
+        negated = bare is not None and bare.startswith("-")
+        words = _WORD.findall(phrase if phrase is not None else bare)
+        if not words:
+            continue
+        term = '"' + " ".join(words) + '"'
+        if negated:
+            excluded.append(term)
+        else:
+            groups[-1].append(term)
+
+    groups = [group for group in groups if group]
+    if not groups:
+        return None
+    expression = " OR ".join("(" + " AND ".join(group) + ")" for group in groups)
+    if excluded:
+        expression = f"({expression}) NOT " + " NOT ".join(excluded)
+    return expression
+
+
+def matches(db: Session, text: str) -> Subquery:
+    """``(id, rank)`` of the exercises matching ``text``"""
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        query = func.websearch_to_tsquery(TEXT_SEARCH_CONFIG, fold_accents(text))
+        vector = literal_column("exercises.search_vector", type_=TSVECTOR)
+        statement = select(
+            Exercise.id.label("id"),
+            func.ts_rank(vector, query).label("rank"),
+        ).where(vector.op("@@")(query))
+    elif dialect == "sqlite":
+        expression = websearch_to_fts5(text)
+        fts = literal_column("exercises_fts")
+        statement = select(
+            exercises_fts.c.rowid.label("id"),
+            (-func.bm25(fts, *FTS5_WEIGHTS, type_=Float)).label("rank"),
+        ).where(fts.op("MATCH")(expression) if expression else false())
+    else:
+        statement = select(
+            Exercise.id.label("id"), literal(0.0, Float).label("rank")
+        ).where(
+            or_(
+                normalized_contains(Exercise.name_normalized, text),
+                normalized_contains(Exercise.short_name_normalized, text),
+                normalized_contains(Exercise.description_normalized, text),
+            )
+        )
+    return statement.subquery("exercise_matches")
@@ -0,0 +1,267 @@
+"""
+Similar exercises by classification attributes.
+
+Each exercise is a weighted one-hot vector over its category, movement
+type, muscle group, equipment, position and contraction type, and
+neighbours are ranked by cosine similarity. For such vectors the cosine
+is the summed squared weights of the attributes two exercises share over
+the product of their norms, so no matrix is materialized.
+
+Exercises with the same attributes have the same vector, so the index
+groups them by attribute signature and keeps, per attribute value, the
+signatures that have it. A query visits the sets of attributes it could
+share with a neighbour from the heaviest down, intersecting postings,
+and stops once no unvisited signature can outscore the neighbours it
+already has. Cost depends on how many signatures are close, not on the
+catalog size.
+
+Exercise writes update the index incrementally and other workers reload
+theirs (see SharedIndex).
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+from bisect import bisect_left, insort
+from collections.abc import Collection, Iterable
+from itertools import combinations
+from types import MappingProxyType
+
+from sqlalchemy.orm import Session
+
+from src.core.config import settings
+from src.models.exercise import Exercise
+from src.services.shared_index import SharedIndex
+
+GENERATION_TAG = "similarity:exercises"
+
+# Weight of each attribute in the exercise vector
+FEATURE_WEIGHTS = MappingProxyType(
+    {
+        "muscle_group_id": 3.0,
+        "movement_type_id": 2.0,
+        "equipment_id": 1.5,
+        "category_id": 1.0,
+        "position_id": 1.0,
+        "contraction_type_id": 1.0,
+    }
+)
+FEATURES = tuple(FEATURE_WEIGHTS)
+EQUIPMENT = FEATURES.index("equipment_id")
+_SQUARED = tuple(weight * weight for weight in FEATURE_WEIGHTS.values())
+
+# One attribute value per feature, None where unset
+Signature = tuple[int | None, ...]
+
+
+def signature_of(exercise_obj) -> Signature:
+    return tuple(getattr(exercise_obj, feature) for feature in FEATURES)
+
+
+def _norm(signature: Signature) -> float:
+    return math.sqrt(
+        sum(
+            w for w, value in zip(_SQUARED, signature, strict=True) if value is not None
+        )
+    )
+
+
+def cosine(a: Signature, b: Signature) -> float:
+    dot = sum(
+        w for w, x, y in zip(_SQUARED, a, b, strict=True) if x is not None and x == y
+    )
+    return dot / (_norm(a) * _norm(b)) if dot else 0.0
+
+
+class SimilarityIndex:
+    """Exercises grouped by signature; not thread-safe"""
+
+    def __init__(self) -> None:
+        self._signatures: dict[int, Signature] = {}
+        self._groups: dict[Signature, list[int]] = {}  # Sorted ids
+        self._postings: list[dict[int, set[Signature]]] = [{} for _ in FEATURES]
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[tuple[int, Signature]]) -> SimilarityIndex:
+        index = cls()
+        for id, signature in rows:
+            index._signatures[id] = signature
+            group = index._groups.get(signature)
+            if group is None:
+                index._groups[signature] = [id]
+                index._post(signature)
+            else:
+                group.append(id)
+        for group in index._groups.values():
+            group.sort()
+        return index
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def signature(self, id: int) -> Signature | None:
+        return self._signatures.get(id)
+
+    def add(self, id: int, signature: Signature) -> None:
+        self.remove(id)
+        self._signatures[id] = signature
+        group = self._groups.get(signature)
+        if group is None:
+            self._groups[signature] = [id]
+            self._post(signature)
+        else:
+            insort(group, id)
+
+    def remove(self, id: int) -> None:
+        signature = self._signatures.pop(id, None)
+        if signature is None:
+            return
+        group = self._groups[signature]
+        del group[bisect_left(group, id)]
+        if group:
+            return
+        del self._groups[signature]
+        for postings, value in zip(self._postings, signature, strict=True):
+            if value is not None:
+                postings[value].discard(signature)
+                if not postings[value]:
+                    del postings[value]
+
+    def _post(self, signature: Signature) -> None:
+        for postings, value in zip(self._postings, signature, strict=True):
+            if value is not None:
+                postings.setdefault(value, set()).add(signature)
+
+    def similar(
+        self,
+        signature: Signature,
+        limit: int = 10,
+        *,
+        exclude_id: int | None = None,
+        excluded_equipment_ids: Collection[int] = (),
+    ) -> list[tuple[int, float]]:
+        """
+        ``(id, similarity)`` of the ``limit`` exercises closest to
+        ``signature``, most similar first, skipping ``exclude_id`` and the
+        excluded equipment. Exercises sharing no attribute never match.
+        """
+        present = [i for i, value in enumerate(signature) if value is not None]
+        if not present or limit <= 0:
+            return []
+        norm = _norm(signature)
+        # Shared-attribute sets, heaviest first. A neighbour sharing exactly
+        # ``shared`` scores at most sqrt(dot) / norm: its own norm is at
+        # least sqrt(dot).
+        masks = sorted(
+            (
+                (sum(_SQUARED[i] for i in shared), shared)
+                for size in range(len(present), 0, -1)
+                for shared in combinations(present, size)
+            ),
+            key=lambda mask: -mask[0],
+        )
+
+        seen: set[Signature] = set()
+        scored: list[tuple[float, Signature]] = []
+        for dot, shared in masks:
+            bound = math.sqrt(dot) / norm
+            if self._count_at_least(scored, bound, exclude_id) >= limit:
+                break
+            postings = sorted(
+                (self._postings[i].get(signature[i], set()) for i in shared), key=len
+            )
+            for other in postings[0].intersection(*postings[1:]):
+                if other in seen:
+                    continue
+                seen.add(other)
+                if other[EQUIPMENT] not in excluded_equipment_ids:
+                    scored.append((cosine(signature, other), other))
+
+        ranked = heapq.nsmallest(
+            limit,
+            (
+                (-score, id)
+                for score, other in scored
+                for id in self._groups[other]
+                if id != exclude_id
+            ),
+        )
+        return [(id, -negated) for negated, id in ranked]
+
+    def _count_at_least(
+        self,
+        scored: list[tuple[float, Signature]],
+        bound: float,
+        exclude_id: int | None,
+    ) -> int:
+        count = 0
+        for score, other in scored:
+            if score >= bound:
+                group = self._groups[other]
+                count += len(group) - (exclude_id in group)
+        return count
+
+
+class ExerciseSimilarity(SharedIndex[SimilarityIndex]):
+    """The similarity index of this worker, kept in step with the others"""
+
+    generation_tag = GENERATION_TAG
+
+    def build(self, db: Session) -> SimilarityIndex:
+        columns = [getattr(Exercise, feature) for feature in FEATURES]
+        rows = db.query(Exercise.id, *columns).all()
+        return SimilarityIndex.from_rows((row[0], tuple(row[1:])) for row in rows)
+
+    def similar(
+        self,
+        db: Session,
+        exercise_id: int,
+        limit: int = 10,
+        *,
+        excluded_equipment_ids: Collection[int] = (),
+    ) -> list[tuple[int, float]] | None:
+        """
+        ``(id, similarity)`` of the exercises closest to ``exercise_id``, or
+        None if it does not exist
+        """
+
+        def reader(index: SimilarityIndex):
+            signature = index.signature(exercise_id)
+            if signature is None:
+                return None
+            return index.similar(
+                signature,
+                limit,
+                exclude_id=exercise_id,
+                excluded_equipment_ids=excluded_equipment_ids,
+            )
+
+        found = self.read(db, reader)
+        if found is None:
+            # Not indexed yet, e.g. created by a worker we have not heard from
+            exercise_obj = db.query(Exercise).filter(Exercise.id == exercise_id).first()
+            if exercise_obj is None:
+                return None
+            found = self.read(
+                db,
+                lambda index: index.similar(
+                    signature_of(exercise_obj),
+                    limit,
+                    exclude_id=exercise_id,
+                    excluded_equipment_ids=excluded_equipment_ids,
+                ),
+            )
+        return found
+
+    def upsert(self, exercise_obj: Exercise) -> None:
+        id, signature = exercise_obj.id, signature_of(exercise_obj)
+        self._apply(lambda index: index.add(id, signature))
+
+    def remove(self, exercise_id: int) -> None:
+        self._apply(lambda index: index.remove(exercise_id))
+
+
+exercise_similarity = ExerciseSimilarity(
+    ttl_seconds=settings.SIMILARITY_INDEX_TTL_SECONDS
+)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import random
+from collections.abc import Collection
 from datetime import date, timedelta
 from typing import Dict, List, Optional
 
@@ -9,6 +10,8 @@ from sqlalchemy.orm import Session
 from src.models.exercise import Exercise
 from src.models.plan import Plan, WorkoutExercise, WorkoutSession
 from src.schemas.plan import PlanCreate, PlanGoal, PlanLevel, PlanResponse, WorkoutFocus
+from src.services.exercise_autocomplete import exercise_autocomplete
+from src.services.exercise_similarity import exercise_similarity
 
 
 class PlanTemplate:
@@ -106,6 +109,72 @@ UPPER_LOWER_ADVANCED = PlanTemplate(
 )
 
 
+class ExerciseSubstitutions:
+    """
+    How a generated plan replaces template exercises it cannot use.
+
+    A template name missing from the catalog resolves to the closest
+    catalog name (e.g. "squat" -> "Back Squat"), and an exercise needing
+    excluded equipment is swapped for its most similar exercise that
+    does not.
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        excluded_equipment_ids: Collection[int] = (),
+        replace_missing: bool = True
+    ):
+        self.db = db
+        self.excluded_equipment_ids = frozenset(excluded_equipment_ids)
+        self.replace_missing = replace_missing
+        self._catalog: Optional[dict[str, Exercise]] = None
+        self._catalog_by_id: dict[int, Exercise] = {}
+
+    def resolve(
+        self,
+        name: str,
+        exercise_map: dict[str, Exercise],
+        exclude_ids: Collection[int] = ()
+    ) -> Optional[Exercise]:
+        """
+        The exercise to use for template ``name``. A swapped-in exercise is
+        never one of ``exclude_ids`` (those already in the workout).
+        """
+        exercise = exercise_map.get(name)
+        if exercise is None and self.replace_missing:
+            matches = exercise_autocomplete.search(
+                self.db, name.replace("_", " "), len(exclude_ids) + 1
+            )
+            by_id = self._by_id(exercise_map)
+            for match in matches:
+                if match.id not in exclude_ids and match.id in by_id:
+                    exercise = by_id[match.id]
+                    break
+        if exercise is None or exercise.equipment_id not in self.excluded_equipment_ids:
+            return exercise
+
+        # One more neighbour than can be excluded, so one is always usable
+        similar = exercise_similarity.similar(
+            self.db,
+            exercise.id,
+            len(exclude_ids) + 1,
+            excluded_equipment_ids=self.excluded_equipment_ids
+        )
+        by_id = self._by_id(exercise_map)
+        for similar_id, _ in similar or ():
+            if similar_id not in exclude_ids and similar_id in by_id:
+                return by_id[similar_id]
+        return None
+
+    def _by_id(self, exercise_map: dict[str, Exercise]) -> dict[int, Exercise]:
+        """``exercise_map`` by id, built once per map"""
+        if exercise_map is not self._catalog:
+            self._catalog = exercise_map
+            self._catalog_by_id = {exercise.id: exercise for exercise in exercise_map.values()}
+        return self._catalog_by_id
+
+
 class PlanGenerator:
     """Genera planes de entrenamiento basados en templates."""
 
@@ -121,9 +190,15 @@ class PlanGenerator:
         self,
         template_name: str,
         user_id: str,
-        custom_name: Optional[str] = None
+        custom_name: Optional[str] = None,
+        substitutions: Optional[ExerciseSubstitutions] = None
     ) -> Plan:
-        """Genera un plan completo desde un template."""
+        """
+        Genera un plan completo desde un template.
+
+        Sin ``substitutions`` los ejercicios del template que no están en el
+        catálogo se omiten.
+        """
 
         template = self.templates.get(template_name)
         if not template:
@@ -162,7 +237,9 @@ class PlanGenerator:
                     )
 
                     # Agregar ejercicios
-                    exercises = self._select_exercises_for_focus(focus, template, week)
+                    exercises = self._select_exercises_for_focus(
+                        focus, template, week, substitutions
+                    )
                     for i, exercise_config in enumerate(exercises):
                         workout_exercise = WorkoutExercise(
                             session=session,
@@ -185,13 +262,26 @@ class PlanGenerator:
         self,
         focus: WorkoutFocus,
         template: PlanTemplate,
-        week_number: int
+        week_number: int,
+        substitutions: Optional[ExerciseSubstitutions] = None
     ) -> list[dict[str, any]]:
         """Selecciona ejercicios apropiados para el focus del día."""
 
         # Obtener ejercicios disponibles
         exercises = self.db.query(Exercise).all()
         exercise_map = {ex.name.lower().replace(" ", "_"): ex for ex in exercises}
+        selected_ids = set()
+
+        def pick(name: str) -> Optional[Exercise]:
+            if substitutions is None:
+                exercise = exercise_map.get(name)
+            else:
+                exercise = substitutions.resolve(name, exercise_map, selected_ids)
+            # Two template names may resolve to the same substitute
+            if exercise is None or exercise.id in selected_ids:
+                return None
+            selected_ids.add(exercise.id)
+            return exercise
 
         selected_exercises = []
 
@@ -202,9 +292,10 @@ class PlanGenerator:
 
             # Seleccionar 2-3 compound exercises
             for compound in compound_exercises[:3]:
-                if compound in exercise_map:
+                picked = pick(compound)
+                if picked:
                     selected_exercises.append({
-                        "exercise_id": exercise_map[compound].id,
+                        "exercise_id": picked.id,
                         "sets": 3,
                         "reps": "8-12" if template.level == PlanLevel.BEGINNER else "6-10",
                         "weight": "moderate",
@@ -213,9 +304,10 @@ class PlanGenerator:
 
             # Seleccionar 1-2 accessory exercises
             for accessory in random.sample(accessory_exercises, min(2, len(accessory_exercises))):
-                if accessory in exercise_map:
+                picked = pick(accessory)
+                if picked:
                     selected_exercises.append({
-                        "exercise_id": exercise_map[accessory].id,
+                        "exercise_id": picked.id,
                         "sets": 2,
                         "reps": "10-15",
                         "weight": "light",
@@ -225,9 +317,10 @@ class PlanGenerator:
         elif focus == WorkoutFocus.PUSH:
             push_exercises = ["bench_press", "overhead_press", "dumbbell_press", "dips"]
             for exercise in push_exercises[:4]:
-                if exercise in exercise_map:
+                picked = pick(exercise)
+                if picked:
                     selected_exercises.append({
-                        "exercise_id": exercise_map[exercise].id,
+                        "exercise_id": picked.id,
                         "sets": 4 if template.level == PlanLevel.ADVANCED else 3,
                         "reps": "8-12" if template.goal == PlanGoal.MUSCLE_GAIN else "6-8",
                         "weight": "moderate",
@@ -237,9 +330,10 @@ class PlanGenerator:
         elif focus == WorkoutFocus.PULL:
             pull_exercises = ["pull_up", "deadlift", "barbell_row", "lat_pulldown"]
             for exercise in pull_exercises[:4]:
-                if exercise in exercise_map:
+                picked = pick(exercise)
+                if picked:
                     selected_exercises.append({
-                        "exercise_id": exercise_map[exercise].id,
+                        "exercise_id": picked.id,
                         "sets": 4 if template.level == PlanLevel.ADVANCED else 3,
                         "reps": "8-12" if template.goal == PlanGoal.MUSCLE_GAIN else "5-8",
                         "weight": "moderate",
@@ -249,9 +343,10 @@ class PlanGenerator:
         elif focus == WorkoutFocus.LEGS:
             leg_exercises = ["squat", "leg_press", "lunges", "calf_raise"]
             for exercise in leg_exercises[:4]:
-                if exercise in exercise_map:
+                picked = pick(exercise)
+                if picked:
                     selected_exercises.append({
-                        "exercise_id": exercise_map[exercise].id,
+                        "exercise_id": picked.id,
                         "sets": 4 if template.level == PlanLevel.ADVANCED else 3,
                         "reps": "10-15" if template.goal == PlanGoal.WEIGHT_LOSS else "8-12",
                         "weight": "moderate",
@@ -261,9 +356,10 @@ class PlanGenerator:
         elif focus == WorkoutFocus.UPPER_BODY:
             upper_exercises = ["bench_press", "overhead_press", "barbell_row", "pull_up"]
             for exercise in upper_exercises[:4]:
-                if exercise in exercise_map:
+                picked = pick(exercise)
+                if picked:
                     selected_exercises.append({
-                        "exercise_id": exercise_map[exercise].id,
+                        "exercise_id": picked.id,
                         "sets": 4,
                         "reps": "6-10",
                         "weight": "heavy",
@@ -273,9 +369,10 @@ class PlanGenerator:
         elif focus == WorkoutFocus.LOWER_BODY:
             lower_exercises = ["squat", "deadlift", "leg_press", "lunges"]
             for exercise in lower_exercises[:4]:
-                if exercise in exercise_map:
+                picked = pick(exercise)
+                if picked:
                     selected_exercises.append({
-                        "exercise_id": exercise_map[exercise].id,
+                        "exercise_id": picked.id,
                         "sets": 4,
                         "reps": "5-8",
                         "weight": "heavy",
@@ -283,6 +380,11 @@ class PlanGenerator:
                     })
 
         # Si no se encontraron ejercicios, agregar algunos genéricos
+        if substitutions is not None:
+            exercises = [
+                ex for ex in exercises
+                if ex.equipment_id not in substitutions.excluded_equipment_ids
+            ]
         if not selected_exercises and exercises:
             for i, exercise in enumerate(exercises[:3]):
                 selected_exercises.append({
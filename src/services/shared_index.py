@@ -0,0 +1,96 @@
+"""
+In-process indexes built from the database and kept in step across workers.
+
+A SharedIndex holds one index per worker. Writes update it incrementally
+and bump a generation counter (a tag version) in the shared cache;
+workers that see a generation they did not produce reload from the
+database on their next read. Indexes also expire after ``ttl_seconds``
+in case the shared cache is unreachable.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from typing import Generic, TypeVar
+
+from sqlalchemy.orm import Session
+
+from src.core.cache import CacheBackend, CacheError, cache
+
+IndexT = TypeVar("IndexT")
+ResultT = TypeVar("ResultT")
+
+
+class SharedIndex(ABC, Generic[IndexT]):
+    """Base class; subclasses set ``generation_tag`` and implement ``build``"""
+
+    generation_tag: str
+
+    def __init__(
+        self,
+        ttl_seconds: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+        shared: CacheBackend | None = None,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self.shared = shared if shared is not None else cache
+        self._index: IndexT | None = None
+        self._generation: int | None = None
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    @abstractmethod
+    def build(self, db: Session) -> IndexT:
+        """A complete index from the database"""
+
+    def _current_generation(self) -> int | None:
+        try:
+            return self.shared.tag_versions([self.generation_tag])[self.generation_tag]
+        except CacheError:
+            return None  # Fall back to the TTL alone
+
+    def _is_fresh(self, generation: int | None) -> bool:
+        return (
+            self._index is not None
+            and self.clock() - self._loaded_at < self.ttl_seconds
+            and (generation is None or generation == self._generation)
+        )
+
+    def load(self, db: Session) -> IndexT:
+        generation = self._current_generation()
+        index = self.build(db)
+        with self._lock:
+            self._index = index
+            self._generation = generation
+            self._loaded_at = self.clock()
+        return index
+
+    def read(self, db: Session, reader: Callable[[IndexT], ResultT]) -> ResultT:
+        """
+        ``reader`` applied to a current index under the lock; ``db`` is only
+        used to (re)load it
+        """
+        index = self._index
+        if index is None or not self._is_fresh(self._current_generation()):
+            index = self.load(db)
+        with self._lock:
+            return reader(index)
+
+    def _apply(self, change: Callable[[IndexT], None]) -> None:
+        try:
+            generation = self.shared.bump_tag(self.generation_tag)
+        except CacheError:
+            generation = None
+        with self._lock:
+            if self._index is None:
+                return  # Not loaded yet; the next read loads from the database
+            change(self._index)
+            # Stay current only if no other worker wrote in between
+            if generation is not None and self._generation == generation - 1:
+                self._generation = generation
+            else:
+                self._index = None  # Reload on the next read
@@ -0,0 +1,156 @@
+"""
+Estimated one-rep max (e1RM) of a client on an exercise over time.
+
+A set of ``reps`` at ``weight`` estimates the one-rep max with Epley,
+``weight * (1 + reps / 30)``, or Brzycki, ``weight * 36 / (37 - reps)``.
+Sets of more than MAX_REPS reps say little about a single and are left
+out. The functions below take a client's whole history as parallel
+sequences (one element per set, ordered by date) and return sequences, so
+a curve is a handful of passes over a few thousand numbers.
+
+Curves are cached per (client, exercise, formula) and dropped whenever
+the client logs sets or completes a session (``invalidate``).
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Collection, Sequence
+from datetime import date
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from src.core.cache import CacheBackend, cache
+from src.crud.plan import exercise_progress
+
+FORMULAS = ("epley", "brzycki")
+MAX_REPS = 12
+# Days for a session's weight in the trend to halve
+TREND_HALF_LIFE_DAYS = 28.0
+CURVE_CACHE_TTL = 24 * 3600
+
+
+def estimate_one_rep_max(
+    weights: Sequence[float], reps: Sequence[int], formula: str = "epley"
+) -> list[float | None]:
+    """e1RM of each set, None for sets without reps or above MAX_REPS"""
+    if formula not in FORMULAS:
+        raise ValueError(f"Unknown formula: {formula}")
+    estimates: list[float | None] = []
+    for weight, count in zip(weights, reps, strict=True):
+        if not 1 <= count <= MAX_REPS:
+            estimates.append(None)
+        elif count == 1:
+            estimates.append(weight)
+        elif formula == "epley":
+            estimates.append(weight * (1 + count / 30))
+        else:
+            estimates.append(weight * 36 / (37 - count))
+    return estimates
+
+
+def session_bests(
+    days: Sequence[date], estimates: Sequence[float | None]
+) -> tuple[list[date], list[float]]:
+    """Best estimate of each day with one, for ``days`` in order"""
+    best_days: list[date] = []
+    bests: list[float] = []
+    for day, estimate in zip(days, estimates, strict=True):
+        if estimate is None:
+            continue
+        if best_days and best_days[-1] == day:
+            bests[-1] = max(bests[-1], estimate)
+        else:
+            best_days.append(day)
+            bests.append(estimate)
+    return best_days, bests
+
+
+def smoothed_trend(
+    days: Sequence[date],
+    values: Sequence[float],
+    half_life_days: float = TREND_HALF_LIFE_DAYS,
+) -> list[float]:
+    """
+    Exponentially weighted moving average of ``values`` that accounts for
+    the time between them: after a gap of ``half_life_days`` the previous
+    trend and the new value weigh the same.
+    """
+    trend: list[float] = []
+    previous_day = None
+    for day, value in zip(days, values, strict=True):
+        if previous_day is None:
+            trend.append(value)
+        else:
+            gap = (day - previous_day).days
+            keep = math.pow(0.5, gap / half_life_days)
+            trend.append(keep * trend[-1] + (1 - keep) * value)
+        previous_day = day
+    return trend
+
+
+def strength_curve(
+    days: Sequence[date],
+    weights: Sequence[float],
+    reps: Sequence[int],
+    formula: str = "epley",
+) -> dict:
+    """Per-session best e1RM and its trend from per-set history"""
+    estimates = estimate_one_rep_max(weights, reps, formula)
+    best_days, bests = session_bests(days, estimates)
+    trend = smoothed_trend(best_days, bests)
+    return {
+        "formula": formula,
+        "dates": [day.isoformat() for day in best_days],
+        "best": [round(value, 1) for value in bests],
+        "trend": [round(value, 1) for value in trend],
+        "max": round(max(bests), 1) if bests else None,
+        "current": round(trend[-1], 1) if trend else None,
+    }
+
+
+class StrengthCurves:
+    """Cached strength curves"""
+
+    def __init__(self, shared: CacheBackend | None = None):
+        self.shared = shared if shared is not None else cache
+
+    @staticmethod
+    def _tag(client_id) -> str:
+        return f"strength:{client_id}"
+
+    def get(
+        self, db: Session, client_id: UUID, exercise_id: int, formula: str = "epley"
+    ) -> dict:
+        """The client's curve on the exercise, computed on a cache miss"""
+
+        def compute() -> dict:
+            days: list[date] = []
+            weights: list[float] = []
+            reps: list[int] = []
+            for day, weight_kg, reps_done in exercise_progress(db).history(
+                client_id, exercise_id
+            ):
+                for count in reps_done:
+                    if isinstance(count, int):
+                        days.append(day)
+                        weights.append(weight_kg)
+                        reps.append(count)
+            return strength_curve(days, weights, reps, formula)
+
+        return self.shared.get_or_set(
+            f"strength:{client_id}:{exercise_id}:{formula}",
+            compute,
+            ttl=CURVE_CACHE_TTL,
+            tags=(self._tag(client_id),),
+        )
+
+    def invalidate(self, client_ids: Collection) -> None:
+        """Drop the curves of clients who logged new sets"""
+        tags = {self._tag(client_id) for client_id in client_ids if client_id}
+        if tags:
+            self.shared.invalidate_tags(*tags)
+
+
+strength_curves = StrengthCurves()
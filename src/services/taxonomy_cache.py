@@ -0,0 +1,225 @@
+"""
+In-memory cache of the exercise lookup tables.
+
+The six taxonomy tables (categories, movement types, muscle groups,
+equipment, positions, contraction types) are tiny and change rarely, so
+each is held as an immutable snapshot: the serialized rows in id order, a
+read-only id map and an ETag over the content. Write endpoints invalidate
+the affected table through a generation counter in the shared cache, which
+every worker checks before serving its snapshot; snapshots also expire
+after TAXONOMY_CACHE_TTL_SECONDS in case the shared cache is unreachable.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+
+from src.core.cache import CacheBackend, CacheError, cache
+from src.core.config import settings
+from src.core.database import SessionLocal
+from src.models import exercise as models
+from src.schemas import exercise as schemas
+
+# Table key -> (model, response schema)
+TAXONOMY_TABLES: Mapping[str, tuple[type, type[BaseModel]]] = MappingProxyType(
+    {
+        "categories": (models.ExerciseCategory, schemas.ExerciseCategory),
+        "movement_types": (models.MovementType, schemas.MovementType),
+        "muscle_groups": (models.MuscleGroup, schemas.MuscleGroup),
+        "equipment": (models.Equipment, schemas.Equipment),
+        "positions": (models.Position, schemas.Position),
+        "contraction_types": (models.ContractionType, schemas.ContractionType),
+    }
+)
+
+# Exercise relationship -> table key
+EXERCISE_LOOKUPS: Mapping[str, str] = MappingProxyType(
+    {
+        "category": "categories",
+        "movement_type": "movement_types",
+        "muscle_group": "muscle_groups",
+        "equipment": "equipment",
+        "position": "positions",
+        "contraction_type": "contraction_types",
+    }
+)
+
+
+@dataclass(frozen=True)
+class TaxonomySnapshot:
+    """Immutable view of one lookup table"""
+
+    items: tuple[BaseModel, ...]
+    by_id: Mapping[int, BaseModel]
+    data_by_id: Mapping[int, dict]
+    etag: str
+    loaded_at: float
+    generation: int | None = None
+
+    @property
+    def total(self) -> int:
+        return len(self.items)
+
+    def page(self, skip: int, limit: int) -> list[BaseModel]:
+        return list(self.items[skip : skip + limit])
+
+
+def build_snapshot(
+    rows: list,
+    schema: type[BaseModel],
+    loaded_at: float,
+    generation: int | None = None,
+) -> TaxonomySnapshot:
+    items = tuple(schema.model_validate(row) for row in rows)
+    data = [item.model_dump(mode="json") for item in items]
+    payload = json.dumps(data, sort_keys=True)
+    etag = '"' + hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32] + '"'
+    return TaxonomySnapshot(
+        items=items,
+        by_id=MappingProxyType({item.id: item for item in items}),
+        data_by_id=MappingProxyType(
+            {item.id: d for item, d in zip(items, data, strict=True)}
+        ),
+        etag=etag,
+        loaded_at=loaded_at,
+        generation=generation,
+    )
+
+
+class TaxonomyCache:
+    """
+    Lazily loaded, per-table snapshots of the lookup tables.
+
+    Each table has a generation counter in the shared cache, bumped on
+    invalidation, so a write on one worker makes every worker reload.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+        shared: CacheBackend | None = None,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self.shared = shared if shared is not None else cache
+        self._snapshots: dict[str, TaxonomySnapshot] = {}
+        self._lock = threading.Lock()
+
+    def _generations(self, tables: Iterable[str]) -> dict[str, int | None]:
+        tables = list(tables)
+        try:
+            versions = self.shared.tag_versions(f"taxonomy:{t}" for t in tables)
+        except CacheError:
+            return dict.fromkeys(tables)  # Fall back to the TTL alone
+        return {table: versions[f"taxonomy:{table}"] for table in tables}
+
+    def _is_fresh(
+        self, snapshot: TaxonomySnapshot | None, generation: int | None
+    ) -> bool:
+        return (
+            snapshot is not None
+            and self.clock() - snapshot.loaded_at < self.ttl_seconds
+            and (generation is None or snapshot.generation == generation)
+        )
+
+    def _load(
+        self, db: Session, table: str, generation: int | None
+    ) -> TaxonomySnapshot:
+        model, schema = TAXONOMY_TABLES[table]
+        rows = db.query(model).order_by(model.id).all()
+        snapshot = build_snapshot(rows, schema, self.clock(), generation)
+        self._snapshots[table] = snapshot
+        return snapshot
+
+    def _get(self, db: Session, table: str, generation: int | None) -> TaxonomySnapshot:
+        snapshot = self._snapshots.get(table)
+        if self._is_fresh(snapshot, generation):
+            return snapshot
+        with self._lock:
+            snapshot = self._snapshots.get(table)
+            if self._is_fresh(snapshot, generation):
+                return snapshot
+            return self._load(db, table, generation)
+
+    def get(self, db: Session, table: str) -> TaxonomySnapshot:
+        """Snapshot for ``table``, loading it with ``db`` if missing or stale"""
+        return self._get(db, table, self._generations([table])[table])
+
+    def get_item(
+        self, db: Session, table: str, item_id: int
+    ) -> tuple[TaxonomySnapshot, BaseModel | None]:
+        """Snapshot and the row with ``item_id`` from it, if any"""
+        generation = self._generations([table])[table]
+        snapshot = self._get(db, table, generation)
+        item = snapshot.by_id.get(item_id)
+        if item is None:
+            # The row may have been created by another worker since loading
+            model, _ = TAXONOMY_TABLES[table]
+            if db.query(model.id).filter(model.id == item_id).first() is not None:
+                with self._lock:
+                    snapshot = self._load(db, table, generation)
+                item = snapshot.by_id.get(item_id)
+        return snapshot, item
+
+    def resolve(
+        self, db: Session, table: str, ids: Iterable[int | None]
+    ) -> Mapping[int, dict]:
+        """
+        Serialized rows of ``table`` by id, for embedding in responses.
+
+        Reloads the table once if any of ``ids`` is not in the snapshot.
+        """
+        snapshot = self.get(db, table)
+        missing = next(
+            (i for i in ids if i is not None and i not in snapshot.by_id), None
+        )
+        if missing is not None:
+            snapshot, _ = self.get_item(db, table, missing)
+        return snapshot.data_by_id
+
+    def version(self, db: Session) -> str:
+        """Combined ETag of all tables, for responses that embed lookups"""
+        generations = self._generations(TAXONOMY_TABLES)
+        return ",".join(
+            self._get(db, table, generation).etag
+            for table, generation in generations.items()
+        )
+
+    def load_all(self, db: Session) -> None:
+        generations = self._generations(TAXONOMY_TABLES)
+        with self._lock:
+            for table, generation in generations.items():
+                self._load(db, table, generation)
+
+    def invalidate(self, table: str | None = None) -> None:
+        """Drop one table's snapshot, or all of them, on every worker"""
+        tables = list(TAXONOMY_TABLES) if table is None else [table]
+        with self._lock:
+            for name in tables:
+                self._snapshots.pop(name, None)
+        # "taxonomy" covers shared entries that embed any lookup table
+        self.shared.invalidate_tags(
+            *(f"taxonomy:{name}" for name in tables), "taxonomy"
+        )
+
+
+taxonomy_cache = TaxonomyCache(ttl_seconds=settings.TAXONOMY_CACHE_TTL_SECONDS)
+
+
+def warm_taxonomy_cache() -> None:
+    """Load every lookup table; called once at startup"""
+    db = SessionLocal()
+    try:
+        taxonomy_cache.load_all(db)
+    finally:
+        db.close()
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+from typing import Any
+
+from loguru import logger
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from src.core.database import SessionLocal
+from src.core.revocation import revocation_list
+from src.crud.auth import revoked_tokens
+
+# Overlap between incremental syncs so rows committed late are not missed
+SYNC_OVERLAP = timedelta(seconds=5)
+# Full reloads rebuild the Bloom filter and drop expired ids from it
+FULL_RELOAD_INTERVAL = timedelta(hours=1)
+
+_last_full_load: datetime | None = None
+
+
+def load_revocations() -> None:
+    """Load every unexpired revocation into the in-memory list."""
+    global _last_full_load
+
+    started_at = datetime.utcnow()
+    db = SessionLocal()
+    try:
+        revocation_list.load(revoked_tokens.get_active(db), synced_at=started_at)
+    finally:
+        db.close()
+    _last_full_load = started_at
+
+
+def sync_revocations() -> None:
+    """Merge revocations made by other workers since the last sync."""
+    last_synced = revocation_list.last_synced_at
+    if (
+        last_synced is None
+        or _last_full_load is None
+        or datetime.utcnow() - _last_full_load > FULL_RELOAD_INTERVAL
+    ):
+        load_revocations()
+        return
+
+    started_at = datetime.utcnow()
+    db = SessionLocal()
+    try:
+        entries = revoked_tokens.get_active(db, since=last_synced - SYNC_OVERLAP)
+    finally:
+        db.close()
+    revocation_list.merge(entries, synced_at=started_at)
+
+
+def revoke_access_token(db: Session, payload: dict[str, Any]) -> None:
+    """Revoke an access token by its jti, locally and in the database."""
+    jti = payload.get("jti")
+    if not jti:
+        return
+    expires_at = datetime.utcfromtimestamp(payload["exp"])
+    revoked_tokens.revoke(db, jti=jti, expires_at=expires_at)
+    revocation_list.add(jti, expires_at)
+
+
+async def run_revocation_sync(interval_seconds: float) -> None:
+    """Background loop keeping this worker's revocation list current."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await run_in_threadpool(sync_revocations)
+        except Exception as exc:  # Keep serving with the last known list
+            logger.warning(f"Token revocation sync failed: {exc}")
@@ -0,0 +1,179 @@
+"""
+Bulk sync of workouts recorded offline.
+
+The app queues session completions and logged sets while offline and
+replays them in one batch when it reconnects, each with a client-generated
+idempotency key. Keys are claimed with one INSERT ... ON CONFLICT DO
+NOTHING: operations whose key was already recorded are not applied again
+and get the stored result back. The rest are applied with a fixed number
+of bulk statements per batch and their results stored under their keys,
+all in one transaction, so a retried batch never applies anything twice.
+Exercise progress (best and latest loads) and weekly volume are
+updated on the way.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from sqlalchemy import or_, select
+from sqlalchemy.orm import Session
+
+from src.crud.plan import (
+    exercise_progress,
+    plan,
+    sync_operation,
+    weekly_volume,
+    workout_exercise,
+    workout_session,
+)
+from src.models.plan import Plan, WorkoutExercise, WorkoutSession
+from src.models.user import User
+from src.schemas.workout import SyncOperationItem, SyncSessionCompletion, SyncSetLog
+from src.services.strength import strength_curves
+
+KEY_REUSED = "Idempotency key already used for another operation"
+IN_PROGRESS = "Operation still in progress"
+
+
+def _result(key: str, status_code: int, response: dict | None, replayed: bool):
+    response = response or {}
+    return {
+        "idempotency_key": key,
+        "status": status_code,
+        "replayed": replayed,
+        "data": response.get("data"),
+        "detail": response.get("detail"),
+    }
+
+
+def _owned_by(user: User) -> tuple:
+    """Criteria on WorkoutSession limiting writes to what ``user`` may change."""
+    if user.role_id == 1:
+        return ()
+    coached_plans = select(Plan.id).where(Plan.coach_id == user.id)
+    return (
+        or_(
+            WorkoutSession.client_id == user.id,
+            WorkoutSession.plan_id.in_(coached_plans),
+        ),
+    )
+
+
+def sync_workouts(
+    db: Session, user: User, operations: Sequence[SyncOperationItem]
+) -> list[dict]:
+    """
+    Apply a batch of offline operations for ``user`` and return one result
+    per operation, in order.
+
+    Results carry an HTTP-like status: 200 when applied, 404 when the
+    session or exercise does not exist or is not the user's, and 409 when
+    a key was already used for a different operation. ``replayed`` is set
+    when the key was recorded before (or earlier in the same batch) and the
+    stored result is returned without applying the operation again.
+    """
+    first: dict[str, SyncOperationItem] = {}
+    for operation in operations:
+        first.setdefault(operation.idempotency_key, operation)
+
+    claimed = sync_operation(db).claim(
+        user.id, {key: operation.type for key, operation in first.items()}
+    )
+    stored = sync_operation(db).get_many(user.id, first.keys() - claimed)
+
+    to_apply = [first[key] for key in first if key in claimed]
+    completions = [op for op in to_apply if isinstance(op, SyncSessionCompletion)]
+    logs = [op for op in to_apply if isinstance(op, SyncSetLog)]
+    criteria = _owned_by(user)
+    responses: dict[str, tuple[int, dict]] = {}
+
+    completed = {}
+    if completions:
+        completed = workout_session(db).complete_many(completions, *criteria)
+    for completion in completions:
+        if completion.session_id in completed:
+            responses[completion.idempotency_key] = (
+                200,
+                {"data": {"session_id": completion.session_id, "completed": True}},
+            )
+        else:
+            responses[completion.idempotency_key] = (
+                404,
+                {"detail": "Workout session not found"},
+            )
+
+    plan_ids = set(completed.values())
+    progress = {}
+    if logs:
+        exercises = workout_exercise(db)
+        progress, log_plan_ids = exercises.load_progress(
+            {log.workout_exercise_id for log in logs}, *criteria
+        )
+        applied = [log for log in logs if log.workout_exercise_id in progress]
+        exercises.merge_sets(progress, applied)
+        exercises.write_progress(progress)
+        plan_ids |= log_plan_ids
+        for log in logs:
+            if log.workout_exercise_id in progress:
+                responses[log.idempotency_key] = (
+                    200,
+                    {"data": {"exercise": dict(progress[log.workout_exercise_id])}},
+                )
+            else:
+                responses[log.idempotency_key] = (
+                    404,
+                    {"detail": "Workout exercise not found"},
+                )
+
+    if completed or progress:
+        exercise_progress(db).record_performed(
+            or_(
+                WorkoutSession.id.in_(completed),
+                WorkoutExercise.id.in_(progress),
+            )
+        )
+        touched = (
+            db.query(
+                WorkoutSession.client_id,
+                WorkoutSession.date,
+                WorkoutSession.completed,
+            )
+            .filter(
+                or_(
+                    WorkoutSession.id.in_(completed),
+                    WorkoutSession.id.in_(
+                        select(WorkoutExercise.session_id).where(
+                            WorkoutExercise.id.in_(progress)
+                        )
+                    ),
+                )
+            )
+            .distinct()
+            .all()
+        )
+        weekly_volume(db).refresh(
+            (client_id, day) for client_id, day, is_completed in touched if is_completed
+        )
+    plan(db).touch(plan_ids)
+    sync_operation(db).store_results(user.id, responses)
+    db.commit()
+    if completed or progress:
+        strength_curves.invalidate({client_id for client_id, _, _ in touched})
+
+    results = []
+    for operation in operations:
+        key = operation.idempotency_key
+        record = stored.get(key)
+        original = record.operation if record is not None else first[key].type
+        if original != operation.type:
+            results.append(_result(key, 409, {"detail": KEY_REUSED}, False))
+        elif key in responses:
+            status_code, response = responses[key]
+            replayed = operation is not first[key]
+            results.append(_result(key, status_code, response, replayed))
+        elif record is None or record.status is None:
+            results.append(_result(key, 409, {"detail": IN_PROGRESS}, False))
+        else:
+            results.append(_result(key, record.status, record.response, True))
+    return results
@@ -0,0 +1,40 @@
+"""
+Text normalization shared by search features.
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+def fold_accents(value: str) -> str:
+    """Casefolded ``value`` without accents; punctuation is kept"""
+    if not value.isascii():
+        decomposed = unicodedata.normalize("NFKD", value)
+        value = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return value.casefold()
+
+
+def normalize_text(value: str | None) -> str:
+    """
+    Lowercase, accent-free form of ``value`` with punctuation collapsed to
+    single spaces: ``"  Press-Banca Inclinado "`` -> ``"press banca inclinado"``.
+    """
+    if not value:
+        return ""
+    return _NON_WORD.sub(" ", fold_accents(value)).strip()
+
+
+def trigrams(value: str) -> set[str]:
+    """
+    Trigrams of a normalized string, pg_trgm style: each word is padded
+    with two leading spaces and one trailing space.
+    """
+    grams: set[str] = set()
+    for word in value.split():
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return grams
@@ -0,0 +1,79 @@
+"""
+Parsing of the free-text quantities entered in workouts.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+
+KG_PER_LB = 0.45359237
+
+_WEIGHT = re.compile(
+    r"^(?P<amount>\d+(?:[.,]\d+)?)\s*(?P<unit>kgs?|kilos?|lbs?|libras?)?$"
+)
+_CLOCK = re.compile(r"^(?:(?P<hours>\d+):)?(?P<minutes>\d{1,2}):(?P<seconds>\d{2})$")
+_DURATION_PART = re.compile(r"(?P<amount>\d+(?:[.,]\d+)?)\s*(?P<unit>[a-z]+)?\s*")
+_SECONDS_PER_UNIT = {
+    **dict.fromkeys(("h", "hr", "hrs", "hora", "horas"), 3600),
+    **dict.fromkeys(("m", "min", "mins", "minuto", "minutos"), 60),
+    **dict.fromkeys(("s", "sec", "secs", "seg", "segs", "segundo", "segundos"), 1),
+}
+
+
+def parse_weight_kg(value: str | None) -> float | None:
+    """
+    Kilograms in a weight such as ``"60kg"``, ``"62,5 kg"``, ``"135 lb"``
+    or ``"60"`` (kg is assumed), or None if ``value`` is empty or not a
+    plain load, e.g. ``"bodyweight"``.
+    """
+    if not value:
+        return None
+    match = _WEIGHT.match(value.strip().casefold())
+    if match is None:
+        return None
+    amount = float(match["amount"].replace(",", "."))
+    unit = match["unit"] or "kg"
+    if unit.startswith(("lb", "libra")):
+        amount *= KG_PER_LB
+    return amount
+
+
+def parse_duration_seconds(value: str | None) -> int | None:
+    """
+    Whole seconds in a duration such as ``"90s"``, ``"2min"``,
+    ``"1m 30s"``, ``"1:30"`` (m:ss), ``"1:02:03"`` or ``"90"`` (seconds
+    are assumed), or None if ``value`` is empty or not a duration.
+    """
+    if not value:
+        return None
+    text = value.strip().casefold()
+    clock = _CLOCK.match(text)
+    if clock is not None:
+        hours = int(clock["hours"] or 0)
+        return hours * 3600 + int(clock["minutes"]) * 60 + int(clock["seconds"])
+
+    seconds = 0.0
+    position = 0
+    parts = 0
+    while position < len(text):
+        part = _DURATION_PART.match(text, position)
+        if part is None:
+            return None
+        unit = part["unit"]
+        if unit is not None and unit not in _SECONDS_PER_UNIT:
+            return None
+        amount = float(part["amount"].replace(",", "."))
+        seconds += amount * _SECONDS_PER_UNIT.get(unit, 1)
+        position = part.end()
+        parts += 1
+        if unit is None and (parts > 1 or position < len(text)):
+            return None  # A bare number only stands alone
+    return round(seconds) if parts else None
+
+
+def total_reps(reps_done: Iterable | None) -> int | None:
+    """Sum of the reps logged per set, or None if nothing was logged."""
+    if not reps_done:
+        return None
+    return sum(reps for reps in reps_done if isinstance(reps, int))
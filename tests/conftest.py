@@ -4,7 +4,7 @@ from uuid import uuid4
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session, sessionmaker
 
 from src.core.database import get_db
@@ -49,6 +49,29 @@ def db_session() -> Generator[Session, None, None]:
         Base.metadata.drop_all(bind=engine)
 
 
+@pytest.fixture
+def sqlite_db() -> Generator[Session, None, None]:
+    """
+    Session on a private in-memory SQLite database with every table.
+
+    UUID columns are rendered as CHAR(32) on this engine only, and every
+    statement it runs is recorded in ``session.info["statements"]``.
+    """
+    engine = create_engine("sqlite://")
+    engine.dialect.type_compiler_instance.visit_UUID = lambda type_, **kw: "CHAR(32)"
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    statements = session.info["statements"] = []
+    event.listen(
+        engine, "before_cursor_execute", lambda *args: statements.append(args[2])
+    )
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
 @pytest.fixture(scope="function")
 def client(db_session: Session) -> Generator[TestClient, None, None]:
     """Create a test client with test database."""
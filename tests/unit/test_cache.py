@@ -0,0 +1,262 @@
+import socket
+import socketserver
+import threading
+import time
+
+import pytest
+
+from src.core.cache import (
+    CacheError,
+    InMemoryCache,
+    RedisCache,
+    cache_from_url,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeRedisServer(socketserver.ThreadingTCPServer):
+    """Tiny server for the subset of the Redis protocol the cache uses"""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, password: str | None = None):
+        super().__init__(("127.0.0.1", 0), FakeRedisHandler)
+        self.password = password
+        self.data: dict[bytes, tuple[bytes, float | None]] = {}
+        self.commands: list[list[bytes]] = []
+        self.lock = threading.Lock()
+
+    def live(self, key: bytes) -> bytes | None:
+        value, expires_at = self.data.get(key, (None, None))
+        if expires_at is not None and expires_at <= time.monotonic():
+            self.data.pop(key, None)
+            return None
+        return value
+
+
+class FakeRedisHandler(socketserver.StreamRequestHandler):
+    def read_command(self) -> list[bytes] | None:
+        header = self.rfile.readline()
+        if not header:
+            return None
+        args = []
+        for _ in range(int(header[1:])):
+            length = int(self.rfile.readline()[1:])
+            args.append(self.rfile.read(length + 2)[:-2])
+        return args
+
+    def reply(self, value) -> None:
+        if value is None:
+            self.wfile.write(b"$-1\r\n")
+        elif isinstance(value, int):
+            self.wfile.write(b":%d\r\n" % value)
+        elif isinstance(value, bytes):
+            self.wfile.write(b"$%d\r\n%s\r\n" % (len(value), value))
+        elif isinstance(value, list):
+            self.wfile.write(b"*%d\r\n" % len(value))
+            for item in value:
+                self.reply(item)
+        elif isinstance(value, Exception):
+            self.wfile.write(b"-ERR %s\r\n" % str(value).encode())
+        else:
+            self.wfile.write(b"+%s\r\n" % value.encode())
+
+    def handle(self) -> None:
+        server = self.server
+        authenticated = server.password is None
+        while (args := self.read_command()) is not None:
+            command = args[0].upper()
+            server.commands.append(args)
+            with server.lock:
+                if command == b"AUTH":
+                    authenticated = args[1].decode() == server.password
+                    self.reply("OK" if authenticated else Exception("invalid"))
+                elif not authenticated:
+                    self.reply(Exception("NOAUTH"))
+                elif command in (b"PING", b"SELECT"):
+                    self.reply("OK")
+                elif command == b"GET":
+                    self.reply(server.live(args[1]))
+                elif command == b"MGET":
+                    self.reply([server.live(key) for key in args[1:]])
+                elif command == b"SET":
+                    expires_at = None
+                    if len(args) == 5 and args[3].upper() == b"PX":
+                        expires_at = time.monotonic() + int(args[4]) / 1000
+                    server.data[args[1]] = (args[2], expires_at)
+                    self.reply("OK")
+                elif command == b"DEL":
+                    removed = [server.data.pop(key, None) for key in args[1:]]
+                    self.reply(sum(value is not None for value in removed))
+                elif command == b"INCRBY":
+                    current = server.live(args[1])
+                    try:
+                        value = int(current or 0) + int(args[2])
+                    except ValueError:
+                        self.reply(Exception("value is not an integer"))
+                        continue
+                    server.data[args[1]] = (str(value).encode(), None)
+                    self.reply(value)
+                else:
+                    self.reply(Exception("unknown command"))
+            self.wfile.flush()
+
+
+@pytest.fixture
+def redis_server():
+    server = FakeRedisServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(params=["memory", "redis"])
+def backend(request):
+    if request.param == "memory":
+        return InMemoryCache(prefix="test:")
+    server = request.getfixturevalue("redis_server")
+    host, port = server.server_address
+    return RedisCache(host, port, prefix="test:")
+
+
+class TestCacheBackends:
+    """Unit tests shared by the in-memory and Redis backends."""
+
+    def test_set_get_delete(self, backend):
+        """Test round-tripping JSON values."""
+        backend.set("plan", {"id": 1, "tags": ["a"]})
+
+        assert backend.get("plan") == {"id": 1, "tags": ["a"]}
+        backend.delete("plan")
+        assert backend.get("plan") is None
+        assert backend.get("plan", "default") == "default"
+
+    def test_incr(self, backend):
+        """Test atomic counters."""
+        assert backend.incr("hits") == 1
+        assert backend.incr("hits", 5) == 6
+
+    def test_tag_invalidation(self, backend):
+        """Test that bumping a tag turns its entries into misses."""
+        backend.set("list", [1, 2], tags=["exercises"])
+        backend.set("other", "x", tags=["plans"])
+
+        backend.invalidate_tags("exercises")
+
+        assert backend.get("list") is None
+        assert backend.get("other") == "x"
+        backend.set("list", [1, 2, 3], tags=["exercises"])
+        assert backend.get("list") == [1, 2, 3]
+        assert backend.bump_tag("exercises") == 2
+        assert backend.tag_versions(["exercises"]) == {"exercises": 2}
+
+    def test_get_or_set(self, backend):
+        """Test that the factory runs only on a miss."""
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return {"templates": []}
+
+        assert backend.get_or_set("templates", factory) == {"templates": []}
+        assert backend.get_or_set("templates", factory) == {"templates": []}
+        assert len(calls) == 1
+
+
+class TestInMemoryCache:
+    """Unit tests for the process-local backend."""
+
+    def test_ttl(self):
+        """Test expiry."""
+        clock = FakeClock()
+        cache = InMemoryCache(clock=clock)
+        cache.set("key", 1, ttl=10)
+
+        clock.now = 9
+        assert cache.get("key") == 1
+        clock.now = 10
+        assert cache.get("key") is None
+
+    def test_lru_cap(self):
+        """Test that the least recently used entry is evicted."""
+        cache = InMemoryCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+
+
+class TestRedisCache:
+    """Unit tests for the Redis protocol backend."""
+
+    def test_keys_are_prefixed_and_ttl_sent(self, redis_server):
+        """Test the commands sent to the server."""
+        cache = RedisCache(*redis_server.server_address, prefix="fitness:")
+        cache.set("key", "value", ttl=2.5)
+
+        assert redis_server.commands[-1][:2] == [b"SET", b"fitness:key"]
+        assert redis_server.commands[-1][3:] == [b"PX", b"2500"]
+
+    def test_connections_are_reused(self, redis_server):
+        """Test the connection pool."""
+        cache = RedisCache(*redis_server.server_address)
+        for i in range(5):
+            cache.set(f"k{i}", i)
+
+        assert cache._pool.qsize() == 1
+
+    def test_from_url_authenticates(self):
+        """Test password and database from the URL."""
+        server = FakeRedisServer(password="s3cret")
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        host, port = server.server_address
+        try:
+            cache = cache_from_url(f"redis://:s3cret@{host}:{port}/2")
+            cache.set("key", 1)
+
+            assert cache.db == 2
+            assert cache.get("key") == 1
+            assert [b"SELECT", b"2"] in server.commands
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_error_reply_raises(self, redis_server):
+        """Test that server errors surface as CacheError."""
+        cache = RedisCache(*redis_server.server_address)
+        cache.set("text", "not a number")
+
+        with pytest.raises(CacheError):
+            cache.execute("INCRBY", "text", 1)
+        assert cache.execute("MGET", "missing") == [None]
+
+    def test_unreachable_server_degrades_to_misses(self):
+        """Test that a down server does not fail requests."""
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        cache = RedisCache("127.0.0.1", port, timeout=0.2)
+
+        cache.set("key", 1)
+        cache.invalidate_tags("exercises")
+        assert cache.get("key", "default") == "default"
+        with pytest.raises(CacheError):
+            cache.incr("counter")
+
+    def test_unsupported_url(self):
+        """Test that unknown schemes are rejected."""
+        with pytest.raises(ValueError):
+            cache_from_url("memcached://localhost")
@@ -0,0 +1,54 @@
+import pytest
+
+from src.api.v1.endpoints.classification import get_classification_type
+from src.crud.classification import classification_type
+from src.models.classification import ClassificationType, ClassificationValue
+
+
+@pytest.fixture
+def db(sqlite_db):
+    grip = ClassificationType(name="Grip")
+    grip.classification_values = [
+        ClassificationValue(value="Wide", order=2),
+        ClassificationValue(value="Neutral", order=0),
+        ClassificationValue(value="Close", order=1),
+    ]
+    sqlite_db.add_all([grip, ClassificationType(name="Tempo")])
+    sqlite_db.commit()
+    sqlite_db.expunge_all()
+    sqlite_db.info["statements"].clear()
+    yield sqlite_db
+
+
+class TestClassificationTypeCRUD:
+    """Unit tests for classification type loading."""
+
+    def test_get_multi_counts_values_in_one_statement(self, db):
+        """Test grouped value counts without loading any values."""
+        types, total = classification_type.get_multi(db)
+
+        counts = {type_obj.name: value_count for type_obj, value_count in types}
+        assert total == 2
+        assert counts == {"Grip": 3, "Tempo": 0}
+        assert len(db.info["statements"]) == 2  # total and page
+        assert "classification_values" not in db.info["statements"][0]
+        assert all("classification_values" not in t.__dict__ for t, _ in types)
+
+    def test_get_multi_filters(self, db):
+        """Test that filters apply to the page and the total."""
+        types, total = classification_type.get_multi(db, search="tem")
+
+        assert total == 1
+        assert [(t.name, n) for t, n in types] == [("Tempo", 0)]
+
+    def test_detail_values_are_ordered(self, db):
+        """Test that values load in one query, in display order."""
+        result = get_classification_type(type_id=1, db=db)
+
+        assert [v.value for v in result.classification_values] == [
+            "Neutral",
+            "Close",
+            "Wide",
+        ]
+        assert result.value_count == 3
+        assert len(db.info["statements"]) == 2
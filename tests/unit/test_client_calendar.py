@@ -0,0 +1,95 @@
+from datetime import date
+from uuid import uuid4
+
+import pytest
+
+from src.crud.plan import workout_session
+from src.models.exercise import Exercise
+from src.models.plan import Plan, WorkoutExercise, WorkoutSession
+
+CLIENT_ID = uuid4()
+
+
+@pytest.fixture
+def db(sqlite_db):
+    sqlite_db.add_all(
+        [
+            Exercise(id=1, name="Squat"),
+            Exercise(id=2, name="Bench press"),
+            Plan(id=1, name="Strength", goal="strength", level="beginner"),
+        ]
+    )
+    sqlite_db.flush()
+    for id, client_id, day in (
+        (1, CLIENT_ID, date(2024, 1, 1)),
+        (2, CLIENT_ID, date(2024, 1, 1)),
+        (3, uuid4(), date(2024, 1, 2)),
+        (4, CLIENT_ID, date(2024, 1, 3)),
+        (5, CLIENT_ID, date(2024, 1, 8)),
+    ):
+        sqlite_db.add(WorkoutSession(id=id, plan_id=1, client_id=client_id, date=day))
+    sqlite_db.add_all(
+        [
+            WorkoutExercise(
+                id=1, session_id=1, exercise_id=1, sets_planned=3, reps_planned="5"
+            ),
+            WorkoutExercise(id=2, session_id=1, exercise_id=2, sets_done=2),
+            WorkoutExercise(id=3, session_id=4, exercise_id=1),
+        ]
+    )
+    sqlite_db.commit()
+    sqlite_db.info["statements"].clear()
+    yield sqlite_db
+
+
+def exercise(id, exercise_id, name, **values):
+    return {
+        "id": id,
+        "exercise_id": exercise_id,
+        "name": name,
+        "sets_planned": None,
+        "reps_planned": None,
+        "weight_planned": None,
+        "sets_done": None,
+        **values,
+    }
+
+
+class TestClientCalendar:
+    """Unit tests for the client calendar."""
+
+    def test_days_in_range_with_exercise_names(self, db):
+        """Test sessions grouped per day from a single range query."""
+        days = workout_session(db).calendar(
+            CLIENT_ID, date(2024, 1, 1), date(2024, 1, 7)
+        )
+
+        assert days == [
+            {
+                "date": date(2024, 1, 1),
+                "sessions": [
+                    {
+                        "id": 1,
+                        "plan_id": 1,
+                        "completed": False,
+                        "exercises": [
+                            exercise(1, 1, "Squat", sets_planned=3, reps_planned="5"),
+                            exercise(2, 2, "Bench press", sets_done=2),
+                        ],
+                    },
+                    {"id": 2, "plan_id": 1, "completed": False, "exercises": []},
+                ],
+            },
+            {
+                "date": date(2024, 1, 3),
+                "sessions": [
+                    {
+                        "id": 4,
+                        "plan_id": 1,
+                        "completed": False,
+                        "exercises": [exercise(3, 1, "Squat")],
+                    }
+                ],
+            },
+        ]
+        assert len(db.info["statements"]) == 1
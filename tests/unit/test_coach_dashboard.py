@@ -0,0 +1,70 @@
+from datetime import date
+from uuid import uuid4
+
+import pytest
+
+from src.crud.plan import workout_session
+from src.models.plan import Plan, WorkoutSession
+from src.models.user import User
+
+COACH_ID = uuid4()
+TODAY = date(2024, 1, 31)
+
+
+def client(name, coach_id=COACH_ID):
+    return User(
+        id=uuid4(),
+        name=name,
+        email=f"{name.lower()}@example.com",
+        password_hash="x",
+        role_id=3,
+        coach_id=coach_id,
+    )
+
+
+@pytest.fixture
+def db(sqlite_db):
+    ana, bea, carl, other = (
+        client("Ana"),
+        client("Bea"),
+        client("Carl"),
+        client("Dan", coach_id=uuid4()),
+    )
+    sqlite_db.add_all(
+        [ana, bea, carl, other, Plan(id=1, name="P", goal="g", level="l")]
+    )
+    sqlite_db.flush()
+    for client_id, day, completed in (
+        (ana.id, date(2024, 1, 2), True),
+        (ana.id, date(2024, 1, 10), False),  # Missed: the streak starts after it
+        (ana.id, date(2024, 1, 20), True),
+        (ana.id, date(2024, 1, 25), True),
+        (ana.id, date(2024, 1, 30), True),
+        (ana.id, TODAY, False),  # Still to do, not missed
+        (ana.id, date(2024, 2, 2), False),
+        (carl.id, date(2023, 6, 1), True),
+        (other.id, TODAY, True),
+    ):
+        sqlite_db.add(
+            WorkoutSession(
+                plan_id=1, client_id=client_id, date=day, completed=completed
+            )
+        )
+    sqlite_db.commit()
+    sqlite_db.info["statements"].clear()
+    yield sqlite_db
+
+
+class TestCoachDashboard:
+    """Unit tests for coach adherence dashboard."""
+
+    def test_adherence_per_client(self, db):
+        """Test windows, last workout and streak in a single query."""
+        rows = workout_session(db).adherence(COACH_ID, TODAY)
+
+        assert [tuple(row)[1:] for row in rows] == [
+            ("Ana", 3, 2, 6, 4, date(2024, 1, 30), 3),
+            ("Bea", 0, 0, 0, 0, None, 0),
+            ("Carl", 0, 0, 0, 0, date(2023, 6, 1), 1),
+        ]
+        assert len(db.info["statements"]) == 1
@@ -0,0 +1,94 @@
+from datetime import date, datetime
+from uuid import uuid4
+
+from starlette.requests import Request
+
+from src.api.conditional import is_not_modified, weak_etag
+from src.crud.exercise import exercise
+from src.crud.plan import plan
+from src.models.exercise import Exercise
+from src.models.plan import Plan, WorkoutExercise, WorkoutSession
+
+
+def make_request(headers: dict[str, str]) -> Request:
+    raw = [(k.lower().encode(), v.encode()) for k, v in headers.items()]
+    return Request({"type": "http", "headers": raw})
+
+
+class TestConditionalValidators:
+    """Unit tests for ETag and Last-Modified validation."""
+
+    def test_weak_etag_depends_on_every_part(self):
+        """Test that changing any input changes the ETag."""
+        now = datetime(2024, 1, 1)
+
+        assert weak_etag("plan", 1, now) == weak_etag("plan", 1, now)
+        assert weak_etag("plan", 1, now) != weak_etag("plan", 2, now)
+        assert weak_etag("plan", 1, now).startswith('W/"')
+
+    def test_if_modified_since(self):
+        """Test second-resolution Last-Modified comparison."""
+        modified = datetime(2024, 1, 1, 12, 0, 0, 500)
+        same = make_request({"If-Modified-Since": "Mon, 01 Jan 2024 12:00:00 GMT"})
+        older = make_request({"If-Modified-Since": "Mon, 01 Jan 2024 11:59:59 GMT"})
+
+        assert is_not_modified(same, '"x"', modified)
+        assert not is_not_modified(older, '"x"', modified)
+
+    def test_if_none_match_takes_precedence(self):
+        """Test that If-Modified-Since is ignored when If-None-Match is sent."""
+        request = make_request(
+            {
+                "If-None-Match": '"old"',
+                "If-Modified-Since": "Mon, 01 Jan 2024 12:00:00 GMT",
+            }
+        )
+
+        assert not is_not_modified(request, '"new"', datetime(2024, 1, 1))
+
+
+class TestVersionQueries:
+    """Unit tests for the aggregate freshness queries."""
+
+    def test_exercise_list_version_tracks_filters(self, sqlite_db):
+        """Test count and max(updated_at) over a filtered set."""
+        sqlite_db.add_all(
+            [
+                Exercise(name="Squat", category_id=1),
+                Exercise(name="Bench Press", category_id=2),
+            ]
+        )
+        sqlite_db.commit()
+
+        total, last_updated = exercise.get_list_version(sqlite_db, category_id=1)
+        searched, _ = exercise.get_list_version(sqlite_db, search="press")
+
+        assert total == 1
+        assert isinstance(last_updated, datetime)
+        assert searched == 1
+        assert exercise.get_version(sqlite_db, id=999) is None
+
+    def test_plan_touched_by_child_writes(self, sqlite_db):
+        """Test that session and exercise writes bump Plan.updated_at."""
+        plan_obj = Plan(name="Plan", goal="strength", level="beginner")
+        sqlite_db.add(plan_obj)
+        sqlite_db.commit()
+        plan_obj.updated_at = datetime(2020, 1, 1)
+        sqlite_db.commit()
+
+        session = WorkoutSession(
+            plan_id=plan_obj.id, client_id=uuid4(), date=date(2024, 1, 1)
+        )
+        sqlite_db.add(session)
+        sqlite_db.commit()
+        after_session = plan(sqlite_db).get_version(plan_obj.id)
+        assert after_session > datetime(2020, 1, 1)
+
+        plan_obj.updated_at = datetime(2020, 1, 1)
+        sqlite_db.commit()
+        sqlite_db.add(
+            WorkoutExercise(session_id=session.id, exercise_id=1, sets_planned=3)
+        )
+        sqlite_db.commit()
+
+        assert plan(sqlite_db).get_version(plan_obj.id) > datetime(2020, 1, 1)
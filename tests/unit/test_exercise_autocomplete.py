@@ -0,0 +1,122 @@
+import pytest
+
+from src.core.cache import InMemoryCache
+from src.models.exercise import Exercise
+from src.services.exercise_autocomplete import (
+    AutocompleteIndex,
+    ExerciseAutocomplete,
+    make_entry,
+)
+from src.utils.text import normalize_text, trigrams
+
+NAMES = [
+    (1, "Bench Press", "BP"),
+    (2, "Incline Bench Press", None),
+    (3, "Press Banca Inclinado", None),
+    (4, "Back Squat", None),
+    (5, "Sentadilla Búlgara", None),
+]
+
+
+@pytest.fixture
+def index():
+    return AutocompleteIndex.from_entries(make_entry(*row) for row in NAMES)
+
+
+@pytest.fixture
+def db(sqlite_db):
+    sqlite_db.add_all(Exercise(id=i, name=n, short_name=s) for i, n, s in NAMES)
+    sqlite_db.commit()
+    sqlite_db.info["statements"].clear()
+    yield sqlite_db
+
+
+def ids(entries):
+    return [entry.id for entry in entries]
+
+
+class TestText:
+    """Unit tests for text normalization."""
+
+    def test_normalize_text(self):
+        """Test case, accents and punctuation."""
+        assert normalize_text("  Sentadilla Búlgara ") == "sentadilla bulgara"
+        assert normalize_text("Push-Up_(wide)") == "push up wide"
+        assert normalize_text(None) == ""
+
+    def test_trigrams(self):
+        """Test pg_trgm style padding."""
+        assert trigrams("ab") == {"  a", " ab", "ab "}
+
+
+class TestAutocompleteIndex:
+    """Unit tests for prefix and trigram lookups."""
+
+    def test_name_prefixes_before_word_prefixes(self, index):
+        """Test ranking of whole-name and word-start matches."""
+        assert ids(index.search("press")) == [3, 1, 2]
+        assert ids(index.search("BENCH")) == [1, 2]
+        assert ids(index.search("bp")) == [1]
+        assert ids(index.search("bulg")) == [5]
+
+    def test_fuzzy_matches(self, index):
+        """Test misspelled and infix queries."""
+        assert ids(index.search("sqat")) == [4]
+        assert 4 in ids(index.search("quat"))
+        assert index.search("xyz") == []
+
+    def test_limit(self, index):
+        """Test that results stop at the limit."""
+        assert len(index.search("press", limit=2)) == 2
+        assert index.search("", limit=5) == []
+
+    def test_incremental_updates_match_bulk_build(self, index):
+        """Test add, rename and remove."""
+        incremental = AutocompleteIndex()
+        for row in NAMES:
+            incremental.add(make_entry(*row))
+        assert ids(incremental.search("press")) == ids(index.search("press"))
+
+        index.add(make_entry(4, "Front Squat"))
+        assert ids(index.search("front")) == [4]
+        assert index.search("back") == []
+
+        index.remove(4)
+        assert index.search("squat") == []
+        assert len(index) == 4
+        index.remove(4)  # Unknown ids are ignored
+
+
+class TestExerciseAutocomplete:
+    """Unit tests for keeping worker indexes in step."""
+
+    def test_searches_do_not_query_once_loaded(self, db):
+        """Test that only the first search touches the database."""
+        autocomplete = ExerciseAutocomplete(shared=InMemoryCache())
+        autocomplete.search(db, "ben")
+        db.info["statements"].clear()
+
+        assert ids(autocomplete.search(db, "ben")) == [1, 2]
+        assert db.info["statements"] == []
+
+    def test_writes_reach_other_workers(self, db):
+        """Test incremental updates locally and reloads elsewhere."""
+        shared = InMemoryCache()
+        writer = ExerciseAutocomplete(shared=shared)
+        reader = ExerciseAutocomplete(shared=shared)
+        writer.search(db, "x")
+        reader.search(db, "x")
+
+        squat = db.get(Exercise, 4)
+        squat.name = "Front Squat"
+        db.commit()
+        writer.upsert(squat)
+        db.info["statements"].clear()
+
+        assert ids(writer.search(db, "front")) == [4]
+        assert db.info["statements"] == []
+        assert ids(reader.search(db, "front")) == [4]
+        assert len(db.info["statements"]) == 1
+
+        writer.remove(4)
+        assert writer.search(db, "front") == []
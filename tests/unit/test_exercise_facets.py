@@ -0,0 +1,67 @@
+import pytest
+
+from src.crud.exercise import exercise
+from src.models.exercise import Equipment, Exercise, ExerciseCategory
+
+
+@pytest.fixture
+def db(sqlite_db):
+    sqlite_db.add_all(
+        [
+            ExerciseCategory(id=1, name="Strength"),
+            ExerciseCategory(id=2, name="Cardio"),
+            Equipment(id=1, name="Barbell"),
+            Equipment(id=2, name="Dumbbell"),
+        ]
+    )
+    sqlite_db.add_all(
+        [
+            Exercise(name="Back Squat", category_id=1, equipment_id=1),
+            Exercise(name="Bench Press", category_id=1, equipment_id=1),
+            Exercise(name="Dumbbell Row", category_id=1, equipment_id=2),
+            Exercise(name="Burpee", category_id=2),
+        ]
+    )
+    sqlite_db.commit()
+    sqlite_db.info["statements"].clear()
+    yield sqlite_db
+
+
+class TestExerciseFacetCounts:
+    """Unit tests for per-facet exercise counts."""
+
+    def test_counts_every_facet_in_one_statement(self, db):
+        """Test totals and value counts without filters."""
+        total, counts = exercise.get_facet_counts(db, facets={})
+
+        assert total == 4
+        assert counts["category"] == {1: 3, 2: 1}
+        assert counts["equipment"] == {1: 2, 2: 1}
+        assert counts["position"] == {}
+        assert len(db.info["statements"]) == 1
+
+    def test_facet_ignores_its_own_filter(self, db):
+        """Test that a selected value leaves its alternatives countable."""
+        total, counts = exercise.get_facet_counts(
+            db, facets={"category": 1, "equipment": 2}
+        )
+
+        assert total == 1
+        assert counts["category"] == {1: 1}  # Only equipment 2 applies
+        assert counts["equipment"] == {1: 2, 2: 1}  # Only category 1 applies
+
+    def test_shared_filters_apply_to_every_facet(self, db):
+        """Test search narrowing totals and counts."""
+        total, counts = exercise.get_facet_counts(
+            db, facets={"category": 2}, search="squat"
+        )
+
+        assert total == 0
+        assert counts["category"] == {1: 1}
+        assert counts["equipment"] == {}
+
+    def test_search_with_facet_filters(self, db):
+        """Test ranked search narrowed by a facet."""
+        results = exercise.search_exercises(db, query="bench or row", equipment_id=2)
+
+        assert [row.name for row in results] == ["Dumbbell Row"]
@@ -0,0 +1,94 @@
+from datetime import date
+from uuid import uuid4
+
+import pytest
+
+from src.crud.plan import exercise_progress, workout_exercise, workout_session
+from src.models.exercise import Exercise
+from src.models.plan import ExerciseProgress, Plan, WorkoutExercise, WorkoutSession
+from src.schemas.workout import WorkoutSetLog
+
+CLIENT_ID = uuid4()
+
+
+@pytest.fixture
+def db(sqlite_db):
+    squat = Exercise(name="Squat")
+    plan_obj = Plan(name="Strength", goal="strength", level="beginner")
+    sqlite_db.add_all([squat, plan_obj])
+    sqlite_db.flush()
+    # Day 1: 100kg, day 2: 90kg, day 3: planned only
+    for day, weight, reps in ((1, "100kg", [5]), (2, "90 kg", [8, 8]), (3, None, None)):
+        workout = WorkoutSession(
+            plan_id=plan_obj.id, client_id=CLIENT_ID, date=date(2024, 1, day)
+        )
+        workout.workout_exercises = [
+            WorkoutExercise(
+                exercise_id=squat.id,
+                sets_planned=3,
+                reps_planned="5",
+                sets_done=len(reps or ()),
+                reps_done=reps,
+                weight_used=weight,
+            )
+        ]
+        sqlite_db.add(workout)
+    sqlite_db.commit()
+    sqlite_db.expunge_all()
+    sqlite_db.info["statements"].clear()
+    yield sqlite_db
+
+
+def progress_row(db):
+    db.expunge_all()
+    row = db.query(ExerciseProgress).one()
+    return row.max_weight_lifted, row.last_weight_used, row.last_session_date
+
+
+class TestExerciseProgress:
+    """Unit tests for incremental exercise progress."""
+
+    def test_completion_upserts_best_and_latest(self, db):
+        """Test that completions fold in, in any order."""
+        workout_session(db).mark_completed(2)
+        assert progress_row(db) == (90, 90, date(2024, 1, 2))
+
+        db.info["statements"].clear()
+        workout_session(db).mark_completed(1)
+
+        # The older, heavier session raises the best but not the latest
+        assert progress_row(db) == (100, 90, date(2024, 1, 2))
+        upserts = [
+            s
+            for s in db.info["statements"]
+            if s.startswith("INSERT INTO exercise_progress")
+        ]
+        assert len(upserts) == 1
+
+    def test_logged_sets_count(self, db):
+        """Test that logging sets records progress before completion."""
+        workout = db.get(WorkoutSession, 3)
+
+        workout_exercise(db).log_sets(
+            workout,
+            [
+                WorkoutSetLog(
+                    workout_exercise_id=3,
+                    set_number=1,
+                    reps_completed=3,
+                    weight_used="110kg",
+                )
+            ],
+        )
+
+        assert progress_row(db) == (110, 110, date(2024, 1, 3))
+
+    def test_rebuild(self, db):
+        """Test recomputing every row from the history in chunks."""
+        db.add(
+            ExerciseProgress(client_id=CLIENT_ID, exercise_id=1, max_weight_lifted=500)
+        )
+        db.commit()
+
+        assert exercise_progress(db).rebuild(chunk_size=1) == 1
+        assert progress_row(db) == (100, 90, date(2024, 1, 2))
@@ -0,0 +1,100 @@
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from src.crud.exercise import exercise
+from src.models.exercise import Exercise
+from src.services.exercise_search import matches, websearch_to_fts5
+
+
+@pytest.fixture
+def db(sqlite_db):
+    sqlite_db.add_all(
+        [
+            Exercise(name="Bench Press", short_name="BP", description="Chest press"),
+            Exercise(name="Incline Dumbbell Press", description="Upper chest"),
+            Exercise(name="Push-up", description="Bodyweight press for the chest"),
+            Exercise(name="Back Squat", description="Barbell on the back"),
+        ]
+    )
+    sqlite_db.commit()
+    yield sqlite_db
+
+
+def names(rows):
+    return [row.name for row in rows]
+
+
+class TestWebsearchToFts5:
+    """Unit tests for translating websearch syntax to FTS5."""
+
+    def test_words_phrases_or_and_exclusions(self):
+        """Test each websearch construct."""
+        assert websearch_to_fts5("bench press") == '("bench" AND "press")'
+        assert websearch_to_fts5('"bench press"') == '("bench press")'
+        assert websearch_to_fts5("squat or lunge") == '("squat") OR ("lunge")'
+        assert websearch_to_fts5("press -bench") == '(("press")) NOT "bench"'
+
+    def test_syntax_is_not_injected(self):
+        """Test that FTS5 operators in user input are quoted."""
+        assert websearch_to_fts5('NEAR(a b) "x') == '("NEAR a" AND "b" AND "x")'
+        assert websearch_to_fts5("push-up") == '("push up")'
+        assert websearch_to_fts5("-- * ()") is None
+
+
+class TestExerciseSearch:
+    """Unit tests for ranked exercise search on SQLite FTS5."""
+
+    def test_name_matches_rank_first(self, db):
+        """Test that name hits outrank description hits."""
+        results = exercise.search_exercises(db, query="chest")
+        assert names(results)[-1] == "Push-up"  # Longest description
+
+        results = exercise.search_exercises(db, query="press")
+        assert names(results)[:2] == ["Bench Press", "Incline Dumbbell Press"]
+        assert "Push-up" in names(results)
+
+    def test_stemming_phrases_and_exclusions(self, db):
+        """Test English stemming and websearch operators."""
+        assert names(exercise.search_exercises(db, query="squats")) == ["Back Squat"]
+        assert names(exercise.search_exercises(db, query='"upper chest"')) == [
+            "Incline Dumbbell Press"
+        ]
+        assert "Bench Press" not in names(
+            exercise.search_exercises(db, query="press -bench")
+        )
+        assert exercise.search_exercises(db, query="-press") == []
+
+    def test_total_and_pagination(self, db):
+        """Test that the total counts every match and pages follow rank."""
+        total, _ = exercise.get_list_version(db, search="press")
+        page = exercise.search_exercises(db, query="press", skip=1, limit=1)
+
+        assert total == 3
+        assert names(page) == ["Incline Dumbbell Press"]
+
+    def test_index_follows_writes(self, db):
+        """Test that the FTS5 triggers track updates and deletes."""
+        squat = db.query(Exercise).filter(Exercise.name == "Back Squat").one()
+        squat.name = "Front Squat"
+        db.commit()
+        assert names(exercise.search_exercises(db, query="front")) == ["Front Squat"]
+        assert exercise.search_exercises(db, query='"back squat"') == []
+
+        db.delete(squat)
+        db.commit()
+        assert exercise.search_exercises(db, query="squat") == []
+
+    def test_postgresql_uses_websearch_tsquery(self):
+        """Test the statement compiled for PostgreSQL."""
+        pg = SimpleNamespace(
+            get_bind=lambda: SimpleNamespace(dialect=postgresql.dialect())
+        )
+
+        sql = str(select(matches(pg, "bench")).compile(dialect=postgresql.dialect()))
+
+        assert "websearch_to_tsquery" in sql
+        assert "exercises.search_vector @@" in sql
+        assert "ts_rank(exercises.search_vector" in sql
@@ -0,0 +1,212 @@
+import random
+
+import pytest
+
+from src.core.cache import InMemoryCache
+from src.models.exercise import Exercise
+from src.schemas.plan import WorkoutFocus
+from src.services import plan_generator
+from src.services.exercise_autocomplete import ExerciseAutocomplete
+from src.services.exercise_similarity import (
+    ExerciseSimilarity,
+    SimilarityIndex,
+    cosine,
+)
+from src.services.plan_generator import (
+    PPL_INTERMEDIATE,
+    ExerciseSubstitutions,
+    PlanGenerator,
+)
+
+# (muscle_group, movement_type, equipment, category, position, contraction_type)
+BENCH = (1, 1, 1, 1, 1, 1)
+DUMBBELL_BENCH = (1, 1, 2, 1, 1, 1)
+PUSH_UP = (1, 1, None, 1, 2, 1)
+SQUAT = (2, 2, 1, 1, 3, 1)
+
+
+@pytest.fixture
+def db(sqlite_db):
+    rows = [
+        ("Barbell Bench Press", BENCH),
+        ("Dumbbell Floor Press", DUMBBELL_BENCH),
+        ("Push Up", PUSH_UP),
+        ("Back Squat", SQUAT),
+    ]
+    for id, (name, signature) in enumerate(rows, start=1):
+        muscle, movement, equipment, category, position, contraction = signature
+        sqlite_db.add(
+            Exercise(
+                id=id,
+                name=name,
+                muscle_group_id=muscle,
+                movement_type_id=movement,
+                equipment_id=equipment,
+                category_id=category,
+                position_id=position,
+                contraction_type_id=contraction,
+            )
+        )
+    sqlite_db.commit()
+    yield sqlite_db
+
+
+class TestSimilarityIndex:
+    """Unit tests for the signature-grouped cosine index."""
+
+    def test_ranks_by_cosine_and_skips_the_query(self):
+        """Test ordering, scores and self-exclusion."""
+        index = SimilarityIndex.from_rows(
+            [(1, BENCH), (2, DUMBBELL_BENCH), (3, PUSH_UP), (4, SQUAT), (5, BENCH)]
+        )
+
+        found = index.similar(BENCH, 10, exclude_id=1)
+
+        # Sharing all but equipment scores just below having no equipment
+        assert [id for id, _ in found] == [5, 3, 2, 4]
+        assert found[0][1] == pytest.approx(1.0)
+        assert found[2][1] == pytest.approx(16 / 18.25)
+
+    def test_excluded_equipment(self):
+        """Test that substitutes never need excluded equipment."""
+        index = SimilarityIndex.from_rows(
+            [(1, BENCH), (2, DUMBBELL_BENCH), (3, PUSH_UP), (4, SQUAT)]
+        )
+
+        found = index.similar(BENCH, 10, exclude_id=1, excluded_equipment_ids={1, 2})
+
+        assert [id for id, _ in found] == [3]
+
+    def test_add_and_remove(self):
+        """Test incremental updates, including moving between groups."""
+        index = SimilarityIndex.from_rows([(1, BENCH), (2, DUMBBELL_BENCH)])
+        index.add(3, BENCH)
+        index.add(2, SQUAT)
+        index.remove(1)
+
+        assert len(index) == 2
+        assert [id for id, _ in index.similar(BENCH, 10)] == [3, 2]
+        assert index.signature(1) is None
+
+    def test_matches_brute_force(self):
+        """Test the pruned search against scoring every exercise."""
+        rng = random.Random(7)
+
+        def signature():
+            return tuple(
+                rng.choice([None, 1, 2, 3]) if i in (2, 5) else rng.randint(1, 4)
+                for i in range(6)
+            )
+
+        rows = [(id, signature()) for id in range(2000)]
+        index = SimilarityIndex.from_rows(rows)
+        for id, query in rows[:25]:
+            expected = sorted(
+                (-cosine(query, other), other_id)
+                for other_id, other in rows
+                if other_id != id and other[2] != 3 and cosine(query, other) > 0
+            )[:10]
+            found = index.similar(query, 10, exclude_id=id, excluded_equipment_ids={3})
+            assert [(i, round(s, 9)) for i, s in found] == [
+                (i, round(-s, 9)) for s, i in expected
+            ]
+
+
+class TestExerciseSimilarity:
+    """Unit tests for the database-backed similarity index."""
+
+    def test_similar_and_unknown(self, db):
+        """Test lookups by exercise id."""
+        similarity = ExerciseSimilarity(shared=InMemoryCache())
+
+        found = similarity.similar(db, 1, 2, excluded_equipment_ids={2})
+
+        assert [id for id, _ in found] == [3, 4]
+        assert similarity.similar(db, 99) is None
+
+    def test_unindexed_exercise_is_read_from_the_database(self, db):
+        """Test exercises created by another worker before it reloads."""
+        similarity = ExerciseSimilarity(shared=InMemoryCache())
+        similarity.load(db)
+        db.add(
+            Exercise(
+                id=5,
+                name="Floor Press",
+                **dict(
+                    zip(
+                        ("muscle_group_id", "movement_type_id", "equipment_id"),
+                        BENCH[:3],
+                        strict=True,
+                    )
+                ),
+            )
+        )
+        db.commit()
+
+        assert [id for id, _ in similarity.similar(db, 5, 1)] == [1]
+
+
+class TestExerciseSubstitutions:
+    """Unit tests for substitutions in generated plans."""
+
+    @pytest.fixture(autouse=True)
+    def isolated_indexes(self, monkeypatch):
+        shared = InMemoryCache()
+        monkeypatch.setattr(
+            plan_generator, "exercise_similarity", ExerciseSimilarity(shared=shared)
+        )
+        monkeypatch.setattr(
+            plan_generator, "exercise_autocomplete", ExerciseAutocomplete(shared=shared)
+        )
+
+    def test_missing_names_resolve_to_the_closest_name(self, db):
+        """Test that template names not in the catalog are matched."""
+        substitutions = ExerciseSubstitutions(db)
+        selected = PlanGenerator(db)._select_exercises_for_focus(
+            WorkoutFocus.PUSH, PPL_INTERMEDIATE, 1, substitutions
+        )
+
+        # bench_press -> Barbell Bench Press, dumbbell_press -> Dumbbell
+        # Floor Press; nothing is close to overhead_press or dips
+        assert [ex["exercise_id"] for ex in selected] == [1, 2]
+
+    def test_excluded_equipment_is_swapped(self, db):
+        """Test that exercises needing excluded equipment are replaced."""
+        substitutions = ExerciseSubstitutions(
+            db, excluded_equipment_ids={1}, replace_missing=True
+        )
+        selected = PlanGenerator(db)._select_exercises_for_focus(
+            WorkoutFocus.PUSH, PPL_INTERMEDIATE, 1, substitutions
+        )
+
+        # The barbell bench press becomes the most similar exercise without
+        # a barbell, the push up
+        assert [ex["exercise_id"] for ex in selected] == [3, 2]
+
+    def test_swap_skips_exercises_already_picked(self, db):
+        """Test that a picked nearest neighbour gives way to the next one."""
+        substitutions = ExerciseSubstitutions(db, excluded_equipment_ids={1})
+        exercise_map = {
+            ex.name.lower().replace(" ", "_"): ex for ex in db.query(Exercise)
+        }
+
+        nearest = substitutions.resolve("barbell_bench_press", exercise_map)
+        runner_up = substitutions.resolve(
+            "barbell_bench_press", exercise_map, exclude_ids={nearest.id}
+        )
+
+        assert (nearest.id, runner_up.id) == (3, 2)
+
+    def test_missing_name_skips_exercises_already_picked(self, db):
+        """Test that a picked closest name gives way to the next match."""
+        substitutions = ExerciseSubstitutions(db)
+        exercise_map = {
+            ex.name.lower().replace(" ", "_"): ex for ex in db.query(Exercise)
+        }
+
+        closest = substitutions.resolve("press", exercise_map)
+        runner_up = substitutions.resolve(
+            "press", exercise_map, exclude_ids={closest.id}
+        )
+
+        assert (closest.id, runner_up.id) == (1, 2)
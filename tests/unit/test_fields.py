@@ -0,0 +1,124 @@
+import pytest
+from fastapi import HTTPException
+
+from src.api.fields import column_names, projected_schema, select_fields
+from src.api.v1.endpoints.exercise import (
+    EXERCISE_COLUMNS,
+    EXERCISE_RELATIONS,
+    exercise_load_kwargs,
+    serialize_exercises,
+)
+from src.crud.exercise import exercise
+from src.models.exercise import Exercise, ExerciseCategory
+from src.models.user import User
+from src.schemas.exercise import Exercise as ExerciseSchema
+from src.services.taxonomy_cache import taxonomy_cache
+
+SELECTABLE = {"columns": EXERCISE_COLUMNS, "relations": EXERCISE_RELATIONS}
+RELATIONS = ("category", "muscle_group")
+COLUMNS = column_names(ExerciseSchema, (*RELATIONS, "coach"))
+
+
+@pytest.fixture
+def db(sqlite_db):
+    coach = User(name="Coach", email="coach@example.com", password_hash="hash")
+    sqlite_db.add_all([coach, ExerciseCategory(id=1, name="Strength")])
+    sqlite_db.flush()
+    sqlite_db.add(
+        Exercise(
+            name="Squat", description="Long text", category_id=1, coach_id=coach.id
+        )
+    )
+    sqlite_db.commit()
+    taxonomy_cache.invalidate()
+    sqlite_db.expunge_all()
+    sqlite_db.info["statements"].clear()
+    yield sqlite_db
+    taxonomy_cache.invalidate()
+
+
+class TestSelectFields:
+    """Unit tests for fields/include parsing."""
+
+    def test_defaults_to_full_response(self):
+        """Test that no parameters means no projection."""
+        selection = select_fields(None, None, columns=COLUMNS, relations=RELATIONS)
+
+        assert not selection.sparse
+        assert selection.load_kwargs() == {}
+        assert selection.schema(ExerciseSchema, COLUMNS) is ExerciseSchema
+
+    def test_id_is_always_selected(self):
+        """Test that id is added to an explicit column list."""
+        selection = select_fields(
+            "name, name", None, columns=COLUMNS, relations=RELATIONS
+        )
+
+        assert selection.columns == ("id", "name")
+        assert selection.load_kwargs() == {"columns": ("id", "name"), "relations": ()}
+
+    def test_unknown_names_are_rejected(self):
+        """Test 400 responses for unknown fields or relations."""
+        with pytest.raises(HTTPException) as exc:
+            select_fields("name,password", None, columns=COLUMNS, relations=RELATIONS)
+        assert exc.value.status_code == 400
+        assert "password" in exc.value.detail
+
+        with pytest.raises(HTTPException):
+            select_fields(None, "coach_user", columns=COLUMNS, relations=RELATIONS)
+
+    def test_projected_schema_is_cached(self):
+        """Test that projections are built once per field set."""
+        first = projected_schema(ExerciseSchema, ("id", "name"))
+
+        assert first is projected_schema(ExerciseSchema, ("id", "name"))
+        assert set(first.model_fields) == {"id", "name"}
+
+
+class TestProjectionQueries:
+    """Unit tests for column projection and relation loading of exercises."""
+
+    def test_relations_are_selectin_loaded(self, db):
+        """Test one IN query per relation and a reduced coach row."""
+        rows = exercise.get_multi_with_relations(
+            db, columns=("id", "name"), relations=("category", "coach_user")
+        )
+        exercises_sql, *related_sql = db.info["statements"]
+
+        assert rows[0].category.name == "Strength"
+        assert rows[0].coach_user.name == "Coach"
+        assert "JOIN" not in exercises_sql
+        assert "description" not in exercises_sql
+        assert "category_id" in exercises_sql
+        assert len(related_sql) == 2
+        assert not any("password_hash" in sql for sql in related_sql)
+
+    def test_lookups_are_embedded_from_the_taxonomy_cache(self, db):
+        """Test that sparse payloads read lookups from memory."""
+        taxonomy_cache.load_all(db)
+        db.info["statements"].clear()
+        selection = select_fields(
+            "name",
+            "category,coach",
+            columns=EXERCISE_COLUMNS,
+            relations=EXERCISE_RELATIONS,
+        )
+
+        rows = exercise.get_multi_with_relations(db, **exercise_load_kwargs(selection))
+        data = serialize_exercises(db, rows, selection)
+
+        assert set(data[0]) == {"id", "name", "category", "coach"}
+        assert data[0]["category"]["name"] == "Strength"
+        assert data[0]["coach"]["name"] == "Coach"
+        assert not any("exercise_categories" in sql for sql in db.info["statements"])
+
+    def test_full_payload_matches_response_schema(self, db):
+        """Test that the default payload has every Exercise field."""
+        rows = exercise.get_multi_with_relations(
+            db, **exercise_load_kwargs(select_fields(None, None, **SELECTABLE))
+        )
+        data = serialize_exercises(db, rows)
+
+        assert set(data[0]) == set(ExerciseSchema.model_fields)
+        assert ExerciseSchema.model_validate(data[0]).coach.name == "Coach"
+        assert data[0]["muscle_group"] is None
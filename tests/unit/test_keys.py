@@ -0,0 +1,131 @@
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
+from jose import JWTError
+
+from src.core.config import settings
+from src.core.keys import JWKSVerifier, KeyRing
+
+
+def rsa_pems() -> tuple[str, str]:
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem = key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+    public_pem = key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    ).decode()
+    return private_pem, public_pem
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestKeyRing:
+    """Unit tests for JWT key management."""
+
+    def test_symmetric_round_trip(self):
+        """Test that HS256 keeps working without a kid or JWKS."""
+        ring = KeyRing("HS256", secret_key="secret")
+        token = ring.sign({"sub": "user"})
+
+        assert ring.decode(token)["sub"] == "user"
+        assert ring.jwks() == {"keys": []}
+
+    def test_rs256_round_trip_with_kid(self):
+        """Test RS256 signing with a thumbprint key id."""
+        private_pem, _ = rsa_pems()
+        ring = KeyRing("RS256", private_key_pem=private_pem)
+        token = ring.sign({"sub": "user"})
+
+        jwks = ring.jwks()
+        assert len(jwks["keys"]) == 1
+        assert jwks["keys"][0]["kid"] == ring.kid
+        assert "d" not in jwks["keys"][0]
+        assert ring.decode(token)["sub"] == "user"
+
+    def test_es256_round_trip(self):
+        """Test ES256 signing."""
+        key = ec.generate_private_key(ec.SECP256R1())
+        private_pem = key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        ).decode()
+        ring = KeyRing("ES256", private_key_pem=private_pem)
+
+        assert ring.decode(ring.sign({"sub": "user"}))["sub"] == "user"
+
+    def test_rotation_keeps_old_tokens_valid(self):
+        """Test that a retired public key still verifies its tokens."""
+        old_private, old_public = rsa_pems()
+        new_private, _ = rsa_pems()
+        old_token = KeyRing("RS256", private_key_pem=old_private).sign({"sub": "u"})
+
+        rotated = KeyRing(
+            "RS256", private_key_pem=new_private, public_key_pems=[old_public]
+        )
+
+        assert rotated.decode(old_token)["sub"] == "u"
+        assert len(rotated.jwks()["keys"]) == 2
+
+    def test_unknown_kid_is_rejected(self):
+        """Test that tokens from an unknown key fail verification."""
+        ring = KeyRing("RS256", private_key_pem=rsa_pems()[0])
+        other = KeyRing("RS256", private_key_pem=rsa_pems()[0])
+
+        with pytest.raises(JWTError):
+            ring.decode(other.sign({"sub": "u"}))
+
+    def test_asymmetric_settings_require_private_key_file(self, monkeypatch):
+        """Test that RS256 without JWT_PRIVATE_KEY_FILE is a clear config error."""
+        monkeypatch.setattr(settings, "ALGORITHM", "RS256")
+        monkeypatch.setattr(settings, "JWT_PRIVATE_KEY_FILE", None)
+
+        with pytest.raises(ValueError, match="JWT_PRIVATE_KEY_FILE"):
+            KeyRing.from_settings()
+
+
+class TestJWKSVerifier:
+    """Unit tests for the cached JWKS verifier."""
+
+    def test_verifies_and_caches_keys(self):
+        """Test that keys are fetched once and reused."""
+        ring = KeyRing("RS256", private_key_pem=rsa_pems()[0])
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            return ring.jwks()
+
+        verifier = JWKSVerifier(fetch, clock=FakeClock())
+        for _ in range(3):
+            assert verifier.decode(ring.sign({"sub": "u"}))["sub"] == "u"
+
+        assert len(calls) == 1
+
+    def test_unknown_kid_triggers_throttled_refetch(self):
+        """Test that a rotated key is picked up, with refetches rate limited."""
+        old_ring = KeyRing("RS256", private_key_pem=rsa_pems()[0])
+        new_ring = KeyRing("RS256", private_key_pem=rsa_pems()[0])
+        published = {"jwks": old_ring.jwks()}
+        clock = FakeClock()
+        verifier = JWKSVerifier(
+            lambda: published["jwks"], clock=clock, min_refresh_interval=30
+        )
+        verifier.decode(old_ring.sign({"sub": "u"}))
+
+        published["jwks"] = new_ring.jwks()
+        new_token = new_ring.sign({"sub": "u"})
+        with pytest.raises(JWTError):
+            verifier.decode(new_token)  # Too soon to refetch
+
+        clock.now = 31
+        assert verifier.decode(new_token)["sub"] == "u"
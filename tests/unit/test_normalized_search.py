@@ -0,0 +1,84 @@
+import pytest
+
+from src.crud.classification import classification_type, classification_value
+from src.crud.user import user
+from src.models.classification import ClassificationType, ClassificationValue
+from src.models.user import User
+from src.utils.text import fold_accents
+
+
+@pytest.fixture
+def db(sqlite_db):
+    grip = ClassificationType(name="Agarre", description="Posición de las manos")
+    grip.classification_values = [
+        ClassificationValue(value="Prono", description="Palmas hacia atrás"),
+        ClassificationValue(value="Supino"),
+    ]
+    sqlite_db.add_all(
+        [
+            grip,
+            ClassificationType(name="Músculo", description=None),
+            User(name="José Núñez", email="jose@example.com", password_hash="x"),
+            User(name="Zoë Adams", email="zoe@example.com", password_hash="x"),
+        ]
+    )
+    sqlite_db.commit()
+    yield sqlite_db
+
+
+class TestNormalizedColumns:
+    """Unit tests for the normalized shadow columns."""
+
+    def test_maintained_on_insert_and_update(self, db):
+        """Test that shadows follow their source columns."""
+        jose = db.query(User).filter(User.email == "jose@example.com").one()
+        assert jose.name_normalized == "jose nunez"
+
+        jose.name = "José  Ángel-Núñez"
+        db.commit()
+        assert jose.name_normalized == "jose angel nunez"
+
+        muscle = db.query(ClassificationType).filter_by(name="Músculo").one()
+        assert muscle.description_normalized is None
+
+    def test_not_loaded_with_the_row(self, db):
+        """Test that shadows are deferred."""
+        db.expunge_all()
+        jose = db.query(User).filter(User.email == "jose@example.com").one()
+        assert "name_normalized" not in jose.__dict__
+
+    def test_fold_accents_keeps_punctuation(self):
+        """Test the query-side folding used for websearch syntax."""
+        assert (
+            fold_accents('"Press Banca" -Inclinación') == '"press banca" -inclinacion'
+        )
+
+
+class TestAccentInsensitiveSearch:
+    """Unit tests for searching through the shadow columns."""
+
+    def test_users(self, db):
+        """Test name search ignoring accents and case, and email search."""
+        assert [u.email for u in user.search_users(db, query="NUNEZ")] == [
+            "jose@example.com"
+        ]
+        assert [u.name for u in user.search_users(db, query="zoe")] == ["Zoë Adams"]
+        assert [u.name for u in user.search_users(db, query="zoe@")] == ["Zoë Adams"]
+
+    def test_classification_types_and_values(self, db):
+        """Test type and value search ignoring accents."""
+        types, total = classification_type.get_multi(db, search="musculo")
+        assert total == 1
+        assert types[0][0].name == "Músculo"
+
+        types, _ = classification_type.get_multi(db, search="posicion")
+        assert [type_obj.name for type_obj, _ in types] == ["Agarre"]
+
+        values, total = classification_value.get_multi(db, search="ATRAS")
+        assert [value.value for value in values] == ["Prono"]
+
+    def test_wildcards_and_empty_queries_match_nothing_extra(self, db):
+        """Test that LIKE wildcards are not passed through."""
+        assert user.search_users(db, query="%") == []
+        _, total = classification_value.get_multi(db, search="_")
+        assert total == 0
@@ -305,6 +305,7 @@ class TestWorkoutSessionCRUD:
 
         mock_db.commit.return_value = None
         mock_db.refresh.return_value = None
+        mock_db.get_bind.return_value.dialect.name = "postgresql"
 
         result = session_crud.mark_completed(1)
 
@@ -0,0 +1,77 @@
+from datetime import date, timedelta
+from uuid import uuid4
+
+import pytest
+
+from src.api.v1.endpoints.plan import serialize_plan_detail
+from src.crud.plan import plan
+from src.models.exercise import Exercise
+from src.models.plan import Plan, WorkoutExercise, WorkoutSession
+
+
+@pytest.fixture
+def db(sqlite_db):
+    squat = Exercise(name="Squat")
+    plan_obj = Plan(
+        name="Strength", goal="strength", level="beginner", duration_weeks=4
+    )
+    sqlite_db.add_all([squat, plan_obj])
+    sqlite_db.flush()
+    client_id = uuid4()
+    for day in range(12):
+        workout = WorkoutSession(
+            plan_id=plan_obj.id,
+            client_id=client_id,
+            date=date(2024, 1, 1) + timedelta(days=day),
+        )
+        workout.workout_exercises = [
+            WorkoutExercise(exercise_id=squat.id, sets_planned=3, reps_planned="5"),
+            WorkoutExercise(exercise_id=squat.id, sets_planned=3, reps_planned="8"),
+        ]
+        sqlite_db.add(workout)
+    sqlite_db.commit()
+    sqlite_db.expunge_all()
+    sqlite_db.info["statements"].clear()
+    yield sqlite_db
+
+
+class TestPlanDetail:
+    """Unit tests for loading a plan with its nested levels."""
+
+    def test_full_detail_takes_three_queries(self, db):
+        """Test that sessions and exercises are loaded with one query per level."""
+        plan_obj = plan(db).get_detail(1)
+        data = serialize_plan_detail(plan_obj, depth=2)
+
+        assert len(data["workout_sessions"]) == 12
+        assert all(len(s["workout_exercises"]) == 2 for s in data["workout_sessions"])
+        assert len(db.info["statements"]) == 3
+
+    def test_sessions_without_exercises(self, db):
+        """Test omitting the exercise level."""
+        plan_obj = plan(db).get_detail(1, exercises=False)
+        data = serialize_plan_detail(plan_obj, depth=1)
+
+        assert len(data["workout_sessions"]) == 12
+        assert "workout_exercises" not in data["workout_sessions"][0]
+        assert len(db.info["statements"]) == 2
+
+    def test_plan_only(self, db):
+        """Test omitting every nested level."""
+        plan_obj = plan(db).get_detail(1, sessions=False)
+        data = serialize_plan_detail(plan_obj, depth=0)
+
+        assert data["name"] == "Strength"
+        assert "workout_sessions" not in data
+        assert len(db.info["statements"]) == 1
+
+    def test_missing_plan(self, db):
+        """Test that an unknown id returns None."""
+        assert plan(db).get_detail(999) is None
+
+    def test_lists_load_sessions_up_front(self, db):
+        """Test that plan lists do not load sessions per plan."""
+        plans = plan(db).get_multi()
+        assert len(plans[0].workout_sessions[0].workout_exercises) == 2
+
+        assert len(db.info["statements"]) == 3
@@ -0,0 +1,118 @@
+import pytest
+
+from src.core.rate_limit import InMemoryBucketStore, LoginRateLimiter
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestInMemoryBucketStore:
+    """Unit tests for the in-memory token bucket store."""
+
+    def test_burst_then_reject(self):
+        """Test that a full bucket allows `capacity` takes, then rejects."""
+        store = InMemoryBucketStore()
+        decisions = [
+            store.take("k", capacity=3, refill_rate=1.0, now=0.0) for _ in range(4)
+        ]
+
+        assert [d.allowed for d in decisions] == [True, True, True, False]
+        assert decisions[-1].retry_after == pytest.approx(1.0)
+
+    def test_refill_over_time(self):
+        """Test that tokens refill at `refill_rate` per second."""
+        store = InMemoryBucketStore()
+        store.take("k", capacity=1, refill_rate=0.5, now=0.0)
+
+        assert not store.take("k", capacity=1, refill_rate=0.5, now=1.0).allowed
+        assert store.take("k", capacity=1, refill_rate=0.5, now=3.0).allowed
+
+    def test_max_keys_evicts_oldest(self):
+        """Test that the store stays bounded."""
+        store = InMemoryBucketStore(max_keys=2)
+        for key in ("a", "b", "c"):
+            store.take(key, capacity=1, refill_rate=1.0, now=0.0)
+
+        assert list(store._buckets) == ["b", "c"]
+
+
+class TestLoginRateLimiter:
+    """Unit tests for the login rate limiter."""
+
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture
+    def limiter(self, clock):
+        return LoginRateLimiter(
+            ip_capacity=5,
+            ip_refill_per_minute=60,
+            email_capacity=2,
+            email_refill_per_minute=1,
+            clock=clock,
+        )
+
+    def test_email_bucket_is_case_insensitive(self, limiter):
+        """Test that email buckets ignore case and whitespace."""
+        assert limiter.check(email="User@Example.com", client_ip="1.1.1.1").allowed
+        assert limiter.check(email=" user@example.com", client_ip="2.2.2.2").allowed
+
+        decision = limiter.check(email="USER@example.com", client_ip="3.3.3.3")
+
+        assert not decision.allowed
+        assert decision.scope == "email"
+        assert decision.retry_after == pytest.approx(60.0)
+
+    def test_ip_bucket_rejects_spraying(self, limiter):
+        """Test that one IP cannot spray many different emails."""
+        for i in range(5):
+            assert limiter.check(email=f"u{i}@example.com", client_ip="9.9.9.9").allowed
+
+        decision = limiter.check(email="other@example.com", client_ip="9.9.9.9")
+
+        assert not decision.allowed
+        assert decision.scope == "ip"
+
+    def test_rejected_ip_does_not_consume_email_tokens(self, limiter, clock):
+        """Test that an IP rejection leaves the email budget untouched."""
+        for i in range(5):
+            limiter.check(email=f"u{i}@example.com", client_ip="9.9.9.9")
+        limiter.check(email="victim@example.com", client_ip="9.9.9.9")
+
+        assert limiter.check(email="victim@example.com", client_ip="1.1.1.1").allowed
+        assert limiter.check(email="victim@example.com", client_ip="1.1.1.1").allowed
+
+    def test_stats_and_reset(self, limiter):
+        """Test counters and reset."""
+        limiter.check(email="a@example.com", client_ip=None)
+        limiter.check(email="a@example.com", client_ip=None)
+        limiter.check(email="a@example.com", client_ip=None)
+
+        assert limiter.stats() == {"allowed": 2, "rejected_ip": 0, "rejected_email": 1}
+
+        limiter.reset()
+
+        assert limiter.stats()["allowed"] == 0
+        assert limiter.check(email="a@example.com", client_ip=None).allowed
+
+    def test_disabled_limiter_allows_everything(self, clock):
+        """Test that a disabled limiter never rejects."""
+        limiter = LoginRateLimiter(
+            ip_capacity=1,
+            ip_refill_per_minute=1,
+            email_capacity=1,
+            email_refill_per_minute=1,
+            enabled=False,
+            clock=clock,
+        )
+
+        assert all(
+            limiter.check(email="a@example.com", client_ip="1.1.1.1").allowed
+            for _ in range(10)
+        )
@@ -0,0 +1,65 @@
+from datetime import date, datetime
+from types import SimpleNamespace
+from uuid import uuid4
+
+import orjson
+
+from src.api.responses import get_adapter, serialize, success_response
+from src.schemas.plan import PlanResponse, WorkoutSessionResponse
+
+
+def make_plan(plan_id: int) -> SimpleNamespace:
+    session = SimpleNamespace(
+        id=plan_id * 10,
+        plan_id=plan_id,
+        client_id=uuid4(),
+        date=date(2024, 1, 1),
+        notes=None,
+        completed=False,
+        workout_exercises=[],
+    )
+    return SimpleNamespace(
+        id=plan_id,
+        name=f"Plan {plan_id}",
+        description=None,
+        goal="strength",
+        level="beginner",
+        duration_weeks=4,
+        coach_id=None,
+        created_at=datetime(2024, 1, 1),
+        updated_at=datetime(2024, 1, 2),
+        workout_sessions=[session],
+    )
+
+
+class TestSerialization:
+    """Unit tests for the fast SuccessResponse path."""
+
+    def test_matches_from_orm_output(self):
+        """Test that serialization equals the from_orm representation."""
+        plans = [make_plan(1), make_plan(2)]
+
+        expected = [PlanResponse.from_orm(p).model_dump(mode="json") for p in plans]
+
+        assert serialize(PlanResponse, plans) == expected
+        assert serialize(PlanResponse, plans[0]) == expected[0]
+
+    def test_adapters_are_cached_per_schema(self):
+        """Test that TypeAdapters are built once per schema."""
+        assert get_adapter(list[PlanResponse]) is get_adapter(list[PlanResponse])
+        assert get_adapter(PlanResponse) is not get_adapter(WorkoutSessionResponse)
+
+    def test_envelope(self):
+        """Test the encoded SuccessResponse envelope."""
+        response = success_response(
+            "Plans retrieved successfully",
+            data={"plans": serialize(PlanResponse, [make_plan(1)])},
+            headers={"ETag": 'W/"1"'},
+        )
+        body = orjson.loads(response.body)
+
+        assert body["status"] == "success"
+        assert body["message"] == "Plans retrieved successfully"
+        assert body["data"]["plans"][0]["workout_sessions"][0]["id"] == 10
+        assert response.headers["ETag"] == 'W/"1"'
+        assert response.media_type == "application/json"
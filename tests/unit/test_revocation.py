@@ -0,0 +1,111 @@
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from src.core.revocation import BloomFilter, RevocationList
+from src.core.security import hash_refresh_token
+from src.crud.auth import refresh_tokens
+from src.models.auth import RefreshToken
+
+
+class TestBloomFilter:
+    """Unit tests for the Bloom filter."""
+
+    def test_added_items_are_members(self):
+        """Test that the filter has no false negatives."""
+        bloom = BloomFilter(capacity=1000)
+        items = [f"jti-{i}" for i in range(1000)]
+        for item in items:
+            bloom.add(item)
+
+        assert all(item in bloom for item in items)
+
+    def test_false_positive_rate_is_bounded(self):
+        """Test that the false positive rate stays near the configured rate."""
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        for i in range(1000):
+            bloom.add(f"revoked-{i}")
+
+        false_positives = sum(f"valid-{i}" in bloom for i in range(10000))
+
+        assert false_positives < 300
+
+
+class TestRevocationList:
+    """Unit tests for the in-memory revocation list."""
+
+    def test_unknown_and_missing_jti_are_not_revoked(self):
+        """Test that unknown or missing ids are never revoked."""
+        revocations = RevocationList(capacity=100)
+
+        assert not revocations.is_revoked("abc")
+        assert not revocations.is_revoked(None)
+
+    def test_add_and_check(self):
+        """Test local revocation."""
+        revocations = RevocationList(capacity=100)
+        revocations.add("abc", datetime.utcnow() + timedelta(minutes=5))
+
+        assert revocations.is_revoked("abc")
+        assert not revocations.is_revoked("abd")
+
+    def test_load_drops_expired_entries(self):
+        """Test that a full load skips ids whose token already expired."""
+        now = datetime.utcnow()
+        revocations = RevocationList(capacity=100)
+        revocations.load(
+            [
+                ("live", now + timedelta(minutes=5)),
+                ("dead", now - timedelta(minutes=5)),
+            ],
+            synced_at=now,
+        )
+
+        assert revocations.is_revoked("live")
+        assert not revocations.is_revoked("dead")
+        assert len(revocations) == 1
+        assert revocations.last_synced_at == now
+
+    def test_merge_adds_and_prunes(self):
+        """Test incremental sync."""
+        now = datetime.utcnow()
+        revocations = RevocationList(capacity=100)
+        revocations.add("old", now - timedelta(seconds=1))
+        revocations.merge([("new", now + timedelta(minutes=5))], synced_at=now)
+
+        assert revocations.is_revoked("new")
+        assert not revocations.is_revoked("old")
+
+
+class TestRefreshTokenRotation:
+    """Unit tests for refresh token rotation."""
+
+    def test_rotate_revokes_and_links(self, sqlite_db):
+        """Test that rotation revokes the token and points to its successor."""
+        _, token = refresh_tokens.issue(sqlite_db, user_id=uuid4())
+
+        raw_token, new_token = refresh_tokens.rotate(sqlite_db, db_obj=token)
+
+        assert token.revoked_at is not None
+        assert token.replaced_by_id == new_token.id
+        assert new_token.token_hash == hash_refresh_token(raw_token)
+
+    def test_rotating_a_token_revoked_meanwhile_fails(self, sqlite_db):
+        """Test that only one of two concurrent rotations succeeds."""
+        _, token = refresh_tokens.issue(sqlite_db, user_id=uuid4())
+        # A concurrent refresh revokes the row after this one loaded it
+        sqlite_db.execute(
+            RefreshToken.__table__.update().values(revoked_at=datetime.utcnow())
+        )
+
+        assert refresh_tokens.rotate(sqlite_db, db_obj=token) is None
+        assert sqlite_db.query(RefreshToken).count() == 1
+
+
+def test_hash_refresh_token_is_stable_and_opaque():
+    """Test that refresh tokens are stored as a fixed-length digest."""
+    digest = hash_refresh_token("token-value")
+
+    assert digest == hash_refresh_token("token-value")
+    assert digest != hash_refresh_token("token-valuf")
+    assert len(digest) == 64
+    assert "token-value" not in digest
@@ -0,0 +1,112 @@
+from datetime import date
+from uuid import uuid4
+
+import pytest
+
+from src.core.cache import InMemoryCache
+from src.models.exercise import Exercise
+from src.models.plan import Plan, WorkoutExercise, WorkoutSession
+from src.services.strength import (
+    StrengthCurves,
+    estimate_one_rep_max,
+    session_bests,
+    smoothed_trend,
+)
+
+CLIENT_ID = uuid4()
+
+
+@pytest.fixture
+def db(sqlite_db):
+    sqlite_db.add_all(
+        [
+            Exercise(id=1, name="Squat"),
+            Plan(id=1, name="Strength", goal="strength", level="beginner"),
+        ]
+    )
+    sqlite_db.flush()
+    for day, weight, reps in (
+        (date(2024, 1, 1), "100kg", [5, 3]),
+        (date(2024, 1, 29), "bodyweight", [10]),
+        (date(2024, 1, 29), "120kg", [1, 20]),
+    ):
+        workout = WorkoutSession(plan_id=1, client_id=CLIENT_ID, date=day)
+        workout.workout_exercises = [
+            WorkoutExercise(
+                exercise_id=1,
+                sets_done=len(reps),
+                reps_done=reps,
+                weight_used=weight,
+            )
+        ]
+        sqlite_db.add(workout)
+    sqlite_db.commit()
+    yield sqlite_db
+
+
+class TestStrengthCurves:
+    """Unit tests for estimated one-rep max curves."""
+
+    def test_formulas(self):
+        """Test Epley and Brzycki estimates and the rep range."""
+        weights, reps = [100, 100, 100, 100], [1, 10, 0, 13]
+
+        assert estimate_one_rep_max(weights, reps) == [
+            100,
+            pytest.approx(133.33, abs=0.01),
+            None,
+            None,
+        ]
+        assert estimate_one_rep_max(weights, reps, "brzycki") == [
+            100,
+            pytest.approx(133.33, abs=0.01),
+            None,
+            None,
+        ]
+        assert estimate_one_rep_max([60], [5], "brzycki") == [
+            pytest.approx(67.5, abs=0.01)
+        ]
+        with pytest.raises(ValueError):
+            estimate_one_rep_max(weights, reps, "lombardi")
+
+    def test_session_bests_and_trend(self):
+        """Test the best estimate per day and its time-aware smoothing."""
+        days = [date(2024, 1, 1), date(2024, 1, 1), date(2024, 1, 3), date(2024, 1, 29)]
+
+        assert session_bests(days, [100, 110, None, 130]) == (
+            [date(2024, 1, 1), date(2024, 1, 29)],
+            [110, 130],
+        )
+        # 28 days is one half-life: the new value and the trend weigh the same
+        assert smoothed_trend([date(2024, 1, 1), date(2024, 1, 29)], [110, 130]) == [
+            110,
+            120,
+        ]
+
+    def test_curve_is_cached_per_client(self, db):
+        """Test the curve from history, its cache and invalidation."""
+        curves = StrengthCurves(shared=InMemoryCache())
+
+        curve = curves.get(db, CLIENT_ID, 1)
+
+        # Bodyweight sets and sets of more than 12 reps do not count
+        assert curve == {
+            "formula": "epley",
+            "dates": ["2024-01-01", "2024-01-29"],
+            "best": [116.7, 120.0],
+            "trend": [116.7, 118.3],
+            "max": 120.0,
+            "current": 118.3,
+        }
+        db.execute(
+            WorkoutExercise.__table__.update()
+            .where(WorkoutExercise.weight_used_kg.isnot(None))
+            .values(weight_used_kg=200)
+        )
+        assert curves.get(db, CLIENT_ID, 1) == curve
+        assert curves.get(db, CLIENT_ID, 1, "brzycki")["best"] == [225.0, 200.0]
+
+        curves.invalidate([uuid4()])
+        assert curves.get(db, CLIENT_ID, 1) == curve
+        curves.invalidate([CLIENT_ID])
+        assert curves.get(db, CLIENT_ID, 1)["max"] == 233.3
@@ -0,0 +1,112 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from starlette.requests import Request
+
+from src.api.conditional import is_not_modified
+from src.models.exercise import ExerciseCategory, MuscleGroup
+from src.services.taxonomy_cache import TAXONOMY_TABLES, TaxonomyCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    tables = [model.__table__ for model, _ in TAXONOMY_TABLES.values()]
+    ExerciseCategory.metadata.create_all(engine, tables=tables)
+    session = sessionmaker(bind=engine)()
+    session.add_all(
+        [
+            ExerciseCategory(name="Strength"),
+            ExerciseCategory(name="Cardio"),
+            MuscleGroup(name="Legs"),
+        ]
+    )
+    session.commit()
+    yield session
+    session.close()
+
+
+def make_request(headers: dict[str, str]) -> Request:
+    raw = [(k.lower().encode(), v.encode()) for k, v in headers.items()]
+    return Request({"type": "http", "headers": raw})
+
+
+class TestTaxonomyCache:
+    """Unit tests for the lookup-table cache."""
+
+    def test_serves_from_memory_after_first_load(self, db, monkeypatch):
+        """Test that repeat reads do not hit the database."""
+        cache = TaxonomyCache(clock=FakeClock())
+        snapshot = cache.get(db, "categories")
+
+        monkeypatch.setattr(db, "query", None)  # Any query would now fail
+        assert cache.get(db, "categories") is snapshot
+        assert [item.name for item in snapshot.page(0, 10)] == ["Strength", "Cardio"]
+        assert snapshot.total == 2
+        assert snapshot.by_id[1].name == "Strength"
+
+    def test_snapshot_is_read_only(self, db):
+        """Test that the cached maps cannot be modified."""
+        snapshot = TaxonomyCache(clock=FakeClock()).get(db, "categories")
+
+        with pytest.raises(TypeError):
+            snapshot.by_id[99] = snapshot.items[0]
+
+    def test_invalidate_reloads_and_changes_etag(self, db):
+        """Test that a write followed by invalidation is visible."""
+        cache = TaxonomyCache(clock=FakeClock())
+        before = cache.get(db, "categories")
+        db.add(ExerciseCategory(name="Mobility"))
+        db.commit()
+
+        assert cache.get(db, "categories").total == 2
+        cache.invalidate("categories")
+        after = cache.get(db, "categories")
+
+        assert after.total == 3
+        assert after.etag != before.etag
+
+    def test_ttl_expiry(self, db):
+        """Test that snapshots are reloaded after the TTL."""
+        clock = FakeClock()
+        cache = TaxonomyCache(ttl_seconds=60, clock=clock)
+        first = cache.get(db, "muscle_groups")
+
+        clock.now = 61
+        assert cache.get(db, "muscle_groups") is not first
+
+    def test_get_item_picks_up_rows_from_other_workers(self, db):
+        """Test that an id missing from the snapshot is checked in the database."""
+        cache = TaxonomyCache(clock=FakeClock())
+        cache.get(db, "muscle_groups")
+        db.add(MuscleGroup(name="Back"))
+        db.commit()
+
+        _, item = cache.get_item(db, "muscle_groups", 2)
+        _, missing = cache.get_item(db, "muscle_groups", 99)
+
+        assert item.name == "Back"
+        assert missing is None
+
+
+class TestConditionalRequests:
+    """Unit tests for ETag revalidation."""
+
+    def test_if_none_match(self):
+        """Test strong, weak, list and wildcard matches."""
+        etag = '"abc"'
+
+        assert is_not_modified(make_request({"If-None-Match": '"abc"'}), etag)
+        assert is_not_modified(make_request({"If-None-Match": 'W/"abc"'}), etag)
+        assert is_not_modified(make_request({"If-None-Match": '"x", "abc"'}), etag)
+        assert is_not_modified(make_request({"If-None-Match": "*"}), etag)
+        assert not is_not_modified(make_request({"If-None-Match": '"x"'}), etag)
+        assert not is_not_modified(make_request({}), etag)
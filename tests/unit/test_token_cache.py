@@ -0,0 +1,73 @@
+import time
+
+from src.core import security
+from src.core.security import DecodedTokenCache
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestDecodedTokenCache:
+    """Unit tests for the decoded-token memo cache."""
+
+    def test_hit_until_exp(self):
+        """Test that a payload is served until the token expires."""
+        clock = FakeClock()
+        cache = DecodedTokenCache(max_size=10, clock=clock)
+        cache.put("token", {"sub": "u", "exp": 1060})
+
+        assert cache.get("token") == {"sub": "u", "exp": 1060}
+        clock.now = 1060
+        assert cache.get("token") is None
+        assert len(cache) == 0
+
+    def test_returns_copies(self):
+        """Test that callers cannot mutate the cached payload."""
+        cache = DecodedTokenCache(max_size=10, clock=FakeClock())
+        cache.put("token", {"sub": "u", "exp": 2000})
+        cache.get("token")["sub"] = "attacker"
+
+        assert cache.get("token")["sub"] == "u"
+
+    def test_size_cap_evicts_least_recently_used(self):
+        """Test the LRU size cap."""
+        cache = DecodedTokenCache(max_size=2, clock=FakeClock())
+        cache.put("a", {"exp": 2000})
+        cache.put("b", {"exp": 2000})
+        cache.get("a")
+        cache.put("c", {"exp": 2000})
+
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert len(cache) == 2
+
+    def test_tokens_without_exp_are_not_cached(self):
+        """Test that non-expiring payloads are never memoized."""
+        cache = DecodedTokenCache(max_size=10, clock=FakeClock())
+        cache.put("token", {"sub": "u"})
+
+        assert cache.get("token") is None
+
+
+def test_verify_token_decodes_once(monkeypatch):
+    """Test that repeat tokens skip signature verification."""
+    security.token_cache.clear()
+    calls = []
+    decode = security.key_ring.decode
+
+    def counting_decode(token):
+        calls.append(token)
+        return decode(token)
+
+    monkeypatch.setattr(security.key_ring, "decode", counting_decode)
+    token = security.key_ring.sign({"sub": "u", "exp": int(time.time()) + 60})
+
+    assert security.verify_token(token)["sub"] == "u"
+    assert security.verify_token(token)["sub"] == "u"
+    assert security.verify_token("not-a-token") == {}
+    assert calls == [token, "not-a-token"]
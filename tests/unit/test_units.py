@@ -0,0 +1,76 @@
+import pytest
+
+from src.models.plan import WorkoutExercise, _update_parsed_columns, parsed_values
+from src.utils.units import parse_duration_seconds, parse_weight_kg, total_reps
+
+
+class TestParseWeight:
+    """Unit tests for weight parsing."""
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("60kg", 60),
+            ("62,5 KG", 62.5),
+            ("60", 60),
+            ("100 lbs", 45.359237),
+            ("bodyweight", None),
+            ("", None),
+            (None, None),
+        ],
+    )
+    def test_parse(self, value, expected):
+        """Test units, decimal commas and non-loads."""
+        assert parse_weight_kg(value) == pytest.approx(expected)
+
+
+class TestParseDuration:
+    """Unit tests for duration parsing."""
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("90s", 90),
+            ("2min", 120),
+            ("1m 30s", 90),
+            ("1,5 min", 90),
+            ("1:30", 90),
+            ("1:02:03", 3723),
+            ("90", 90),
+            ("30s 2", None),
+            ("2 sets", None),
+            (None, None),
+        ],
+    )
+    def test_parse(self, value, expected):
+        """Test units, clock notation and rejected text."""
+        assert parse_duration_seconds(value) == expected
+
+
+class TestParsedColumns:
+    """Unit tests for the typed copies of workout quantities."""
+
+    def test_total_reps(self):
+        """Test summing logged reps."""
+        assert total_reps([5, 5, 4]) == 14
+        assert total_reps([]) is None
+
+    def test_parsed_values_of_a_bulk_update(self):
+        """Test that only the given sources are parsed."""
+        assert parsed_values({"id": 1, "weight_used": "60kg", "reps_done": [5]}) == {
+            "weight_used_kg": 60,
+            "reps_done_total": 5,
+        }
+
+    def test_parsed_on_flush(self):
+        """Test the mapper event filling every parsed column."""
+        exercise = WorkoutExercise(
+            weight_planned="50kg", rest_between_sets="2min", reps_done=[8, 8]
+        )
+        _update_parsed_columns(WorkoutExercise.__mapper__, None, exercise)
+
+        assert (exercise.weight_planned_kg, exercise.rest_between_sets_seconds) == (
+            50,
+            120,
+        )
+        assert (exercise.weight_used_kg, exercise.reps_done_total) == (None, 16)
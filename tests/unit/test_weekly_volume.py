@@ -0,0 +1,105 @@
+from datetime import date
+from uuid import uuid4
+
+import pytest
+
+from src.crud.plan import weekly_volume, workout_exercise, workout_session
+from src.models.exercise import Exercise, MuscleGroup
+from src.models.plan import Plan, WeeklyVolume, WorkoutExercise, WorkoutSession
+from src.schemas.workout import WorkoutSetLog
+
+CLIENT_ID = uuid4()
+
+
+@pytest.fixture
+def db(sqlite_db):
+    sqlite_db.add_all(
+        [
+            MuscleGroup(id=1, name="Legs"),
+            Exercise(id=1, name="Squat", muscle_group_id=1),
+            Exercise(id=2, name="Burpee"),
+            Plan(id=1, name="Strength", goal="strength", level="beginner"),
+        ]
+    )
+    sqlite_db.flush()
+    # Monday and Sunday of one week, then the next Monday
+    for id, day in enumerate((date(2024, 1, 1), date(2024, 1, 7), date(2024, 1, 8))):
+        workout = WorkoutSession(
+            id=id + 1, plan_id=1, client_id=CLIENT_ID, date=day, completed=True
+        )
+        workout.workout_exercises = [
+            WorkoutExercise(
+                exercise_id=1, sets_done=2, reps_done=[5, 5], weight_used="100kg"
+            ),
+            WorkoutExercise(exercise_id=2, sets_done=1, reps_done=[10]),
+        ]
+        sqlite_db.add(workout)
+    sqlite_db.commit()
+    sqlite_db.expunge_all()
+    sqlite_db.info["statements"].clear()
+    yield sqlite_db
+
+
+def volumes(db):
+    db.expunge_all()
+    return [
+        (row.week_start, row.muscle_group_id, row.sets, row.reps, row.tonnage_kg)
+        for row in weekly_volume(db).get_by_client(
+            CLIENT_ID, date(2024, 1, 1), date(2024, 12, 31)
+        )
+    ]
+
+
+class TestWeeklyVolume:
+    """Unit tests for weekly training volume rollups."""
+
+    def test_rebuild_groups_by_iso_week_and_muscle_group(self, db):
+        """Test the rollup of every completed session."""
+        assert weekly_volume(db).rebuild() == 4
+
+        assert volumes(db) == [
+            (date(2024, 1, 1), 0, 2, 20, 0.0),
+            (date(2024, 1, 1), 1, 4, 20, 2000.0),
+            (date(2024, 1, 8), 0, 1, 10, 0.0),
+            (date(2024, 1, 8), 1, 2, 10, 1000.0),
+        ]
+
+    def test_logging_refreshes_only_its_week(self, db):
+        """Test the incremental refresh of a completed session's week."""
+        weekly_volume(db).rebuild()
+        db.info["statements"].clear()
+
+        workout_exercise(db).log_sets(
+            db.get(WorkoutSession, 3),
+            [
+                WorkoutSetLog(
+                    workout_exercise_id=5,
+                    set_number=3,
+                    reps_completed=5,
+                    weight_used="110kg",
+                )
+            ],
+        )
+
+        week_statements = [
+            s for s in db.info["statements"] if "weekly_volumes" in s.split("(")[0]
+        ]
+        assert [s.split()[0] for s in week_statements] == ["DELETE", "INSERT"]
+        assert volumes(db)[2:] == [
+            (date(2024, 1, 8), 0, 1, 10, 0.0),
+            (date(2024, 1, 8), 1, 3, 15, 1650.0),
+        ]
+
+    def test_uncompleting_and_deleting_sessions(self, db):
+        """Test that weeks drop sessions that no longer count."""
+        weekly_volume(db).rebuild()
+
+        workout_session(db).delete(3)
+        db.execute(WorkoutSession.__table__.update().values(completed=False))
+        workout_session(db).mark_completed(2)
+
+        assert volumes(db) == [
+            (date(2024, 1, 1), 0, 1, 10, 0.0),
+            (date(2024, 1, 1), 1, 2, 10, 1000.0),
+        ]
+        assert db.query(WeeklyVolume).count() == 2
@@ -0,0 +1,108 @@
+from datetime import date, datetime
+from uuid import uuid4
+
+import pytest
+from pydantic import ValidationError
+
+from src.crud.plan import workout_exercise
+from src.models.exercise import Exercise
+from src.models.plan import Plan, WorkoutExercise, WorkoutSession
+from src.schemas.workout import WorkoutSetLog, WorkoutSetLogBatch
+
+
+@pytest.fixture
+def db(sqlite_db):
+    squat = Exercise(name="Squat")
+    plan_obj = Plan(
+        name="Strength",
+        goal="strength",
+        level="beginner",
+        duration_weeks=4,
+        updated_at=datetime(2024, 1, 1),
+    )
+    sqlite_db.add_all([squat, plan_obj])
+    sqlite_db.flush()
+    for day in (1, 2):
+        workout = WorkoutSession(
+            plan_id=plan_obj.id, client_id=uuid4(), date=date(2024, 1, day)
+        )
+        workout.workout_exercises = [
+            WorkoutExercise(exercise_id=squat.id, sets_planned=3, reps_planned="5"),
+            WorkoutExercise(
+                exercise_id=squat.id,
+                sets_planned=3,
+                reps_planned="8",
+                sets_done=1,
+                reps_done=[8],
+                weight_used="60kg",
+            ),
+        ]
+        sqlite_db.add(workout)
+    sqlite_db.commit()
+    plan_obj.updated_at = datetime(2024, 1, 1)
+    sqlite_db.commit()
+    sqlite_db.expunge_all()
+    sqlite_db.info["statements"].clear()
+    yield sqlite_db
+
+
+def sets(*entries):
+    return [
+        WorkoutSetLog(
+            workout_exercise_id=id, set_number=number, reps_completed=reps, **extra
+        )
+        for id, number, reps, extra in entries
+    ]
+
+
+class TestLogSets:
+    """Unit tests for batched set logging."""
+
+    def test_applies_the_batch_with_bulk_statements(self, db):
+        """Test merged progress and the statements issued."""
+        workout = db.get(WorkoutSession, 1)
+        db.info["statements"].clear()
+
+        progress = workout_exercise(db).log_sets(
+            workout,
+            sets(
+                (1, 1, 5, {"weight_used": "100kg"}),
+                (1, 2, 5, {}),
+                (1, 3, 4, {}),
+                (2, 3, 7, {}),
+                (2, 2, 8, {"weight_used": "62.5kg"}),
+            ),
+        )
+
+        assert progress == [
+            {"id": 1, "sets_done": 3, "reps_done": [5, 5, 4], "weight_used": "100kg"},
+            {"id": 2, "sets_done": 3, "reps_done": [8, 8, 7], "weight_used": "62.5kg"},
+        ]
+        statements = [s.split()[0] for s in db.info["statements"]]
+        # rows, exercises, performed, progress, plan
+        assert statements == ["SELECT", "UPDATE", "SELECT", "INSERT", "UPDATE"]
+
+        db.expunge_all()
+        stored = db.get(WorkoutExercise, 2)
+        assert (stored.sets_done, stored.reps_done) == (3, [8, 8, 7])
+        assert (stored.weight_used_kg, stored.reps_done_total) == (62.5, 23)
+        assert db.get(Plan, 1).updated_at > datetime(2024, 1, 1)
+
+    def test_exercise_outside_the_session_writes_nothing(self, db):
+        """Test that the batch is all or nothing."""
+        workout = db.get(WorkoutSession, 1)
+
+        progress = workout_exercise(db).log_sets(
+            workout, sets((1, 1, 5, {}), (3, 1, 5, {}))
+        )
+
+        assert progress is None
+        db.expunge_all()
+        assert db.get(WorkoutExercise, 1).reps_done is None
+
+    def test_batch_limits(self):
+        """Test that set numbers and batch sizes are bounded."""
+        with pytest.raises(ValidationError):
+            sets((1, 101, 5, {}))
+        with pytest.raises(ValidationError):
+            WorkoutSetLogBatch(sets=[])
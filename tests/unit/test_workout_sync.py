@@ -0,0 +1,154 @@
+from datetime import date, datetime
+from uuid import uuid4
+
+import pytest
+from pydantic import TypeAdapter
+
+from src.models.exercise import Exercise
+from src.models.plan import Plan, SyncOperation, WorkoutExercise, WorkoutSession
+from src.models.user import User
+from src.schemas.workout import SyncOperationItem
+from src.services.workout_sync import sync_workouts
+
+CLIENT_ID = uuid4()
+
+
+@pytest.fixture
+def db(sqlite_db):
+    squat = Exercise(name="Squat")
+    plan_obj = Plan(
+        name="Strength",
+        goal="strength",
+        level="beginner",
+        duration_weeks=4,
+    )
+    sqlite_db.add_all([squat, plan_obj])
+    sqlite_db.flush()
+    for client_id in (CLIENT_ID, uuid4()):
+        workout = WorkoutSession(
+            plan_id=plan_obj.id, client_id=client_id, date=date(2024, 1, 1)
+        )
+        workout.workout_exercises = [
+            WorkoutExercise(exercise_id=squat.id, sets_planned=3, reps_planned="5")
+        ]
+        sqlite_db.add(workout)
+    sqlite_db.commit()
+    plan_obj.updated_at = datetime(2024, 1, 1)
+    sqlite_db.commit()
+    sqlite_db.expunge_all()
+    sqlite_db.info["statements"].clear()
+    yield sqlite_db
+
+
+def operations(*items):
+    return TypeAdapter(list[SyncOperationItem]).validate_python(list(items))
+
+
+def complete(key, session_id, **extra):
+    return {
+        "type": "complete_session",
+        "idempotency_key": key,
+        "session_id": session_id,
+        **extra,
+    }
+
+
+def log(key, exercise_id, set_number, reps):
+    return {
+        "type": "log_set",
+        "idempotency_key": key,
+        "workout_exercise_id": exercise_id,
+        "set_number": set_number,
+        "reps_completed": reps,
+    }
+
+
+class TestSyncWorkouts:
+    """Unit tests for offline workout sync."""
+
+    def test_applies_a_batch_with_bulk_statements(self, db):
+        """Test per-item results and a statement count independent of size."""
+        client = User(id=CLIENT_ID, role_id=3)
+        db.info["statements"].clear()
+
+        results = sync_workouts(
+            db,
+            client,
+            operations(
+                log("a", 1, 1, 5),
+                log("b", 1, 2, 5),
+                log("c", 1, 3, 4),
+                complete("d", 1, notes="Felt strong"),
+                complete("e", 2),  # Another client's session
+                log("f", 2, 1, 5),
+            ),
+        )
+
+        assert [(r["idempotency_key"], r["status"]) for r in results] == [
+            ("a", 200),
+            ("b", 200),
+            ("c", 200),
+            ("d", 200),
+            ("e", 404),
+            ("f", 404),
+        ]
+        assert results[2]["data"]["exercise"]["reps_done"] == [5, 5, 4]
+        statements = [s.split()[0] for s in db.info["statements"]]
+        # claim, sessions, complete, exercises, progress, performed, weeks,
+        # weekly volume (2), plans, results; nothing was loaded, so no
+        # exercise progress is upserted
+        assert statements == [
+            "INSERT",
+            "SELECT",
+            "UPDATE",
+            "SELECT",
+            "UPDATE",
+            "SELECT",
+            "SELECT",
+            "DELETE",
+            "INSERT",
+            "UPDATE",
+            "UPDATE",
+        ]
+
+        db.expunge_all()
+        workout = db.get(WorkoutSession, 1)
+        assert (workout.completed, workout.notes) == (True, "Felt strong")
+        assert db.get(WorkoutSession, 2).completed is False
+        assert db.get(WorkoutExercise, 1).reps_done == [5, 5, 4]
+        assert db.get(Plan, 1).updated_at > datetime(2024, 1, 1)
+        assert db.query(SyncOperation).count() == 6
+
+    def test_retried_batch_is_replayed(self, db):
+        """Test that keys synced before are not applied twice."""
+        client = User(id=CLIENT_ID, role_id=3)
+        batch = operations(log("a", 1, 1, 5), complete("b", 1))
+        first = sync_workouts(db, client, batch)
+        db.execute(WorkoutExercise.__table__.update().values(reps_done=[8]))
+        db.commit()
+
+        retried = sync_workouts(db, client, [*batch, *operations(log("c", 1, 2, 6))])
+
+        assert [r["replayed"] for r in retried] == [True, True, False]
+        assert retried[:2] == [{**r, "replayed": True} for r in first]
+        db.expunge_all()
+        assert db.get(WorkoutExercise, 1).reps_done == [8, 6]
+
+    def test_duplicate_and_reused_keys_in_a_batch(self, db):
+        """Test that a key is applied once and bound to its operation."""
+        client = User(id=CLIENT_ID, role_id=3)
+
+        results = sync_workouts(
+            db,
+            client,
+            operations(log("a", 1, 1, 5), log("a", 1, 1, 9), complete("a", 1)),
+        )
+
+        assert [(r["status"], r["replayed"]) for r in results] == [
+            (200, False),
+            (200, True),
+            (409, False),
+        ]
+        db.expunge_all()
+        assert db.get(WorkoutExercise, 1).reps_done == [5]
+        assert db.get(WorkoutSession, 1).completed is False